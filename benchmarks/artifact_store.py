@@ -0,0 +1,100 @@
+'''
+artifact_store.py: Artifact store lookups vs the old "newest file in the directory" scan
+
+For each history size in --sizes, in a temp dir:
+- dir scan: N JD files, load the newest one the way load_jd_from_dir did (glob + stat every file)
+- store: N JDs in an ArtifactStore, latest("jd") and get("jd", hash) (index lookups)
+- iter: stream every row of the kind, batch by batch
+
+Then --writers threads save chunks for their own run concurrently and every run's chunks are
+read back, which the single data/stored_chunks.json could not survive.
+
+    python -m benchmarks.artifact_store [--sizes 100 1000 10000] [--repeat 20]
+'''
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.docx_parser import timed
+from core.artifacts import ArtifactStore
+
+JD = "Senior Backend Engineer #{i}\nWe need Python, Kafka and PostgreSQL experience. " * 5
+
+
+def newest_from_dir(directory: Path) -> str:
+    """What load_jd_from_dir used to do on every call."""
+    newest = max(directory.glob("*.txt"), key=os.path.getmtime)
+    return newest.read_text(encoding="utf-8")
+
+
+def fill(root: Path, size: int):
+    jd_dir = root / "jd"
+    jd_dir.mkdir()
+    store = ArtifactStore(str(root / "artifacts.sqlite3"))
+    digest = None
+    for i in range(size):
+        text = JD.format(i=i)
+        path = jd_dir / f"jd_{i:06d}.txt"
+        path.write_text(text, encoding="utf-8")
+        os.utime(path, (i, i))
+        digest = store.put("jd", text)
+    return jd_dir, store, digest
+
+
+def concurrent_writers(store: ArtifactStore, writers: int, runs_each: int) -> int:
+    """Returns the number of runs whose chunks did not read back intact."""
+    def write(w):
+        for r in range(runs_each):
+            store.put("chunks", [{"focus_skill": f"skill-{w}", "claims": [f"claim {w}.{r}"]}], run_id=f"run-{w}-{r}")
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lost = 0
+    for w in range(writers):
+        for r in range(runs_each):
+            chunks = store.for_run(f"run-{w}-{r}").get("chunks")
+            lost += chunks != [{"focus_skill": f"skill-{w}", "claims": [f"claim {w}.{r}"]}]
+    return lost
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--runs-each", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'history':>8} {'dir scan ms':>12} {'latest ms':>10} {'get ms':>8} {'iter rows/s':>12}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            jd_dir, store, digest = fill(Path(tmp), size)
+            scan_s, from_dir = timed(lambda: newest_from_dir(jd_dir), args.repeat)
+            latest_s, latest = timed(lambda: store.latest("jd"), args.repeat)
+            get_s, _ = timed(lambda: store.get("jd", digest), args.repeat)
+            assert from_dir == latest, "store and directory disagree on the newest JD"
+            started = time.perf_counter()
+            rows = sum(1 for _ in store.iter("jd"))
+            iter_s = time.perf_counter() - started
+            print(f"{size:8} {scan_s * 1000:12.2f} {latest_s * 1000:10.2f} {get_s * 1000:8.2f} {rows / iter_s:12.0f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ArtifactStore(str(Path(tmp) / "artifacts.sqlite3"))
+        started = time.perf_counter()
+        lost = concurrent_writers(store, args.writers, args.runs_each)
+        seconds = time.perf_counter() - started
+    total = args.writers * args.runs_each
+    print(f"\n{args.writers} writers x {args.runs_each} runs: {total - lost}/{total} runs intact ({seconds:.1f}s)")
+    if lost:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
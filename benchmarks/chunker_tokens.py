@@ -0,0 +1,139 @@
+'''
+chunker_tokens.py: Token / latency cost of the chunker's "verbatim" vs "ids" protocol
+
+For every parsed resume in data/resumes/parsed against a JD (default data/jd/sample_role.txt):
+- input tokens: the actual prompt each protocol sends
+- output tokens: the answer each protocol would produce for the SAME evidence. Offline, each
+  skill cites --claims-per-skill lines: the ones the taxonomy matcher finds the skill in, padded
+  with experience/project lines (the chunker also cites implied evidence). "verbatim" carries a
+  one-sentence reasoning per claim, as the old prompt asks for
+- latency: tokens divided by --input-tps / --output-tps (Groq throughput for CHUNKER_MODEL)
+
+--live sends both prompts to Groq and reports real usage + wall time instead (needs CHUNKER_API_KEY).
+
+    python -m benchmarks.chunker_tokens [--jd data/jd/sample_role.txt] [--live]
+'''
+import argparse
+import json
+import time
+from pathlib import Path
+
+from config.settings import CHUNKER_MODEL
+from core.chunker.chunker import AgenticChunker
+from core.chunker.skill_extractor import JDSkillExtractor, get_skill_matcher
+
+ROOT = Path(__file__).resolve().parents[1]
+SUMMARY = "Candidate shows hands-on experience with this skill across professional work and projects."
+REASONING = "This claim directly demonstrates practical use of the skill in a real deliverable."
+
+
+def tokens(text: str) -> int:
+    """Same ~4 chars/token heuristic llm_client.estimate_tokens budgets with."""
+    return len(text) // 4
+
+
+def simulated_evidence(claim_index, skills, per_skill: int):
+    """skill -> [line IDs]: taxonomy matches first, then other experience/project lines."""
+    matcher = get_skill_matcher()
+    evidence = {skill: [] for skill in skills}
+    for line_id, claim in claim_index.claims.items():
+        found = {f.lower() for f in matcher.extract(claim["claim_text"])}
+        for skill in skills:
+            if skill.lower() in found:
+                evidence[skill].append(line_id)
+    work_lines = [line_id for line_id in claim_index.claims if not line_id.startswith("s")]
+    for i, skill in enumerate(skills):
+        padding = work_lines[i:] + work_lines[:i]
+        while len(evidence[skill]) < per_skill and padding:
+            line_id = padding.pop(0)
+            if line_id not in evidence[skill]:
+                evidence[skill].append(line_id)
+        evidence[skill] = evidence[skill][:max(per_skill, 1)]
+    return {skill: ids for skill, ids in evidence.items() if ids}
+
+
+def simulated_outputs(claim_index, evidence) -> tuple:
+    verbatim = {"chunks": [{
+        "focus_skill": skill,
+        "chunk_summary": SUMMARY,
+        "claims": [{
+            **claim_index.claims[line_id],
+            "relevance_analysis": {"score": 8, "reasoning": REASONING},
+        } for line_id in ids],
+    } for skill, ids in evidence.items()]}
+    refs = {"chunks": [{
+        "focus_skill": skill,
+        "chunk_summary": SUMMARY,
+        "claims": [{"id": line_id, "score": 8} for line_id in ids],
+    } for skill, ids in evidence.items()]}
+    return json.dumps(verbatim), json.dumps(refs)
+
+
+def live(resume, skills) -> dict:
+    from core.llm_client import chat_completion
+
+    out = {}
+    for protocol in ("verbatim", "ids"):
+        prompt, schema, _ = AgenticChunker(resume, protocol=protocol).build_request(skills)
+        started = time.perf_counter()
+        response = chat_completion(
+            model=CHUNKER_MODEL,
+            messages=[{"role": "system", "content": prompt}],
+            temperature=0,
+            response_format={"type": "json_schema", "json_schema": {
+                "name": "resume_analysis", "strict": True, "schema": schema.model_json_schema(),
+            }},
+        )
+        out[protocol] = {
+            "input": response.usage.prompt_tokens,
+            "output": response.usage.completion_tokens,
+            "seconds": time.perf_counter() - started,
+        }
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jd", default=str(ROOT / "data/jd/sample_role.txt"))
+    parser.add_argument("--resumes", default=str(ROOT / "data/resumes/parsed"))
+    parser.add_argument("--input-tps", type=float, default=4000.0, help="prompt tokens/s")
+    parser.add_argument("--output-tps", type=float, default=400.0, help="completion tokens/s")
+    parser.add_argument("--claims-per-skill", type=int, default=3, help="offline: lines cited per skill")
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    jd_text = Path(args.jd).read_text(encoding="utf-8")
+    skills = JDSkillExtractor(mode="local").extract_skills(jd_text)
+    print(f"JD skills ({len(skills)}): {skills}\n")
+
+    totals = {"verbatim": [0, 0, 0.0], "ids": [0, 0, 0.0]}
+    print(f"{'resume':32} {'protocol':9} {'in':>6} {'out':>6} {'est. s':>7}")
+    for path in sorted(Path(args.resumes).glob("*.json")):
+        resume = json.loads(path.read_text(encoding="utf-8"))
+        if args.live:
+            measured = live(resume, skills)
+        else:
+            _, _, claim_index = AgenticChunker(resume, protocol="ids").build_request(skills)
+            verbatim_out, ids_out = simulated_outputs(claim_index, simulated_evidence(claim_index, skills, args.claims_per_skill))
+            measured = {}
+            for protocol, out in (("verbatim", verbatim_out), ("ids", ids_out)):
+                prompt, _, _ = AgenticChunker(resume, protocol=protocol).build_request(skills)
+                n_in, n_out = tokens(prompt), tokens(out)
+                measured[protocol] = {
+                    "input": n_in, "output": n_out,
+                    "seconds": n_in / args.input_tps + n_out / args.output_tps,
+                }
+        for protocol, m in measured.items():
+            print(f"{path.stem[:32]:32} {protocol:9} {m['input']:6} {m['output']:6} {m['seconds']:7.2f}")
+            totals[protocol][0] += m["input"]
+            totals[protocol][1] += m["output"]
+            totals[protocol][2] += m["seconds"]
+
+    (vi, vo, vs), (ii, io, is_) = totals["verbatim"], totals["ids"]
+    print(f"\ninput tokens  {vi} -> {ii} ({1 - ii / vi:.0%} fewer)")
+    print(f"output tokens {vo} -> {io} ({1 - io / vo:.0%} fewer)" if vo else "output tokens: no evidence found")
+    print(f"{'measured' if args.live else 'estimated'} latency {vs:.1f}s -> {is_:.1f}s ({1 - is_ / vs:.0%} lower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+'''
+docket_export.py: Aggregate queries over exported dockets, Parquet (core/export.py) vs JSON scan
+
+Builds --dockets synthetic dockets (chunks, claims, 7 questions per claim, bucket + skill scores),
+exports them with DocketExporter and also writes them as one pretty-printed JSON file each (what
+we had before). Then runs the same three questions both ways and checks the answers agree:
+- which skills most often score 0
+- average gap (expected - score) per bucket
+- question count per slot level
+
+    python -m benchmarks.docket_export [--dockets 2000] [--repeat 5]
+'''
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from benchmarks.docx_parser import timed
+from core.export import DocketExporter, docket_rows, load_table
+
+SKILLS = ["Python", "Kafka", "Kubernetes", "PostgreSQL", "React", "AWS", "Go", "Terraform", "Spark", "Redis"]
+BUCKETS = {"Backend": "CORE", "Data": "CORE", "Cloud": "PREFERRED", "Frontend": "PREFERRED"}
+LEVELS = ["clarification", "base_overview", "base_dataflow", "depth_tradeoff",
+          "depth_failure", "follow_up_example", "challenge_hypothetical"]
+
+
+def synthetic_docket(rng, i: int) -> dict:
+    run_id = f"run{i:06d}"
+    chunks, questions = [], []
+    for skill in rng.sample(SKILLS, 5):
+        chunk_id = f"chunk_{skill.lower()}_{i}"
+        claims = [{
+            "claim_text": f"Built a {skill} service handling {rng.randint(10, 99)}k events per minute.",
+            "source_section": "Experience: Acme",
+            "relevance_analysis": {"score": rng.randint(4, 10), "reasoning": ""},
+        } for _ in range(3)]
+        chunks.append({"chunk_id": chunk_id, "skill_id": skill.lower(), "focus_skill": skill,
+                       "chunk_summary": f"Hands-on {skill} work.", "claims": claims})
+        questions.append({"focus_skill": skill, "results": [{
+            "claim_id": f"{chunk_id}:{idx}", "claim": c["claim_text"], "claim_type": "IMPLEMENTATION",
+            "questions": [{"level": level, "question": f"How did {skill} fit in ({level})?"} for level in LEVELS],
+            "done": True,
+        } for idx, c in enumerate(claims)]})
+    radar = {bucket: rng.choice([0.0, 2.5, 5.0, 7.5]) for bucket in BUCKETS}
+    audit = {"scores": {
+        "final_score": round(sum(radar.values()) / len(radar), 2), "core_alignment": 5.0,
+        "radar_data": radar,
+        "jd_expectations": {bucket: 7.0 for bucket in BUCKETS},
+        "bucket_schema": [{"name": b, "priority": p, "skills": [], "expected_score": 7.0} for b, p in BUCKETS.items()],
+        "detailed_scores": {skill: rng.choice([0.0, 0.0, 3.0, 6.0, 9.0]) for skill in SKILLS},
+    }, "report": "..."}
+    return {"run_id": run_id, "chunks": chunks, "questions": questions, "audit": audit}
+
+
+def queries_parquet(root: str) -> dict:
+    import pyarrow.compute as pc
+
+    skills = load_table("skill_scores", root, ["skill", "score"])
+    zero = skills.filter(pc.equal(skills["score"], 0.0)).group_by("skill").aggregate([("skill", "count")])
+    gaps = load_table("bucket_scores", root, ["bucket", "gap"]).group_by("bucket").aggregate([("gap", "mean")])
+    levels = load_table("questions", root, ["level"]).group_by("level").aggregate([("level", "count")])
+    return {
+        "zero_skills": dict(zip(zero["skill"].to_pylist(), zero["skill_count"].to_pylist())),
+        "avg_gap": {b: round(g, 6) for b, g in zip(gaps["bucket"].to_pylist(), gaps["gap_mean"].to_pylist())},
+        "per_level": dict(zip(levels["level"].to_pylist(), levels["level_count"].to_pylist())),
+    }
+
+
+def queries_json(directory: Path) -> dict:
+    zero, gaps, levels = Counter(), defaultdict(list), Counter()
+    for path in directory.glob("*.json"):
+        docket = json.loads(path.read_text(encoding="utf-8"))
+        scores = docket["audit"]["scores"]
+        zero.update(skill for skill, score in scores["detailed_scores"].items() if score == 0)
+        for bucket, score in scores["radar_data"].items():
+            gaps[bucket].append(scores["jd_expectations"][bucket] - score)
+        for group in docket["questions"]:
+            for result in group["results"]:
+                levels.update(q["level"] for q in result["questions"])
+    return {
+        "zero_skills": dict(zero),
+        "avg_gap": {b: round(sum(g) / len(g), 6) for b, g in gaps.items()},
+        "per_level": dict(levels),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dockets", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=100, help="dockets per part file")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    dockets = [synthetic_docket(rng, i) for i in range(args.dockets)]
+    with tempfile.TemporaryDirectory() as tmp:
+        parquet_root, json_dir = Path(tmp) / "exports", Path(tmp) / "json"
+        json_dir.mkdir()
+
+        started = time.perf_counter()
+        exporter = DocketExporter(str(parquet_root), batch_dockets=args.batch)
+        for d in dockets:
+            exporter.add(docket_rows(d["run_id"], d["chunks"], d["questions"], d["audit"]))
+        exporter.flush()
+        export_s = time.perf_counter() - started
+        for d in dockets:
+            (json_dir / f"{d['run_id']}.json").write_text(json.dumps(d, indent=2), encoding="utf-8")
+
+        parquet_s, from_parquet = timed(lambda: queries_parquet(str(parquet_root)), args.repeat)
+        json_s, from_json = timed(lambda: queries_json(json_dir), args.repeat)
+
+    same = from_parquet == from_json
+    print(f"{args.dockets} dockets exported in {export_s:.2f}s ({args.dockets / export_s:.0f} dockets/s)")
+    print(f"3 aggregate queries: parquet {parquet_s * 1000:.1f} ms, json scan {json_s * 1000:.1f} ms "
+          f"({json_s / parquet_s:.0f}x)")
+    print(f"top zero-score skills: {Counter(from_parquet['zero_skills']).most_common(3)}")
+    print(f"same answers: {'yes' if same else 'NO'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
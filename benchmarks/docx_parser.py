@@ -0,0 +1,106 @@
+'''
+docx_parser.py: DOCX extraction path vs the pdfplumber path
+
+Builds a .docx twin of every PDF in data/resumes/raw (same lines, bullets as numbered list
+paragraphs), then times both paths through parse_resume_to_dict from memory and checks that
+they produce the same skills / experience / projects.
+
+    python -m benchmarks.docx_parser [--repeat 5]
+'''
+import argparse
+import io
+import logging
+import sys
+import time
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from core.parser.resume_parser import RAW_DIR, extract_text_from_pdf, parse_resume_to_dict
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+_PARAGRAPH = '<w:p>{props}<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+_LIST_PROPS = '<w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr>'
+
+
+class _Upload(io.BytesIO):
+    def __init__(self, content: bytes, name: str):
+        super().__init__(content)
+        self.name = name
+
+
+def write_docx(lines) -> bytes:
+    """Minimal WordprocessingML package, one paragraph per line, bullets as list items."""
+    body = []
+    for line in lines:
+        is_bullet = line.startswith(("•", "●", "▪"))
+        text = line.lstrip("•●▪ ").strip() if is_bullet else line
+        body.append(_PARAGRAPH.format(props=_LIST_PROPS if is_bullet else "", text=escape(text)))
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(body)}</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        package.writestr("_rels/.rels", _RELS)
+        package.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def timed(fn, repeat: int) -> tuple:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def comparable(resume: dict) -> dict:
+    return {k: resume[k] for k in ("skills", "experience", "projects")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--raw", default=str(ROOT / RAW_DIR))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)  # font warnings on the sample PDFs
+
+    total_pdf = total_docx = 0.0
+    mismatches = 0
+    print(f"{'resume':32} {'pdf ms':>8} {'docx ms':>8} {'speedup':>8}  same output")
+    for path in sorted(Path(args.raw).glob("*.pdf")):
+        pdf_bytes = path.read_bytes()
+        docx_bytes = write_docx(extract_text_from_pdf(path))
+
+        pdf_s, from_pdf = timed(lambda: parse_resume_to_dict(_Upload(pdf_bytes, path.name)), args.repeat)
+        docx_s, from_docx = timed(lambda: parse_resume_to_dict(_Upload(docx_bytes, path.stem + ".docx")), args.repeat)
+        same = comparable(from_pdf) == comparable(from_docx)
+        mismatches += not same
+        total_pdf += pdf_s
+        total_docx += docx_s
+        print(f"{path.stem[:32]:32} {pdf_s * 1000:8.1f} {docx_s * 1000:8.1f} {pdf_s / docx_s:7.0f}x  {'yes' if same else 'NO'}")
+
+    if total_docx:
+        print(f"\ntotal: pdf {total_pdf * 1000:.0f} ms, docx {total_docx * 1000:.0f} ms ({total_pdf / total_docx:.0f}x faster)")
+    if mismatches:
+        print(f"{mismatches} resume(s) parsed differently from DOCX")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+'''
+hedging.py: p99 of claim generation with and without hedged requests
+
+Starts --hosts local stand-in Ollama endpoints (2) whose decode time is heavy-tailed (most requests
+are quick, a few stall), then runs the same claims through hedging.generate_hedged with
+hedging off and on and prints hedge rate, p50 and p99 for both.
+
+    python -m benchmarks.hedging [--claims 200] [--slow-share 0.05] [--hosts 2]
+'''
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LEVELS = [
+    "clarification", "base_overview", "base_dataflow", "depth_tradeoff",
+    "depth_failure", "follow_up_example", "challenge_hypothetical",
+]
+ANSWER = json.dumps([{"level": level, "question": f"Question for {level}?"} for level in LEVELS])
+
+
+def make_handler(fast: float, slow: float, slow_share: float):
+    class FakeOllama(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = b'{"models": []}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            delay = slow if random.random() < slow_share else fast
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            try:
+                pieces = [ANSWER[i:i + 40] for i in range(0, len(ANSWER), 40)]
+                for piece in pieces:
+                    time.sleep(delay / len(pieces))
+                    self.wfile.write((json.dumps({"response": piece, "done": False}) + "\n").encode())
+                    self.wfile.flush()
+                self.wfile.write((json.dumps({"response": "", "done": True}) + "\n").encode())
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # the losing attempt hung up
+            self.close_connection = True
+
+    return FakeOllama
+
+
+def start_hosts(n: int, fast: float, slow: float, slow_share: float) -> list:
+    urls = []
+    for _ in range(n):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(fast, slow, slow_share))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls.append(f"http://127.0.0.1:{server.server_address[1]}")
+    return urls
+
+
+def run(claims: int, workers: int, hedge: bool) -> dict:
+    from core.cancellation import CancelToken
+    from core.question_engine.hedging import LatencyTracker, generate_hedged
+
+    tracker = LatencyTracker()
+    token = CancelToken()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(
+            lambda i: generate_hedged(f"Built service number {i} in Python", token, tracker=tracker, hedge=hedge),
+            range(claims),
+        ))
+    return tracker.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--fast", type=float, default=0.2, help="seconds for a normal request")
+    parser.add_argument("--slow", type=float, default=3.0, help="seconds for a stalled request")
+    parser.add_argument("--slow-share", type=float, default=0.05)
+    parser.add_argument("--hosts", type=int, default=2, help="with 1 host hedges are skipped, see hedges_skipped")
+    args = parser.parse_args()
+
+    random.seed(7)
+    os.environ["OLLAMA_HOSTS"] = ",".join(start_hosts(args.hosts, args.fast, args.slow, args.slow_share))
+
+    plain = run(args.claims, args.workers, hedge=False)
+    hedged = run(args.claims, args.workers, hedge=True)
+    print(f"without hedging: {plain}")
+    print(f"with hedging:    {hedged}")
+    if plain["p99"] and hedged["p99"]:
+        print(f"p99 {plain['p99']}s -> {hedged['p99']}s ({1 - hedged['p99'] / plain['p99']:.0%} lower), "
+              f"{hedged['hedge_rate']:.1%} of claims hedged")
+
+    # a hedged claim runs two attempts but is one claim for the slot policy stats
+    from core.question_engine.logic import get_slot_stats
+
+    counted = get_slot_stats()["claims"]
+    print(f"slot policy counted {counted} claims for {2 * args.claims} generated")
+    if counted != 2 * args.claims:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+'''
+import_time.py: Guard cold-start cost with `python -X importtime`
+
+- ui.layout is what app.py imports before the first page renders. Streamlit's own import is
+  measured separately and subtracted, since we only control what we add on top.
+- core.jobs.server is what a job service worker process imports before it binds its port.
+
+Each target is imported in a fresh interpreter (best of --runs). The script fails if a heavy
+module that should load lazily shows up, or if a target goes over its budget.
+
+    python -m benchmarks.import_time [--runs 5] [--top 10]
+'''
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# target -> (baseline import subtracted from it, budget in ms on top of the baseline)
+TARGETS = {
+    "ui.layout": ("streamlit", 150),
+    "core.jobs.server": (None, 200),
+}
+
+# must not be imported until the first parse / Groq call / chart
+LAZY_MODULES = [
+    "core.pipeline_client",
+    "core.chunker.schema",
+    "groq",
+    "pdfplumber",
+    "plotly.graph_objects",
+]
+
+
+def import_profile(module: str) -> dict:
+    """module name -> cumulative import time in microseconds, for one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|", 1).split("|")]
+        profile[name] = int(cumulative_us)
+    return profile
+
+
+def best_of(module: str, runs: int) -> dict:
+    profiles = [import_profile(module) for _ in range(runs)]
+    return min(profiles, key=lambda p: p.get(module, 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per target")
+    args = parser.parse_args()
+
+    failures = []
+    for target, (baseline, budget_ms) in TARGETS.items():
+        profile = best_of(target, args.runs)
+        base_profile = best_of(baseline, args.runs) if baseline else {}
+        total_ms = profile[target] / 1000
+        base_ms = base_profile[baseline] / 1000 if baseline else 0.0
+        own_ms = total_ms - base_ms
+
+        print(f"\n{target}: {total_ms:.0f} ms total"
+              + (f", {own_ms:.0f} ms on top of {baseline}" if baseline else "")
+              + f" (budget {budget_ms} ms)")
+        for name, us in sorted(profile.items(), key=lambda kv: -kv[1])[1:args.top + 1]:
+            print(f"  {us / 1000:8.1f} ms  {name}")
+
+        # anything the baseline already imports (streamlit pulls in plotly itself) isn't ours to defer
+        eager = [m for m in LAZY_MODULES if m in profile and m not in base_profile]
+        if eager:
+            failures.append(f"{target} imports {', '.join(eager)} eagerly")
+        if own_ms > budget_ms:
+            failures.append(f"{target} takes {own_ms:.0f} ms, budget is {budget_ms} ms")
+
+    if failures:
+        print("\nFAIL")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+'''
+parser_scaling.py: How the section parsers scale with resume length and batch size
+
+Two axes, both on synthetic resumes (benchmarks/synthetic_resumes.py, mixed date formats and
+layouts, 4 wrapped bullets per entry):
+- length: one resume with --sizes experiences AND projects each (400 is ~80 pages), timing
+  split_by_sections, parse_experience, coalesce_lines and parse_projects_ai_soln on their
+  section. Each point is the best of --repeat, auto-ranged so tiny inputs still run >= 0.2 s
+- batch: --batches resumes of normal size (3 experiences, 3 projects) through the same calls,
+  back to back, like a bulk import
+
+Before timing, every generated resume is parsed once and its experience / project / claim
+counts checked against what the generator put in, so a faster-but-wrong parser fails too.
+
+Fails (exit 1) if:
+- growth: the log-log slope of time vs lines (or resumes) is above --max-exponent, i.e. the
+  cost per line grows with the input (quadratic rescans, string rebuilding, ...)
+- regression: the median cost per line (per resume for the batch) is more than --tolerance
+  times the stored baseline (benchmarks/parser_scaling_baseline.json). The baseline is machine
+  specific: re-record it with --update-baseline when moving machines or after an accepted change.
+
+    python -m benchmarks.parser_scaling [--sizes 25 50 100 200 400] [--batches 500 2000 10000]
+    python -m benchmarks.parser_scaling --update-baseline
+'''
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+
+from benchmarks.synthetic_resumes import generate_corpus, generate_resume
+from core.parser.resume_parser import coalesce_lines, parse_experience, parse_projects_ai_soln, split_by_sections
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE = ROOT / "benchmarks/parser_scaling_baseline.json"
+SHAPE = {"bullets": 4, "wrap": 100, "date_format": "mixed", "layout": "mixed"}
+
+# name -> (function, which part of the resume it is given)
+FUNCTIONS = {
+    "split_by_sections": (split_by_sections, None),
+    "parse_experience": (parse_experience, "experience"),
+    "coalesce_lines": (coalesce_lines, "projects"),
+    "parse_projects_ai_soln": (parse_projects_ai_soln, "projects"),
+}
+
+
+def parse_all(lines) -> dict:
+    sections = split_by_sections(lines)
+    experiences = parse_experience(sections.get("experience", []))
+    coalesce_lines(sections.get("projects", []))
+    projects = parse_projects_ai_soln(sections.get("projects", []))
+    return {
+        "experiences": len(experiences),
+        "projects": len(projects),
+        "project_claims": sum(len(p.claims) for p in projects),
+    }
+
+
+def per_call(fn, arg, repeat: int) -> float:
+    """Best seconds per call, looping enough calls that one measurement takes >= 0.2 s."""
+    timer = timeit.Timer(lambda: fn(arg))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def growth_exponent(xs, ys) -> float:
+    """Least-squares slope of log(y) against log(x): ~1 is linear, ~2 quadratic."""
+    lx, ly = [math.log(x) for x in xs], [math.log(y) for y in ys]
+    mx, my = statistics.fmean(lx), statistics.fmean(ly)
+    return sum((a - mx) * (b - my) for a, b in zip(lx, ly)) / sum((a - mx) ** 2 for a in lx)
+
+
+def measure_length(sizes, repeat: int) -> dict:
+    """name -> list of (lines, seconds) across the sizes."""
+    results = {name: [] for name in FUNCTIONS}
+    print(f"{'entries':>8} {'lines':>7} {'pages':>6} " + " ".join(f"{name + ' ms':>26}" for name in FUNCTIONS))
+    for size in sizes:
+        lines, expected = generate_resume(seed=size, experiences=size, projects=size, **SHAPE)
+        got = parse_all(lines)
+        if got != expected:
+            sys.exit(f"parser output wrong on the {size}-entry resume: got {got}, expected {expected}")
+        sections = split_by_sections(lines)
+        row = []
+        for name, (fn, section) in FUNCTIONS.items():
+            arg = lines if section is None else sections[section]
+            seconds = per_call(fn, arg, repeat)
+            results[name].append((len(arg), seconds))
+            row.append(f"{seconds * 1000:26.2f}")
+        print(f"{size:8} {len(lines):7} {len(lines) / 60:6.0f} " + " ".join(row))
+    return results
+
+
+def measure_batch(batches) -> list:
+    """list of (resumes, seconds) for parsing each batch back to back."""
+    results = []
+    print(f"\n{'resumes':>8} {'seconds':>8} {'us/resume':>10}")
+    for count in batches:
+        corpus = list(generate_corpus(count, seed=count, **{**SHAPE, "bullets": (2, 5)}))
+        wrong = sum(parse_all(lines) != expected for lines, expected in corpus)
+        if wrong:
+            sys.exit(f"parser output wrong on {wrong}/{count} resumes of the batch")
+        started = time.perf_counter()
+        for lines, _ in corpus:
+            parse_all(lines)
+        seconds = time.perf_counter() - started
+        results.append((count, seconds))
+        print(f"{count:8} {seconds:8.2f} {seconds / count * 1e6:10.0f}")
+    return results
+
+
+def summarize(length: dict, batch: list) -> dict:
+    summary = {}
+    for name, points in length.items():
+        summary[name] = {
+            "exponent": growth_exponent(*zip(*points)),
+            "us_per_unit": statistics.median(s / n * 1e6 for n, s in points),
+        }
+    if batch:
+        summary["batch"] = {
+            "exponent": growth_exponent(*zip(*batch)) if len(batch) > 1 else 1.0,
+            "us_per_unit": statistics.median(s / n * 1e6 for n, s in batch),
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 50, 100, 200, 400])
+    parser.add_argument("--batches", type=int, nargs="*", default=[500, 2000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-exponent", type=float, default=1.3)
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed slowdown vs the baseline")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    summary = summarize(measure_length(args.sizes, args.repeat), measure_batch(args.batches))
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"] if baseline_path.exists() else {}
+
+    failures = []
+    print(f"\n{'':24} {'exponent':>9} {'us/unit':>9} {'baseline':>9}")
+    for name, result in summary.items():
+        reference = baseline.get(name, {}).get("us_per_unit")
+        print(f"{name:24} {result['exponent']:9.2f} {result['us_per_unit']:9.2f} "
+              f"{reference if reference is not None else '-':>9}")
+        if result["exponent"] > args.max_exponent:
+            failures.append(f"{name}: grows as n^{result['exponent']:.2f} (max {args.max_exponent})")
+        if reference and not args.update_baseline and result["us_per_unit"] > reference * args.tolerance:
+            failures.append(f"{name}: {result['us_per_unit']:.2f} us/unit is "
+                            f"{result['us_per_unit'] / reference:.1f}x the baseline (max {args.tolerance}x)")
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "sizes": args.sizes,
+            "batches": args.batches,
+            "results": {name: {k: round(v, 3) for k, v in result.items()} for name, result in summary.items()},
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"\nbaseline written to {baseline_path}")
+    elif not baseline:
+        print(f"\nno baseline at {baseline_path}, run with --update-baseline to record one")
+
+    if failures:
+        print("\nSCALING FAILURES")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nscaling OK")
+
+
+if __name__ == "__main__":
+    main()
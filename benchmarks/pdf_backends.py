@@ -0,0 +1,83 @@
+'''
+pdf_backends.py: Parity + throughput of the PDF text-extraction backends
+
+For every PDF in data/resumes/raw and every installed backend (core/parser/pdf_backends.py):
+- parity: parse_resume_to_dict output (skills / experience / projects) must match pdfplumber's
+- throughput: best-of --repeat wall time, reported as resumes/s and pages/s
+
+Exits non-zero if any backend parses a resume differently from pdfplumber.
+
+    python -m benchmarks.pdf_backends [--repeat 5] [--backends pdfium pypdf]
+'''
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.docx_parser import _Upload, comparable, timed
+from core.parser.pdf_backends import PDF_BACKENDS, available_backends
+from core.parser.resume_parser import RAW_DIR, parse_resume_to_dict
+
+ROOT = Path(__file__).resolve().parents[1]
+REFERENCE = "pdfplumber"
+
+
+def diff_fields(reference: dict, other: dict) -> list:
+    return [k for k in reference if reference[k] != other[k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--raw", default=str(ROOT / RAW_DIR))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backends", nargs="*", help="default: every installed backend")
+    args = parser.parse_args()
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)  # font warnings on the sample PDFs
+
+    backends = args.backends or available_backends()
+    missing = [b for b in backends if b not in available_backends()]
+    if missing:
+        print(f"skipping {missing}: not installed (registered: {sorted(PDF_BACKENDS)})")
+        backends = [b for b in backends if b not in missing]
+    if REFERENCE not in backends:
+        backends.insert(0, REFERENCE)
+
+    import pypdfium2 as pdfium
+
+    pdfs = sorted(Path(args.raw).glob("*.pdf"))
+    pages = sum(len(pdfium.PdfDocument(str(p))) for p in pdfs)
+    totals = {backend: 0.0 for backend in backends}
+    mismatches = []
+
+    print(f"{'resume':32} " + " ".join(f"{b + ' ms':>14}" for b in backends))
+    for path in pdfs:
+        data = path.read_bytes()
+        outputs = {}
+        row = []
+        for backend in backends:
+            seconds, result = timed(lambda: parse_resume_to_dict(_Upload(data, path.name), pdf_backend=backend), args.repeat)
+            outputs[backend] = comparable(result)
+            totals[backend] += seconds
+            row.append(f"{seconds * 1000:14.1f}")
+        for backend in backends:
+            fields = diff_fields(outputs[REFERENCE], outputs[backend])
+            if fields:
+                mismatches.append(f"{path.name}: {backend} differs in {', '.join(fields)}")
+        print(f"{path.stem[:32]:32} " + " ".join(row))
+
+    print(f"\n{len(pdfs)} resumes, {pages} pages")
+    for backend in backends:
+        seconds = totals[backend]
+        print(f"  {backend:12} {len(pdfs) / seconds:8.1f} resumes/s {pages / seconds:8.1f} pages/s"
+              f"  ({totals[REFERENCE] / seconds:.1f}x vs {REFERENCE})")
+
+    if mismatches:
+        print("\nPARITY FAILURES")
+        for mismatch in mismatches:
+            print(f"  - {mismatch}")
+        sys.exit(1)
+    print("\nparity OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+'''
+prompt_prefix.py: Per-claim time to first token, old prompt layout vs fixed system prefix
+
+Needs a running Ollama with MODEL_NAME pulled (OLLAMA_HOST or --host). Streams --claims
+different claims through /api/generate one at a time, the way a generation worker does, once
+per layout:
+- inline: the old prompt, claim + claim type above the instruction block, so everything
+  after the first line differs per claim and is evaluated again every time
+- prefix: QUESTION_SYSTEM_PROMPT as the system message + the short per-claim prompt, the
+  server keeps the KV cache of the prefix and only evaluates the suffix
+Reports TTFT p50 / mean and the prompt tokens Ollama actually evaluated per claim
+(prompt_eval_count, cached tokens are not counted). --record writes them, with the model and
+Ollama version, to benchmarks/prompt_prefix_results.json for component_details.md.
+
+    python -m benchmarks.prompt_prefix [--claims 20] [--host http://localhost:11434] [--record]
+'''
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+from core.question_engine.classifier import classify_claim
+from core.question_engine.engine import build_question_prompt
+from core.question_engine.llm_utils import MODEL_NAME, OLLAMA_HOST, OLLAMA_KEEP_ALIVE
+from core.question_engine.schema import question_list_schema
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS = ROOT / "benchmarks/prompt_prefix_results.json"
+
+CLAIMS = [
+    "Built a Kafka consumer that processed {n}k billing events per minute.",
+    "Reduced p99 latency of the search API by {n}% with Redis caching.",
+    "Designed a multi-region PostgreSQL failover plan for {n} services.",
+    "Implemented a React dashboard used by {n} support agents.",
+    "Used Terraform to manage {n} AWS accounts.",
+    "Optimized Spark jobs, cutting nightly batch time by {n} minutes.",
+    "Architected an event-driven order pipeline on Kubernetes with {n} consumers.",
+]
+
+
+def inline_prompt(claim: str, claim_type: str) -> str:
+    """The layout build_question_prompt had before: per-claim values first, instructions after."""
+    return f"""
+You are a technical interviewer.
+
+CLAIM:
+{claim}
+
+CLAIM TYPE:
+{claim_type}
+
+Generate interview questions with STRICTLY DIFFERENT INTENTS.
+
+You MUST generate exactly ONE question for each slot below.
+DO NOT repeat meaning across questions.
+
+Slots and constraints:
+
+1. clarification
+- Ask to clarify scope, responsibility, or vague wording
+- DO NOT ask about design or decisions
+
+2. base_overview
+- Ask what was built and how it works at a high level
+
+3. base_dataflow
+- Ask about data flow or system components
+
+4. depth_tradeoff
+- Ask WHY design choices were made and trade-offs
+
+5. depth_failure
+- Ask about failure cases or limitations
+
+6. follow_up_example
+- Ask for a concrete real-world example
+
+7. challenge_hypothetical
+- Introduce a NEW scenario not mentioned in the claim
+
+Return output STRICTLY as JSON:
+[
+  {{ "level": "...", "question": "..." }}
+]
+"""
+
+
+def first_token(host: str, payload: dict) -> tuple:
+    """(seconds to the first response fragment, prompt tokens evaluated)."""
+    started = time.perf_counter()
+    ttft = None
+    with requests.post(f"{host}/api/generate", json=payload, stream=True, timeout=600) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if ttft is None and chunk.get("response"):
+                ttft = time.perf_counter() - started
+            if chunk.get("done"):
+                return ttft, chunk.get("prompt_eval_count", 0)
+    return ttft, 0
+
+
+def run(host: str, layout: str, claims: list) -> tuple:
+    ttfts, evaluated = [], []
+    schema = question_list_schema()
+    for claim in claims:
+        claim_type = classify_claim(claim)
+        payload = {"model": MODEL_NAME, "stream": True, "keep_alive": OLLAMA_KEEP_ALIVE, "format": schema}
+        if layout == "inline":
+            payload["prompt"] = inline_prompt(claim, claim_type)
+        else:
+            payload["system"], payload["prompt"] = build_question_prompt(claim, claim_type)
+        ttft, tokens = first_token(host, payload)
+        ttfts.append(ttft)
+        evaluated.append(tokens)
+    return ttfts, evaluated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", type=int, default=20)
+    parser.add_argument("--host", default=OLLAMA_HOST)
+    parser.add_argument("--record", action="store_true", help=f"write the results to {RESULTS.name}")
+    args = parser.parse_args()
+
+    try:
+        requests.get(f"{args.host}/api/tags", timeout=5).raise_for_status()
+    except requests.RequestException as e:
+        print(f"Ollama is not reachable at {args.host} ({e}), this benchmark needs a real server")
+        sys.exit(1)
+
+    claims = [CLAIMS[i % len(CLAIMS)].format(n=10 + i) for i in range(args.claims)]
+    # one throwaway claim per layout: model load for the first, the prefix prefill for "prefix"
+    print(f"{'layout':8} {'TTFT p50 ms':>12} {'TTFT mean ms':>13} {'prompt tokens evaluated':>24}")
+    results = {}
+    for layout in ("inline", "prefix"):
+        run(args.host, layout, ["Warm-up claim about Python services."])
+        ttfts, evaluated = run(args.host, layout, claims)
+        results[layout] = {
+            "ttft_p50_ms": round(statistics.median(ttfts) * 1000),
+            "ttft_mean_ms": round(statistics.mean(ttfts) * 1000),
+            "prompt_eval_count": round(statistics.mean(evaluated)),
+        }
+        print(f"{layout:8} {results[layout]['ttft_p50_ms']:12} {results[layout]['ttft_mean_ms']:13} "
+              f"{results[layout]['prompt_eval_count']:24}")
+    speedup = results["inline"]["ttft_p50_ms"] / max(1, results["prefix"]["ttft_p50_ms"])
+    print(f"\nper-claim TTFT {speedup:.1f}x faster with the fixed prefix")
+
+    if args.record:
+        version = requests.get(f"{args.host}/api/version", timeout=5).json().get("version")
+        RESULTS.write_text(json.dumps({
+            "model": MODEL_NAME, "ollama": version, "machine": platform.machine(),
+            "claims": args.claims, "recorded_at": time.strftime("%Y-%m-%d"), "results": results,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"recorded in {RESULTS.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+'''
+question_bank.py: Search latency of the question bank (core/retrieval/question_bank.py)
+
+Indexes --claims synthetic claim results (7 slot questions each, skills / claim types spread
+like a real docket) into a temp bank, then times --queries random searches: free text only,
+free text + skill filter, free text + all filters, and filters only. Reports p50 / p99 per
+kind and fails if a p99 is above --budget-ms.
+
+    python -m benchmarks.question_bank [--claims 15000] [--queries 300] [--budget-ms 100]
+'''
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic_resumes import FRAMEWORKS, OBJECTS, TOOLS, VERBS
+from core.question_engine.classifier import classify_claim
+from core.question_engine.hedging import percentile
+from core.retrieval.question_bank import QuestionBank
+
+SKILLS = TOOLS + FRAMEWORKS
+LEVEL_TEMPLATES = {
+    "clarification": "What exactly was your responsibility in {obj}, and what did {skill} own?",
+    "base_overview": "Walk me through how {obj} worked end to end with {skill}.",
+    "base_dataflow": "How did data move between {skill} and the rest of {obj}?",
+    "depth_tradeoff": "Why did you pick {skill} for {obj} over {other}?",
+    "depth_failure": "What happened to {obj} when {skill} was unavailable or slow?",
+    "follow_up_example": "Give a concrete incident where {skill} misbehaved in {obj}.",
+    "challenge_hypothetical": "How would {obj} change if traffic grew 100x and {other} replaced {skill}?",
+}
+
+
+def synthetic_result(rng, i: int) -> tuple:
+    skill, other, obj = rng.choice(SKILLS), rng.choice(SKILLS), rng.choice(OBJECTS)
+    claim = f"{rng.choice(VERBS)} {obj} with {skill}, run {i}."
+    questions = [
+        {"level": level, "question": template.format(skill=skill, other=other, obj=obj) + f" (#{i})"}
+        for level, template in LEVEL_TEMPLATES.items()
+    ]
+    return {"claim": claim, "claim_type": classify_claim(claim), "questions": questions, "done": True}, skill
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", type=int, default=15000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="max p99 per query kind")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = ["kafka", "latency", "failure", "pipeline", "trade", "billing", "scale", "dashboard", "redis", "model"]
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = QuestionBank(str(Path(tmp) / "bank.sqlite3"))
+        started = time.perf_counter()
+        for i in range(args.claims):
+            result, skill = synthetic_result(rng, i)
+            bank.add_result(result, skill, run_id=f"run{i // 20}")
+        index_s = time.perf_counter() - started
+        print(f"indexed {bank.count()} questions in {index_s:.1f}s ({bank.count() / index_s:.0f}/s)")
+
+        kinds = {
+            "text": lambda: {"query": " ".join(rng.sample(words, 2))},
+            "text+skill": lambda: {"query": " ".join(rng.sample(words, 2)), "skill": rng.choice(SKILLS)},
+            "text+all filters": lambda: {
+                "query": rng.choice(words), "skill": rng.choice(SKILLS), "claim_type": "IMPLEMENTATION",
+                "level": "depth_failure", "since": time.time() - 3600,
+            },
+            "filters only": lambda: {"skill": rng.choice(SKILLS), "level": "depth_tradeoff"},
+        }
+        failures = []
+        print(f"\n{'query':18} {'p50 ms':>8} {'p99 ms':>8} {'avg hits':>9}")
+        for kind, make in kinds.items():
+            latencies, hits = [], 0
+            for _ in range(args.queries):
+                kwargs = make()
+                started = time.perf_counter()
+                hits += len(bank.search(**kwargs))
+                latencies.append((time.perf_counter() - started) * 1000)
+            p50, p99 = percentile(latencies, 0.5), percentile(latencies, 0.99)
+            print(f"{kind:18} {p50:8.2f} {p99:8.2f} {hits / args.queries:9.1f}")
+            if p99 > args.budget_ms:
+                failures.append(f"{kind}: p99 {p99:.1f} ms > {args.budget_ms} ms")
+
+    if failures:
+        print("\nOVER BUDGET")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
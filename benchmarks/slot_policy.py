@@ -0,0 +1,158 @@
+'''
+slot_policy.py: What the slot policy (core/question_engine/logic.py) saves per claim
+
+Runs a fixed set of resume claims (every claim type, with and without numbers, plus a few
+vague ones) through classify_claim + select_slots and prints, per claim type, how many slots
+are asked for instead of all seven. Output tokens grow with the number of {level, question}
+objects the model has to write, so the slot share is the expected output-token saving.
+Fails if a concrete claim is treated as vague (it would lose its depth questions) or a vague
+one is not (it would get depth questions about nothing).
+
+With --host (a running Ollama with MODEL_NAME), every claim is also generated with the
+policy off and on, and the real output tokens (eval_count) and generation time are compared.
+--record (with --host) writes them to benchmarks/slot_policy_results.json for component_details.md.
+
+    python -m benchmarks.slot_policy [--host http://localhost:11434] [--record]
+'''
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from core.question_engine.classifier import classify_claim
+from core.question_engine.engine import build_question_prompt
+from core.question_engine.logic import ALL_SLOTS, get_slot_stats, looks_vague, select_slots
+from core.question_engine.schema import question_list_schema
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS = ROOT / "benchmarks/slot_policy_results.json"
+
+CONCRETE = [
+    # IMPLEMENTATION
+    "Built a Kafka consumer that processed 40k billing events per minute.",
+    "Implemented JWT authentication for a FastAPI service with 12 endpoints.",
+    "Developed a PyTorch model that flags fraudulent transactions with 93% recall.",
+    "Built an Airflow DAG that loads 200 GB of clickstream data into PostgreSQL nightly.",
+    "Trained a BERT classifier to route 5,000 support tickets a day.",
+    "Implemented role-based access control for the internal admin portal in Django.",
+    "Built a computer-assisted grading tool for teachers using OpenCV.",
+    # DESIGN
+    "Designed a multi-region PostgreSQL failover plan for 30 services.",
+    "Architected an event-driven order pipeline on Kubernetes.",
+    "Designed the REST API contract between the mobile app and the payments service.",
+    "Responsible for designing the event-driven order pipeline on Kubernetes and Kafka.",
+    # OPTIMIZATION
+    "Reduced p99 latency of the search API by 45% with Redis caching.",
+    "Optimized Spark jobs, cutting nightly batch time from 3 hours to 40 minutes.",
+    "Improved Docker image build times by 60% with multi-stage builds.",
+    "Optimized slow Elasticsearch queries by reworking the index mappings.",
+    # USAGE
+    "Used Terraform to manage 14 AWS accounts.",
+    "Used Grafana and Prometheus to monitor the checkout service.",
+    "Applied A/B testing to evaluate 3 onboarding flows.",
+    "Worked on distributed tracing with OpenTelemetry across microservices.",
+    # GENERAL
+    "Led a team of 4 engineers through a Django 4 upgrade.",
+    "Migrated 120 cron jobs to Kubernetes CronJobs.",
+    "Mentored 3 interns on Git workflows and code review.",
+    "Contributed to the open-source Celery scheduler.",
+    "Migrated the billing service from MySQL to PostgreSQL.",
+    # Title-Case bullets that name a tool
+    "Built Kafka Streaming Pipelines For Billing",
+    "Worked on AWS Cost Reporting",
+]
+VAGUE = [
+    "Worked on backend services.",
+    "Responsible for data pipelines and reporting.",
+    "Helped with the cloud migration.",
+    "Strong problem solving skills.",
+    "Involved in machine learning projects.",
+    # Title-Case bullets, capitals alone don't make them concrete
+    "Responsible for Backend Development",
+    "Contributed to Various Projects",
+    "Worked on Web Applications",
+    "Involved In Data Analysis And Reporting",
+]
+CLAIMS = CONCRETE + VAGUE
+
+
+def generate(host: str, claim: str, slots: list) -> tuple:
+    """(output tokens, seconds) for one non-streamed generation."""
+    import requests
+
+    from core.question_engine.llm_utils import MODEL_NAME, OLLAMA_KEEP_ALIVE
+
+    system, prompt = build_question_prompt(claim, classify_claim(claim), slots)
+    started = time.perf_counter()
+    response = requests.post(f"{host}/api/generate", timeout=600, json={
+        "model": MODEL_NAME, "system": system, "prompt": prompt, "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE, "format": question_list_schema(len(slots), slots),
+    })
+    response.raise_for_status()
+    body = response.json()
+    levels = [q.get("level") for q in json.loads(body.get("response") or "[]")]
+    assert levels == slots, f"asked for {slots}, got {levels}"
+    return body.get("eval_count", 0), time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", help="also generate every claim on this Ollama, policy off and on")
+    parser.add_argument("--record", action="store_true", help=f"with --host, write the results to {RESULTS.name}")
+    args = parser.parse_args()
+    if args.record and not args.host:
+        parser.error("--record needs --host, only a live run has numbers to record")
+
+    chosen = {claim: select_slots(claim, classify_claim(claim)) for claim in CLAIMS}
+    per_type = defaultdict(list)
+    for claim, slots in chosen.items():
+        per_type["VAGUE" if looks_vague(claim) else classify_claim(claim)].append(len(slots))
+
+    print(f"{'claim type':15} {'claims':>6} {'slots':>6} {'saved':>6}")
+    for claim_type, counts in sorted(per_type.items()):
+        avg = statistics.mean(counts)
+        print(f"{claim_type:15} {len(counts):6} {avg:6.1f} {1 - avg / len(ALL_SLOTS):6.0%}")
+    stats = get_slot_stats()
+    print(f"\n{stats['claims']} claims, {stats['avg_slots']} slots per claim instead of {len(ALL_SLOTS)}: "
+          f"{stats['skipped_share']:.0%} fewer slot generations (~ output tokens)")
+    false_vague = [claim for claim in CONCRETE if looks_vague(claim)]
+    missed = [claim for claim in VAGUE if not looks_vague(claim)]
+    print(f"concrete claims treated as vague: {len(false_vague)}/{len(CONCRETE)}, "
+          f"vague claims missed: {len(missed)}/{len(VAGUE)}")
+    for claim in false_vague:
+        print(f"  - {claim}")
+    for claim in missed:
+        print(f"  + {claim}")
+    if false_vague or missed:
+        sys.exit(1)
+
+    if not args.host:
+        return
+    print(f"\n{'':10} {'output tokens':>14} {'seconds':>8}")
+    totals = {}
+    for label, pick in (("all slots", lambda claim: ALL_SLOTS), ("policy", chosen.get)):
+        runs = [generate(args.host, claim, pick(claim)) for claim in CLAIMS]
+        totals[label] = {"eval_count": sum(tokens for tokens, _ in runs), "seconds": round(sum(s for _, s in runs), 1)}
+        print(f"{label:10} {totals[label]['eval_count']:14} {totals[label]['seconds']:8.1f}")
+    saved = 1 - totals["policy"]["eval_count"] / totals["all slots"]["eval_count"]
+    print(f"\noutput tokens {saved:.0%} lower with the slot policy")
+
+    if args.record:
+        import requests
+
+        from core.question_engine.llm_utils import MODEL_NAME
+
+        version = requests.get(f"{args.host}/api/version", timeout=5).json().get("version")
+        RESULTS.write_text(json.dumps({
+            "model": MODEL_NAME, "ollama": version, "machine": platform.machine(), "claims": len(CLAIMS),
+            "recorded_at": time.strftime("%Y-%m-%d"), "avg_slots": stats["avg_slots"], "results": totals,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"recorded in {RESULTS.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+'''
+synthetic_resumes.py: Seeded synthetic resumes for parser benchmarks
+
+generate_resume() builds the text lines the section parsers see (what extract_text_from_pdf
+returns), with control over:
+- sections: which ones and in what order (education / skills / experience / projects)
+- size: number of experiences / projects and bullets per entry
+- wrapping: bullets longer than `wrap` characters continue on the next line, like pdfplumber
+- dates: "month" (Dec 2022 - Present), "numeric" (07/2019 - 03/2021), "year" (2019 - 2021),
+  "full" (12/05/2021 - 03/02/2022), or "mixed"
+- experience layout: "inline" (company + dates, then "Role | tools") or "stacked"
+  (role / company / dates / "Tools: ..." on separate lines)
+
+Alongside the lines it returns what the parser should recover (entry and claim counts), so a
+benchmark can check it is timing a correct parse. write_pdf() / write_docx() turn the lines into
+files that round-trip through the extractors.
+
+    python -m benchmarks.synthetic_resumes --out /tmp/synthetic --count 20 --format pdf --check
+'''
+import argparse
+import random
+import sys
+import textwrap
+from pathlib import Path
+
+from benchmarks.docx_parser import write_docx
+
+# education first, like data/resumes/raw/test1.pdf: it is not a parsed section, so placed after
+# projects its lines are coalesced into the last project's claims
+SECTIONS = ("education", "skills", "experience", "projects")
+DATE_FORMATS = ("month", "numeric", "year", "full")
+LAYOUTS = ("inline", "stacked")
+
+SECTION_TITLES = {
+    "skills": "Technical Skills",
+    "experience": "Experience",
+    "projects": "Projects",
+    "education": "Education",
+}
+
+# Vocabulary is chosen around the parser's heuristics, not by accident: no month prefixes in
+# company names, no role keywords or 4-digit numbers in claims (both read as new entries).
+FIRST_NAMES = ["Asha", "Ravi", "Lena", "Tomas", "Priya", "Kenji", "Sara", "Omar", "Ines", "Felix"]
+LAST_NAMES = ["Rao", "Iyer", "Novak", "Berg", "Khan", "Silva", "Okafor", "Lind", "Moreau", "Tanaka"]
+COMPANIES = [
+    "Acme Systems", "Bluepeak Labs", "Cobalt Networks", "Helix Analytics", "Ironwood Software",
+    "Lumen Robotics", "Northwind Cloud", "Quartz Data", "Redshift Media", "Summit Health",
+    "Tidewater Finance", "Vertex Logistics", "Willow Energy", "Zenith Retail",
+]
+ROLES = [
+    "Software Engineer", "Backend Developer", "Data Analyst", "Technical Intern",
+    "Machine Learning Engineer", "Frontend Developer", "Platform Engineer", "Research Intern",
+]
+LANGUAGES = ["Python", "Java", "C++", "Go", "Rust", "TypeScript", "Kotlin", "SQL", "Scala"]
+FRAMEWORKS = ["React", "Django", "FastAPI", "Spring Boot", "PyTorch", "TensorFlow", "Node.js", "Flask"]
+TOOLS = ["Docker", "Kubernetes", "PostgreSQL", "Redis", "Kafka", "AWS", "Git", "Terraform", "Airflow"]
+PROJECT_NOUNS = ["Tracker", "Planner", "Assistant", "Dashboard", "Scheduler", "Indexer", "Gateway", "Visualizer"]
+PROJECT_TOPICS = ["Expense", "Course", "Fitness", "Inventory", "Recipe", "Traffic", "Library", "Weather"]
+
+VERBS = ["Developed", "Built", "Implemented", "Optimized", "Automated", "Migrated", "Led", "Reduced"]
+OBJECTS = [
+    "a streaming ingestion pipeline", "the billing service", "an internal search API",
+    "a recommendation model", "the deployment workflow", "a real-time monitoring dashboard",
+    "the authentication layer", "a batch reporting job", "the mobile checkout flow",
+]
+DETAILS = [
+    "cutting p95 latency by {n}%", "serving {n}k requests per minute", "improving accuracy by {n}%",
+    "saving {n} hours of manual work per week", "reducing cloud cost by {n}%",
+    "raising test coverage to {n}%", "handling {n} concurrent users",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _date(rng, fmt: str, year: int) -> str:
+    month, day = rng.randint(1, 12), rng.randint(1, 28)
+    if fmt == "month":
+        return f"{MONTHS[month - 1]} {year}"
+    if fmt == "numeric":
+        return f"{month:02d}/{year}"
+    if fmt == "full":
+        return f"{day:02d}/{month:02d}/{year}"
+    return str(year)
+
+
+def _duration(rng, fmt: str, index: int) -> str:
+    start = 2023 - 2 * index % 30
+    end = "Present" if index == 0 else _date(rng, fmt, start + 1)
+    return f"{_date(rng, fmt, start)} - {end}"
+
+
+def _claim(rng) -> str:
+    tool = rng.choice(TOOLS + FRAMEWORKS)
+    detail = rng.choice(DETAILS).format(n=rng.randint(10, 95))
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} with {tool}, {detail}."
+
+
+def _bullet(text: str, wrap: int) -> list[str]:
+    wrapped = textwrap.wrap(text, wrap) if wrap else [text]
+    return ["• " + wrapped[0]] + wrapped[1:]
+
+
+def _bullet_count(rng, bullets) -> int:
+    return rng.randint(*bullets) if isinstance(bullets, tuple) else bullets
+
+
+def generate_resume(
+    seed: int = 0,
+    experiences: int = 3,
+    projects: int = 3,
+    bullets=(2, 5),
+    wrap: int = 100,
+    date_format: str = "month",
+    layout: str = "inline",
+    sections=SECTIONS,
+) -> tuple[list[str], dict]:
+    """
+    One synthetic resume.
+    :param bullets: bullets per entry, an int or an inclusive (low, high) range
+    :param wrap: max characters per line before a bullet wraps, 0 disables wrapping
+    :param date_format: one of DATE_FORMATS or "mixed" (per entry)
+    :param layout: one of LAYOUTS or "mixed" (per entry)
+    :return: (lines, expected) where expected holds the counts the parser should recover
+    """
+    rng = random.Random(seed)
+    expected = {"experiences": 0, "projects": 0, "project_claims": 0}
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [name, f"Bangalore, India • +91 98450 {rng.randint(10000, 99999)} • {name.split()[0].lower()}@example.com"]
+
+    for section in sections:
+        lines.append(SECTION_TITLES[section])
+
+        if section == "skills":
+            lines.append("Languages: " + ", ".join(rng.sample(LANGUAGES, 4)))
+            lines.append("Frameworks: " + ", ".join(rng.sample(FRAMEWORKS, 3)))
+            lines.append("Tools: " + ", ".join(rng.sample(TOOLS, 4)))
+
+        elif section == "experience":
+            for i in range(experiences):
+                fmt = rng.choice(DATE_FORMATS) if date_format == "mixed" else date_format
+                style = rng.choice(LAYOUTS) if layout == "mixed" else layout
+                company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+                tools = ", ".join(rng.sample(TOOLS, 3))
+                if style == "inline":
+                    lines += [f"{company} {_duration(rng, fmt, i)}", f"{role} | {tools}"]
+                else:
+                    lines += [role, company, _duration(rng, fmt, i), f"Tools: {tools}"]
+                for _ in range(_bullet_count(rng, bullets)):
+                    lines += _bullet(_claim(rng), wrap)
+                expected["experiences"] += 1
+
+        elif section == "projects":
+            for _ in range(projects):
+                title = f"{rng.choice(PROJECT_TOPICS)} {rng.choice(PROJECT_NOUNS)}"
+                lines.append(f"{title} | " + ", ".join(rng.sample(FRAMEWORKS + TOOLS, 3)))
+                n = _bullet_count(rng, bullets)
+                for _ in range(n):
+                    lines += _bullet(_claim(rng), wrap)
+                expected["projects"] += 1
+                expected["project_claims"] += n
+
+        elif section == "education":
+            lines += ["R.V. College of Engineering 2016 - 2020", "B.E in Computer Science (CGPA : 8.9)"]
+
+    return lines, expected
+
+
+def generate_corpus(count: int, seed: int = 0, **kwargs):
+    """Yield `count` resumes with consecutive seeds; kwargs as in generate_resume."""
+    for i in range(count):
+        yield generate_resume(seed=seed + i, **kwargs)
+
+
+def _pdf_string(text: str) -> bytes:
+    raw = text.encode("cp1252", errors="replace")  # WinAnsiEncoding, "•" is 0x95
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def write_pdf(lines, lines_per_page: int = 60, font_size: float = 10) -> bytes:
+    """Minimal PDF (Helvetica, WinAnsiEncoding), one text line per line, no dependencies."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    leading = font_size * 1.25
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_refs = []
+    for page in pages:
+        ops = [b"BT", b"/F1 %g Tf" % font_size, b"%g TL" % leading, b"50 %g Td" % (800 - font_size)]
+        for line in page:
+            ops.append(_pdf_string(line) + b" Tj T*")
+        ops.append(b"ET")
+        stream = b"\n".join(ops)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_refs.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(page_refs), len(pages))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", required=True, help="directory to write the corpus to")
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=("pdf", "docx", "txt"), default="pdf")
+    parser.add_argument("--experiences", type=int, default=3)
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--bullets", type=int, nargs=2, default=(2, 5), metavar=("MIN", "MAX"))
+    parser.add_argument("--wrap", type=int, default=100)
+    parser.add_argument("--dates", choices=DATE_FORMATS + ("mixed",), default="mixed")
+    parser.add_argument("--layout", choices=LAYOUTS + ("mixed",), default="mixed")
+    parser.add_argument("--sections", nargs="*", choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument("--check", action="store_true",
+                        help="extract every written file again and compare with the generated lines")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    corpus = generate_corpus(
+        args.count, seed=args.seed, experiences=args.experiences, projects=args.projects,
+        bullets=tuple(args.bullets), wrap=args.wrap, date_format=args.dates, layout=args.layout,
+        sections=args.sections,
+    )
+    mismatches = 0
+    for i, (lines, _) in enumerate(corpus):
+        path = out / f"synthetic_{args.seed + i:05d}.{args.format}"
+        if args.format == "pdf":
+            path.write_bytes(write_pdf(lines))
+        elif args.format == "docx":
+            path.write_bytes(write_docx(lines))
+        else:
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        if args.check and args.format != "txt":
+            from core.parser.resume_parser import extract_lines
+
+            extracted, reader = extract_lines(path, path.suffix)
+            if extracted != lines:
+                mismatches += 1
+                first = next(j for j, pair in enumerate(zip(extracted + [None] * len(lines), lines)) if pair[0] != pair[1])
+                print(f"{path.name}: {reader} output differs from line {first}: {lines[first]!r}")
+
+    print(f"wrote {args.count} {args.format} resumes to {out}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
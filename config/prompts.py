@@ -19,6 +19,24 @@ def skill_extractor_prompt(jd_text: str):
 
             OUTPUT:"""
 
+def residual_skill_prompt(residual_text: str, known_skills: list):
+    return f"""TASK: Extract ADDITIONAL technical skills from what is left of a Job Description.
+
+            The following skills were already found, DO NOT repeat them:
+            {json.dumps(known_skills)}
+
+            INSTRUCTIONS:
+            - Return ONLY valid JSON array format
+            - Start with [ and end with ]
+            - Each skill name in double quotes
+            - Return [] if nothing new is mentioned
+            - NO other text before or after
+
+            INPUT:
+            {residual_text}
+
+            OUTPUT:"""
+
 def chunker_prompt(target_skills: str, resume: str):
     resume_str = json.dumps(resume, indent=2)
     
@@ -43,6 +61,29 @@ def chunker_prompt(target_skills: str, resume: str):
         Analyze deeply and return the structured analysis.
         """
 
+def chunker_ref_prompt(target_skills: str, resume_listing: str):
+    return f"""
+        You are an expert Technical Recruiter and Engineer.
+
+        TASK:
+        Analyze the provided RESUME lines against the list of TARGET SKILLS.
+        For each Target Skill, aggregate evidence from the resume.
+
+        TARGET SKILLS: {target_skills}
+
+        RESUME (one line per claim, "<id> <text>", grouped under [section] headers):
+        {resume_listing}
+
+        RULES:
+        1. Look for SEMANTIC matches. (e.g., "Scikit-learn" implies "Machine Learning").
+        2. Look for IMPLIED skills. (e.g., "API endpoints" implies "Backend").
+        3. If a claim supports multiple skills, list its id under both skills.
+        4. Cite claims ONLY by their id (e.g. "e1.2"), never copy the claim text.
+        5. Score each cited claim 1-10 for how strongly it evidences the skill.
+
+        Analyze deeply and return the structured analysis.
+        """
+
 def auditor(context: str):
     return f"""
         You are the 'Grounded Auditor' for a technical interview process.
@@ -10,3 +10,104 @@ load_dotenv()
 API_KEY = os.getenv('CHUNKER_API_KEY')
 CHUNKER_MODEL = "openai/gpt-oss-120b"
 JD_SKILL_MODEL = "llama-3.3-70b-versatile"
+# "ids": resume lines are sent with IDs and the model cites IDs + scores (core/chunker/claim_index.py)
+# "verbatim": old protocol, pretty-printed resume JSON in, claim text copied back out
+CHUNKER_PROTOCOL = os.getenv("CHUNKER_PROTOCOL", "ids")
+
+# config data for core.parser.resume_parser.py
+# PDF text extraction: "pdfplumber" (reference, slowest), "pdfium" (fast, ships with pdfplumber),
+# "pypdf" (needs `pip install pypdf`), see core/parser/pdf_backends.py
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pdfplumber")
+
+# config data for core.chunker.skill_extractor.py
+# "llm": always ask JD_SKILL_MODEL, "hybrid": taxonomy first, LLM only for leftovers,
+# "local": taxonomy only (no network call at all)
+JD_SKILL_MODE = os.getenv("JD_SKILL_MODE", "hybrid")
+# hybrid mode skips the LLM when the taxonomy explains at least this share of tech-looking terms
+JD_SKILL_COVERAGE_THRESHOLD = 0.85
+
+# config data for core.retrieval.retriever.select_claims (0 disables a limit)
+CLAIMS_MIN_RELEVANCE = 4       # drop claims the chunker scored below this (1-10)
+CLAIMS_TOP_K_PER_SKILL = 3     # best claims kept per focus skill
+CLAIMS_MAX_TOTAL = 24          # global cap on claims sent to question generation
+
+# config data for core.question_engine.logic.py (which question slots each claim gets)
+# off = every claim gets all seven slots, like before
+SLOT_POLICY_ENABLED = os.getenv("SLOT_POLICY_ENABLED", "1") == "1"
+# claim type (classifier.classify_claim) -> slots to generate, asked in schema order
+SLOT_POLICY = {
+    "IMPLEMENTATION": ["clarification", "base_overview", "base_dataflow", "depth_tradeoff",
+                       "depth_failure", "follow_up_example", "challenge_hypothetical"],
+    "DESIGN": ["base_overview", "base_dataflow", "depth_tradeoff", "depth_failure",
+               "follow_up_example", "challenge_hypothetical"],
+    "OPTIMIZATION": ["clarification", "base_overview", "depth_tradeoff", "depth_failure",
+                     "follow_up_example", "challenge_hypothetical"],
+    "USAGE": ["clarification", "base_overview", "depth_failure", "follow_up_example"],
+    "GENERAL": ["clarification", "base_overview", "depth_tradeoff", "depth_failure", "follow_up_example"],
+}
+# vague claims (logic.looks_vague) only get these: find out what they actually did first
+VAGUE_CLAIM_SLOTS = ["clarification", "base_overview", "follow_up_example"]
+VAGUE_CLAIM_MAX_WORDS = 5       # claims this short with no number or named tool count as vague
+# filler phrases (whole words) that make a claim vague, unless it has a number or names a tool
+VAGUE_CLAIM_PHRASES = [
+    "worked on", "helped with", "helped to", "involved in", "responsible for", "exposure to",
+    "familiar with", "knowledge of", "participated in", "assisted", "contributed to",
+]
+# taxonomy skills (core/chunker/taxonomy.py) that name a field, not a tool: "involved in machine
+# learning projects" is still vague, "Kafka" or "Terraform" in a claim make it concrete
+VAGUE_CLAIM_AREAS = [
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "LLMs", "System Design",
+    "Distributed Systems", "Microservices", "Data Structures", "Algorithms", "Object-Oriented Programming",
+    "Agile", "Application Security", "Blockchain",
+]
+
+# config data for core.llm_client.py
+# "groq": chunker / skill extractor / bucketing / auditor call Groq (needs WAN + CHUNKER_API_KEY)
+# "ollama": the same stages run on the local Ollama hosts with JSON-schema constrained output
+LLM_BACKEND = os.getenv("LLM_BACKEND", "groq")
+LOCAL_LLM_MODEL = os.getenv("LOCAL_LLM_MODEL", "qwen2.5:latest")  # model for those stages when LLM_BACKEND="ollama"
+
+# config data for core.llm_client.py (shared Groq client + rate limiting)
+# per-model limits from the Groq console, requests/min and tokens/min
+GROQ_RATE_LIMITS = {
+    CHUNKER_MODEL: {"rpm": 30, "tpm": 8000},
+    JD_SKILL_MODEL: {"rpm": 30, "tpm": 12000},
+}
+GROQ_DEFAULT_RATE_LIMIT = {"rpm": 30, "tpm": 6000}
+GROQ_MAX_RETRIES = 5            # 429 / 5xx retries per request
+GROQ_MAX_CONNECTIONS = 20       # keep-alive pool size for the shared HTTP client
+GROQ_TIMEOUT = 120              # seconds
+
+# config data for core.jobs (background job service)
+# empty JOB_SERVICE_URL = run the pipeline inside the Streamlit script like before
+JOB_SERVICE_URL = os.getenv("JOB_SERVICE_URL", "")
+JOB_SERVICE_HOST = os.getenv("JOB_SERVICE_HOST", "127.0.0.1")
+JOB_SERVICE_PORT = int(os.getenv("JOB_SERVICE_PORT", "8765"))
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", "data/jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+# config data for core.checkpoint.py (append-only run checkpoints, one .jsonl per run)
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "data/runs")
+
+# config data for core.artifacts.py (JDs, parsed resumes, chunks, questions, audits)
+ARTIFACT_DB_PATH = os.getenv("ARTIFACT_DB_PATH", "data/artifacts.sqlite3")
+
+# config data for core.retrieval.question_bank.py (BM25 search over every generated question)
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", "data/question_bank.sqlite3")
+
+# config data for core.export.py (Parquet tables for analytics across dockets, needs pyarrow)
+EXPORT_ENABLED = os.getenv("EXPORT_ENABLED", "0") == "1"   # export every finished docket
+EXPORT_DIR = os.getenv("EXPORT_DIR", "data/exports")
+EXPORT_BATCH_DOCKETS = int(os.getenv("EXPORT_BATCH_DOCKETS", "10"))  # dockets per part file
+
+# config data for core.question_engine.hedging.py (tail-latency hedging of claim generation)
+# a hedge is only sent when another healthy Ollama host exists, single-host setups never hedge
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "1") == "1"
+HEDGE_PERCENTILE = 0.9          # a claim slower than this share of recent claims gets a duplicate request
+HEDGE_MIN_SAMPLES = 5           # observed claims needed before the percentile is trusted
+HEDGE_WINDOW = 200              # recent claim latencies kept
+CLAIM_DEADLINE = 240            # seconds, a claim still unanswered after this is given up
+
+# config data for core.precompute.py (work started before Generate is clicked)
+PRECOMPUTE_ENABLED = os.getenv("PRECOMPUTE_ENABLED", "1") == "1"
+JD_DEBOUNCE_SECONDS = 2.0       # JD must stay unchanged this long before we analyse it
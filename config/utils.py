@@ -18,24 +18,20 @@ def load_jd(jd_text: str) -> str:
     return jd_text.strip()
 
 
-def load_jd_from_dir(jd_path: str = None) -> str:
+def load_latest_jd(jd_path: str = None) -> str:
     """
-    Load Job Description text from file.
+    Load Job Description text: from jd_path if given, else the JD saved most recently
+    (ui.components.save_jd, core/artifacts.py). Falls back to data/jd/*.txt while the
+    store has no JD yet.
     """
     if jd_path is None:
-        # Default to data/jd directory, get most recent file
-        jd_dir = Path("data/jd")
-        if not jd_dir.exists():
-            raise FileNotFoundError(f"JD directory not found: {jd_dir}")
-        
-        # Get all .txt files in the directory
-        jd_files = list(jd_dir.glob("*.txt"))
-        if not jd_files:
-            raise FileNotFoundError(f"No .txt files found in {jd_dir}")
-        
-        # Get the most recently modified file
-        jd_path = max(jd_files, key=os.path.getmtime)
-    
+        from core.artifacts import get_artifact_store
+
+        jd = get_artifact_store().latest("jd")
+        if jd is not None:
+            return jd
+        jd_path = _newest_file(Path("data/jd"), "*.txt")
+
     jd_path = Path(jd_path)
     if not jd_path.exists():
         raise FileNotFoundError(f"JD file not found: {jd_path}")
@@ -46,25 +42,30 @@ def load_jd_from_dir(jd_path: str = None) -> str:
 
 def load_parsed_resume(resume_path: str = None) -> dict:
     """
-    Load parsed resume JSON from data/resumes/parsed/.
+    Load a parsed resume: from resume_path if given, else the resume parsed most recently
+    (core/artifacts.py). Falls back to data/resumes/parsed/*.json while the store has none.
     """
     if resume_path is None:
-        # Default to data/resumes/parsed directory, get most recent file
-        resume_dir = Path("data/resumes/parsed")
-        if not resume_dir.exists():
-            raise FileNotFoundError(f"Resume directory not found: {resume_dir}")
-        
-        # Get all .json files in the directory
-        resume_files = list(resume_dir.glob("*.json"))
-        if not resume_files:
-            raise FileNotFoundError(f"No .json files found in {resume_dir}")
-        
-        # Get the most recently modified file
-        resume_path = max(resume_files, key=os.path.getmtime)
-    
+        from core.artifacts import get_artifact_store
+
+        resume = get_artifact_store().latest("resume")
+        if resume is not None:
+            return resume
+        resume_path = _newest_file(Path("data/resumes/parsed"), "*.json")
+
     resume_path = Path(resume_path)
     if not resume_path.exists():
         raise FileNotFoundError(f"Resume file not found: {resume_path}")
     
     with open(resume_path, 'r', encoding='utf-8') as f:
         return json.load(f)
+
+
+def _newest_file(directory: Path, pattern: str) -> Path:
+    """Most recently modified file, only used for data from before the artifact store."""
+    if not directory.exists():
+        raise FileNotFoundError(f"Directory not found: {directory}")
+    files = list(directory.glob(pattern))
+    if not files:
+        raise FileNotFoundError(f"No {pattern} files found in {directory}")
+    return max(files, key=os.path.getmtime)
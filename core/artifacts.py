@@ -0,0 +1,159 @@
+'''
+artifacts.py: Indexed store for run artifacts (SQLite)
+- JDs, parsed resumes, chunks, questions and audits, one row each, keyed by
+  (kind, content hash, run ID): saving the same content twice only bumps its timestamp
+- "latest JD / resume" and "everything for run X" are index lookups, not directory scans
+- every write is a single transaction, concurrent sessions and job workers never clobber
+  each other's artifacts (the old data/stored_chunks.json was overwritten by every run)
+- iter() pages through a kind by row ID, so reading a long history never loads it all
+'''
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from config import settings
+
+KINDS = ("jd", "resume", "chunks", "questions", "audit")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    run_id TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    UNIQUE (kind, content_hash, run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_kind_created ON artifacts(kind, created_at);
+-- rows of a kind in id order, for iter()'s keyset pagination
+CREATE INDEX IF NOT EXISTS idx_artifacts_kind ON artifacts(kind);
+CREATE INDEX IF NOT EXISTS idx_artifacts_run ON artifacts(run_id, kind);
+"""
+
+
+def _default(obj):
+    # audit scores carry pydantic BucketItems
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def content_hash(kind: str, data) -> str:
+    """Same content -> same hash. A resume's metadata (parse timestamp) is left out, like RunCheckpoint.run_id_for."""
+    if kind == "resume" and isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k != "metadata"}
+    if isinstance(data, str):
+        blob = data.strip()
+    else:
+        blob = json.dumps(data, sort_keys=True, default=_default)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ArtifactStore:
+    def __init__(self, db_path: str = settings.ARTIFACT_DB_PATH):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # one short-lived connection per operation, same as core/jobs/store.py
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def put(self, kind: str, data, run_id: str = "") -> str:
+        """Store an artifact, returns its content hash."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown artifact kind '{kind}', expected one of {KINDS}")
+        digest = content_hash(kind, data)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO artifacts (kind, content_hash, run_id, data, created_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, content_hash, run_id) DO UPDATE SET data = excluded.data, created_at = excluded.created_at",
+                (kind, digest, run_id or "", json.dumps(data, default=_default), time.time()),
+            )
+        return digest
+
+    def get(self, kind: str, digest: str, run_id: str = None):
+        """The artifact with this content hash (most recent one if run_id is None), or None."""
+        # MAX() picks the row (SQLite returns the bare column of the max row) and keeps the
+        # planner on the (kind, content_hash, run_id) index, ORDER BY would tempt it to scan the kind
+        query = "SELECT data, MAX(created_at) FROM artifacts WHERE kind = ? AND content_hash = ?"
+        params = [kind, digest]
+        if run_id is not None:
+            query += " AND run_id = ?"
+            params.append(run_id)
+        with self._connect() as conn:
+            row = conn.execute(query, params).fetchone()
+        return json.loads(row["data"]) if row["data"] is not None else None
+
+    def latest(self, kind: str):
+        """Most recently saved artifact of a kind, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM artifacts WHERE kind = ? ORDER BY created_at DESC, id DESC LIMIT 1", (kind,)
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def for_run(self, run_id: str) -> dict:
+        """kind -> latest artifact of that kind saved for the run."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT kind, data FROM artifacts WHERE run_id = ? ORDER BY created_at", (run_id,)
+            ).fetchall()
+        return {row["kind"]: json.loads(row["data"]) for row in rows}
+
+    def iter(self, kind: str, run_id: str = None, batch_size: int = 200):
+        """
+        Yield {"content_hash", "run_id", "created_at", "data"} for every artifact of a kind,
+        oldest first, fetching batch_size rows per query.
+        """
+        after = 0
+        while True:
+            query = "SELECT id, content_hash, run_id, data, created_at FROM artifacts WHERE kind = ? AND id > ?"
+            params = [kind, after]
+            if run_id is not None:
+                query += " AND run_id = ?"
+                params.append(run_id)
+            with self._connect() as conn:
+                rows = conn.execute(query + " ORDER BY id LIMIT ?", params + [batch_size]).fetchall()
+            for row in rows:
+                yield {
+                    "content_hash": row["content_hash"],
+                    "run_id": row["run_id"],
+                    "created_at": row["created_at"],
+                    "data": json.loads(row["data"]),
+                }
+            if len(rows) < batch_size:
+                return
+            after = rows[-1]["id"]
+
+    def count(self, kind: str = None) -> int:
+        with self._connect() as conn:
+            if kind is None:
+                return conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM artifacts WHERE kind = ?", (kind,)).fetchone()[0]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Process-wide ArtifactStore (the schema is created once, connections are per call)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore()
+        return _store
@@ -1,7 +1,7 @@
 import json
 from core.question_engine.llm_utils import call_llm
 from config.prompts import auditor
-from groq import Groq
+from core.llm_client import chat_completion
 from config import settings
 
 class Auditor:
@@ -13,7 +13,6 @@ class Auditor:
         self.radar_data = scores.get("radar_data", {})
         self.jd_expectations = scores.get("jd_expectations", {})
         self.evidence_context = scores.get("evidence_context", {})
-        self.client=Groq(api_key=settings.API_KEY)
         self.bucket_schema = scores.get("bucket_schema", [])
         self.detailed_scores = scores.get("detailed_scores", {})
 
@@ -89,18 +88,19 @@ class Auditor:
         
         return "\n".join(lines)
 
-    def generate_closure(self):
+    def generate_closure(self, cancel_token=None):
         """
         Generates the 'Ethical Gap Analysis' using the LLM.
         """
         context = self._format_score_context()
         
         prompt = auditor(context)
-        response = self.client.chat.completions.create(
+        response = chat_completion(
             model=settings.JD_SKILL_MODEL,
             messages=[
                 {"role": "system", "content": prompt},
             ],
-            temperature=0
+            temperature=0,
+            cancel_token=cancel_token
         )
         return response.choices[0].message.content
@@ -1,10 +1,44 @@
 import re
 import json
 from core.audit.schema import Buckets
+from core.chunker.skill_index import skill_id
 from config import settings
 from config.utils import load_jd
 from config.prompts import jd_bucketing
-from groq import Groq
+from core.llm_client import chat_completion
+
+def bucket_jd_skills(jd_text, jd_skills, cancel_token=None):
+    """
+    Group JD skills into CORE/PREFERRED buckets via LLM.
+    Module-level so the pipeline can bucket before generation (claim priority) and hand
+    the result to Scorer instead of paying for the same call twice.
+    """
+    prompt = jd_bucketing(jd_text, [s.lower() for s in jd_skills])
+
+    response = chat_completion(
+        model=settings.CHUNKER_MODEL,
+        messages=[
+            {"role": "system", "content": prompt},
+        ],
+        temperature=0,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": "resume_analysis",
+                "strict": True,
+                "schema": Buckets.model_json_schema()
+            }
+        },
+        cancel_token=cancel_token
+    )
+
+    # Parse the raw JSON string
+    raw_content = json.loads(response.choices[0].message.content)
+
+    # Validate it against your Pydantic model to ensure priority is CORE/PREFERRED
+    validated_data = Buckets.model_validate(raw_content)
+    return validated_data.buckets
+
 
 class Scorer:
     """
@@ -15,62 +49,48 @@ class Scorer:
     """
     
 
-    def __init__(self, chunks, jd_skills, jd_text):
+    def __init__(self, chunks, jd_skills, jd_text, cancel_token=None, bucket_schema=None):
         """
         :param chunks: List of chunk objects from AgenticChunker
         :param jd_skills: List of skills extracted from JD
+        :param cancel_token: optional CancelToken, abandons the bucketing call if the run is cancelled
+        :param bucket_schema: optional buckets from bucket_jd_skills(), skips the bucketing call
         """
         self.chunks = chunks
+        self.cancel_token = cancel_token
         self.jd=load_jd(jd_text)
-        self.client = Groq(api_key=settings.API_KEY)
         self.jd_skills = [s.lower() for s in jd_skills]
         self.skill_map = self._map_chunks_to_skills()
-        self._get_bucket(None)  # Initialize bucket schema from JD skills
+        if bucket_schema is not None:
+            self.bucket_schema = bucket_schema
+        else:
+            self._get_bucket(None)  # Initialize bucket schema from JD skills
 
     def _map_chunks_to_skills(self):
-        """Maps skill names to their chunks for easy access."""
+        """Maps canonical skill IDs to their chunks, merging chunks that spell the same skill differently."""
         mapping = {}
         for chunk in self.chunks:
-            skill = chunk.get('focus_skill', '').lower()
-            if skill:
-                 mapping[skill] = chunk
+            sid = chunk.get('skill_id') or skill_id(chunk.get('focus_skill', ''))
+            if not sid:
+                continue
+            if sid in mapping:
+                merged = dict(mapping[sid])
+                merged['claims'] = mapping[sid].get('claims', []) + chunk.get('claims', [])
+                mapping[sid] = merged
+            else:
+                mapping[sid] = chunk
         return mapping
 
     def _get_bucket(self, skill=None):
         """Initialize buckets from JD skills via LLM (skill param unused, kept for API compat)."""
-        prompt = jd_bucketing(self.jd, self.jd_skills) 
-        
-        response = self.client.chat.completions.create(
-            model=settings.CHUNKER_MODEL,
-            messages=[
-                {"role": "system", "content": prompt},
-            ],
-            temperature=0,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "resume_analysis",
-                    "strict": True,
-                    "schema": Buckets.model_json_schema()
-                }
-            }
-        )
-        
-        # Parse the raw JSON string
-        raw_content = json.loads(response.choices[0].message.content)
-        
-        # Validate it against your Pydantic model to ensure priority is CORE/PREFERRED
-        validated_data = Buckets.model_validate(raw_content)
-        
-        # Assign the list of bucket items to self.bucket_schema
-        self.bucket_schema = validated_data.buckets
+        self.bucket_schema = bucket_jd_skills(self.jd, self.jd_skills, cancel_token=self.cancel_token)
 
     def calculate_atomic_score(self, skill_name):
         """
         Step 1: Atomic Score based on Evidence Density.
         Formula: min(1.0, (claim_count * 0.3) + (0.2 if implementation_evidence))
         """
-        chunk = self.skill_map.get(skill_name)
+        chunk = self.skill_map.get(skill_id(skill_name))
         if not chunk or not chunk.get('claims'):
             return 0.0, []
         
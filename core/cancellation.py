@@ -0,0 +1,97 @@
+'''
+cancellation.py: Cooperative cancellation for docket runs
+- one CancelToken per run, threaded from the UI/job service down to every LLM call
+- queued claims are dropped, Ollama streams are closed (which aborts decoding server-side),
+  Groq calls are abandoned and their result discarded
+- CANCEL_STATS counts the work that never had to happen
+'''
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a run once its token is cancelled."""
+
+
+CANCEL_STATS = {"runs_cancelled": 0, "claims_dropped": 0, "ollama_aborted": 0, "groq_abandoned": 0}
+_stats_lock = threading.Lock()
+
+
+def count_cancelled(kind: str, n: int = 1):
+    with _stats_lock:
+        CANCEL_STATS[kind] += n
+
+
+def get_cancel_stats() -> dict:
+    with _stats_lock:
+        return dict(CANCEL_STATS)
+
+
+class CancelToken:
+    def __init__(self, counted: bool = True):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._counted = counted
+        self._detach = lambda: None
+        self.reason = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled"):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        if self._counted:
+            count_cancelled("runs_cancelled")
+            print(f"✋ Run cancelled: {reason}")
+        for cb in callbacks:
+            try:
+                cb()
+            except Exception:
+                pass
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise Cancelled(self.reason)
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._event.wait(timeout)
+
+    def on_cancel(self, callback):
+        """Run `callback` on cancel (immediately if already cancelled). Returns an unregister function."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def child(self) -> "CancelToken":
+        """
+        Token for one piece of a run (e.g. one attempt of a hedged claim).
+        Cancelled together with this token, but can also be cancelled on its own
+        without touching the run. Call detach() once the piece is finished.
+        """
+        token = CancelToken(counted=False)
+        token._detach = self.on_cancel(lambda: token.cancel(self.reason))
+        return token
+
+    def detach(self):
+        """Stop following the parent token (no-op for top-level tokens)."""
+        self._detach()
+
+    def _remove(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def check(token):
+    """raise_if_cancelled that tolerates token=None, so callers don't need to branch."""
+    if token is not None:
+        token.raise_if_cancelled()
@@ -0,0 +1,110 @@
+'''
+checkpoint.py: Append-only on-disk checkpoints for docket runs
+- a run's ID is a hash of its inputs (resume content, JD, models, selection settings,
+  question prompt + slot policy), so restarting with the same inputs finds the same checkpoint
+  and changing how questions are generated starts a new one
+- discard() throws a run's checkpoint away, to generate it again from scratch
+- completed stages (skills, chunks, buckets) and every finished claim are appended as
+  one JSON line each and fsync'd, a crash loses at most the line being written
+'''
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from config import settings
+from core.question_engine.llm_utils import MODEL_NAME
+from core.question_engine.templates import QUESTION_SYSTEM_PROMPT, question_user_prompt
+
+
+class RunCheckpoint:
+    def __init__(self, run_id: str, root: str = settings.CHECKPOINT_DIR):
+        self.run_id = run_id
+        self.path = Path(root) / f"{run_id}.jsonl"
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.claims = {}
+        self._torn_tail = False
+        self._load()
+
+    @staticmethod
+    def run_id_for(resume_json: dict, jd_text: str) -> str:
+        """
+        Same inputs -> same run ID. Only the resume's content counts: its resume_id and
+        metadata (parse timestamp, upload name) change on every upload of the same file.
+        """
+        resume = {k: v for k, v in (resume_json or {}).items() if k not in ("resume_id", "metadata")}
+        blob = json.dumps({
+            "resume": resume,
+            "jd": jd_text.strip(),
+            "models": [settings.CHUNKER_MODEL, settings.JD_SKILL_MODEL, MODEL_NAME],
+            "chunker": settings.CHUNKER_PROTOCOL,
+            "backend": [settings.LLM_BACKEND, settings.LOCAL_LLM_MODEL if settings.LLM_BACKEND == "ollama" else None],
+            "selection": [settings.CLAIMS_MIN_RELEVANCE, settings.CLAIMS_TOP_K_PER_SKILL, settings.CLAIMS_MAX_TOTAL],
+            # finished claims replay from the checkpoint, so a new prompt or slot policy needs a new run
+            "prompt": [QUESTION_SYSTEM_PROMPT, question_user_prompt("{claim}", "{claim_type}", ["{slots}"])],
+            "slot_policy": [
+                settings.SLOT_POLICY_ENABLED, settings.SLOT_POLICY, settings.VAGUE_CLAIM_SLOTS,
+                settings.VAGUE_CLAIM_MAX_WORDS, settings.VAGUE_CLAIM_PHRASES,
+            ],
+        }, sort_keys=True)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                self._torn_tail = not line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line from a crash mid-write
+                if record.get("type") == "stage":
+                    self.stages[record["name"]] = record["data"]
+                elif record.get("type") == "claim":
+                    self.claims[record["claim_id"]] = record
+        if self.stages or self.claims:
+            print(f"↻ Checkpoint {self.run_id}: {len(self.stages)} stage(s), {len(self.claims)} claim(s) done")
+
+    def _append(self, record: dict):
+        record["at"] = time.time()
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            if self._torn_tail:
+                # don't glue the new record onto a half-written one
+                line = "\n" + line
+                self._torn_tail = False
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def discard(self):
+        """Forget every stage and claim of this run, on disk too. The next run starts from scratch."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self.stages.clear()
+            self.claims.clear()
+            self._torn_tail = False
+
+    def stage(self, name: str):
+        return self.stages.get(name)
+
+    def save_stage(self, name: str, data):
+        self.stages[name] = data
+        self._append({"type": "stage", "name": name, "data": data})
+
+    def save_claim(self, claim_id: str, chunk_id: str, skill: str, result: dict):
+        if claim_id in self.claims:
+            return
+        record = {"type": "claim", "claim_id": claim_id, "chunk_id": chunk_id, "skill": skill, "result": result}
+        self.claims[claim_id] = record
+        self._append(dict(record))
+
+    def completed_results(self) -> dict:
+        """claim_id -> final result, for the generator to skip."""
+        return {claim_id: r["result"] for claim_id, r in self.claims.items()}
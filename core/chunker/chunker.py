@@ -5,24 +5,26 @@ chunker.py: Contains the AgenticChunking class, which chunks resume data based o
 import json
 import uuid
 from typing import List, Dict, Any
-from groq import Groq
-from core.chunker.schema import ResumeAnalysis
-from config.settings import API_KEY, CHUNKER_MODEL
-from config.prompts import chunker_prompt
-from config.utils import load_jd, load_jd_from_dir, load_parsed_resume
+from core.chunker.schema import ResumeAnalysis, ResumeAnalysisRefs
+from core.chunker.claim_index import ClaimIndex
+from config.settings import CHUNKER_MODEL, CHUNKER_PROTOCOL
+from config.prompts import chunker_prompt, chunker_ref_prompt
+from config.utils import load_jd, load_latest_jd, load_parsed_resume
+from core.artifacts import get_artifact_store
 from core.chunker.skill_extractor import JDSkillExtractor
+from core.chunker.skill_index import skill_id
+from core.llm_client import chat_completion
 
 
-def store_chunks_to_json(chunks: list, output_path: str = "data/stored_chunks.json"):
-    """Store unstripped chunks to JSON for traceability"""
-    with open(output_path, 'w') as f:
-        json.dump(chunks, f, indent=2)
-    print(f"✓ Chunks stored to {output_path}")
+def store_chunks(chunks: list, run_id: str = ""):
+    """Store unstripped chunks in the artifact store (core/artifacts.py) for traceability"""
+    digest = get_artifact_store().put("chunks", chunks, run_id=run_id)
+    print(f"✓ Chunks stored as {digest[:12]}" + (f" for run {run_id}" if run_id else ""))
 
 class AgenticChunker:
-    def __init__(self, resume_parsed=Dict[str, Any]):
+    def __init__(self, resume_parsed=Dict[str, Any], protocol: str = CHUNKER_PROTOCOL):
         self.resume=resume_parsed
-        self.client=Groq(api_key=API_KEY)
+        self.protocol=protocol
     
     def _generate_chunk_id(self, skill: str) -> str:
         """ 
@@ -33,7 +35,17 @@ class AgenticChunker:
         return f"chunk_{clean_skill}_{unique_suffix}"
     
 
-    def chunk_by_skills(self, jd_text: str = None):
+    def build_request(self, target_skills):
+        """
+        (prompt, response schema, ClaimIndex or None) for the configured protocol.
+        "ids": the model cites resume lines by ID and the claims are rehydrated from the index.
+        """
+        if self.protocol == "ids":
+            claim_index = ClaimIndex(self.resume)
+            return chunker_ref_prompt(target_skills, claim_index.render()), ResumeAnalysisRefs, claim_index
+        return chunker_prompt(target_skills, self.resume), ResumeAnalysis, None
+
+    def chunk_by_skills(self, jd_text: str = None, cancel_token=None, target_skills=None, run_id: str = ""):
         resume=self.resume
 
         if jd_text:
@@ -44,12 +56,14 @@ class AgenticChunker:
                 jd=load_jd()
             except:
                 # fallback, read the saved text file
-                jd=load_jd_from_dir()
+                jd=load_latest_jd()
         
-        target_skills=JDSkillExtractor().extract_skills(jd)
-        prompt=chunker_prompt(target_skills, resume)
+        if target_skills is None:
+            target_skills=JDSkillExtractor().extract_skills(jd, cancel_token=cancel_token)
+
+        prompt, schema, claim_index = self.build_request(target_skills)
 
-        response = self.client.chat.completions.create(
+        response = chat_completion(
             model=CHUNKER_MODEL,
             messages=[
                 {"role": "system", "content": prompt},
@@ -60,25 +74,31 @@ class AgenticChunker:
                 "json_schema": {
                     "name": "resume_analysis",
                     "strict": True,
-                    "schema": ResumeAnalysis.model_json_schema()
+                    "schema": schema.model_json_schema()
                 }
-            }
+            },
+            cancel_token=cancel_token
         )
 
         try:
             # Parse response into Pydantic Model
             content = json.loads(response.choices[0].message.content)
-            analysis = ResumeAnalysis.model_validate(content)
+            analysis = schema.model_validate(content)
             
             # Convert to list of dicts to add metadata
             response_json = [chunk.model_dump() for chunk in analysis.chunks]
+            if claim_index is not None:
+                response_json, unknown = claim_index.rehydrate(response_json)
+                if unknown:
+                    print(f"⚠️ Chunker cited {unknown} unknown claim ID(s), dropped them")
             
-            # Add metadata (ID)
+            # Add metadata (IDs), skill_id is the join key used by the scorer
             for chunk in response_json:
                 chunk['chunk_id'] = self._generate_chunk_id(chunk['focus_skill'])
+                chunk['skill_id'] = skill_id(chunk['focus_skill'])
             
-            # Store chunks to JSON for traceability
-            store_chunks_to_json(response_json)
+            # Store chunks for traceability
+            store_chunks(response_json, run_id=run_id)
                 
             return response_json
             
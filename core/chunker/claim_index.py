@@ -0,0 +1,91 @@
+'''
+claim_index.py: Compact, ID-addressed view of a parsed resume for the chunker
+- every resume line gets a stable ID: e1.2 = experience 1 claim 2, p3.1 = project 3 claim 1,
+  s4 = skills-list entry 4
+- the chunker prompt lists the lines by ID instead of pretty-printed JSON, the model answers
+  with IDs + scores only (ResumeAnalysisRefs), no verbatim copies of the claims
+- rehydrate() turns that answer back into the usual chunk dicts (claim_text, source_section,
+  relevance_analysis), so nothing downstream changes
+'''
+import re
+
+_ID_PATTERN = re.compile(r"^[eps]\d+(\.\d+)?$")
+
+
+class ClaimIndex:
+    def __init__(self, resume: dict):
+        self.claims = {}  # line ID -> {"claim_text", "source_section"}
+        self._lines = []
+        self._build(resume or {})
+
+    def _add(self, line_id: str, text: str, section: str):
+        text = " ".join(str(text).split())
+        if not text:
+            return
+        self.claims[line_id] = {"claim_text": text, "source_section": section}
+        self._lines.append(f"{line_id} {text}")
+
+    def _build(self, resume: dict):
+        for i, exp in enumerate(resume.get("experience", []), start=1):
+            section = f"Experience: {exp.get('company', '')}".strip()
+            details = ", ".join(filter(None, [exp.get("role"), exp.get("duration")]))
+            tools = ", ".join(exp.get("tools", []))
+            self._lines.append(f"[{section}] ({details}{'; tools: ' + tools if tools else ''})")
+            for j, claim in enumerate(exp.get("claims", []), start=1):
+                self._add(f"e{i}.{j}", claim, section)
+
+        for i, project in enumerate(resume.get("projects", []), start=1):
+            section = f"Project: {project.get('name', '')}".strip()
+            tools = ", ".join(project.get("tools", []))
+            self._lines.append(f"[{section}]{' (tools: ' + tools + ')' if tools else ''}")
+            for j, claim in enumerate(project.get("claims", []), start=1):
+                self._add(f"p{i}.{j}", claim, section)
+
+        skills = resume.get("skills") or {}
+        entries = [s for group in ("languages", "frameworks", "tools") for s in skills.get(group, [])]
+        if entries:
+            self._lines.append("[Skills]")
+            start = len(self._lines)
+            for k, skill in enumerate(entries, start=1):
+                self.claims[f"s{k}"] = {"claim_text": str(skill), "source_section": "Skills"}
+            # one line for the whole list, these are single words
+            self._lines.insert(start, "; ".join(f"s{k} {skill}" for k, skill in enumerate(entries, start=1)))
+
+    def render(self) -> str:
+        """The resume as one line per claim, `<id> <text>`, grouped under section headers."""
+        return "\n".join(self._lines)
+
+    @staticmethod
+    def normalize_id(raw: str) -> str:
+        """Models sometimes echo '[e1.2]' or 'E1.2:', map those back to 'e1.2'."""
+        return str(raw).strip().strip("[]():,. ").lower()
+
+    def rehydrate(self, chunks: list) -> tuple:
+        """
+        ResumeAnalysisRefs chunks (as dicts) -> today's chunk dicts.
+        Returns (chunks, unknown) where unknown counts IDs that don't exist in this resume.
+        """
+        hydrated = []
+        unknown = 0
+        for chunk in chunks:
+            claims = []
+            seen = set()
+            for ref in chunk.get("claims", []):
+                line_id = self.normalize_id(ref.get("id", ""))
+                if line_id in seen:
+                    continue
+                if not _ID_PATTERN.match(line_id) or line_id not in self.claims:
+                    unknown += 1
+                    continue
+                seen.add(line_id)
+                claims.append({
+                    **self.claims[line_id],
+                    "line_id": line_id,
+                    "relevance_analysis": {"score": ref.get("score"), "reasoning": ""},
+                })
+            hydrated.append({
+                "focus_skill": chunk.get("focus_skill"),
+                "chunk_summary": chunk.get("chunk_summary", ""),
+                "claims": claims,
+            })
+        return hydrated, unknown
@@ -20,4 +20,21 @@ class ResumeChunk(BaseModel):
 
 class ResumeAnalysis(BaseModel):
     model_config = ConfigDict(extra='forbid')
-    chunks: List[ResumeChunk]
\ No newline at end of file
+    chunks: List[ResumeChunk]
+
+# Claim-ID protocol (core/chunker/claim_index.py): the model cites resume lines by ID
+# instead of copying them out, the claims are rehydrated locally
+class ClaimRef(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    id: str = Field(..., description="ID of the resume line, e.g. 'e1.2'")
+    score: int = Field(..., description="Relevance score from 1-10")
+
+class ResumeChunkRefs(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    focus_skill: str = Field(..., description="The target skill this chunk aggregates evidence for")
+    chunk_summary: str = Field(..., description="1-2 sentence summary of candidate's proficiency")
+    claims: List[ClaimRef]
+
+class ResumeAnalysisRefs(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    chunks: List[ResumeChunkRefs]
@@ -1,26 +1,57 @@
 '''
 skill_extractor.py : Contains the JDSkillExtractor class, which accepts a JD and extracts skills from it
 '''
-# fix module import issues, delete later when running from app.py
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
-
 import json
 import re
-from groq import Groq
-from config.prompts import skill_extractor_prompt
-from config.settings import API_KEY, JD_SKILL_MODEL
+from config.prompts import skill_extractor_prompt, residual_skill_prompt
+from config.settings import JD_SKILL_MODEL, JD_SKILL_MODE, JD_SKILL_COVERAGE_THRESHOLD
+from core.chunker.taxonomy import SkillMatcher, unknown_terms
+from core.chunker.skill_index import dedupe_skills
+from core.llm_client import chat_completion
+
+# building the automaton is the only non-trivial cost, do it once per process
+_MATCHER = None
+
+def get_skill_matcher() -> SkillMatcher:
+    global _MATCHER
+    if _MATCHER is None:
+        _MATCHER = SkillMatcher()
+    return _MATCHER
+
 
 class JDSkillExtractor:
-    def __init__(self):
-        self.client = Groq(api_key=API_KEY)
+    def __init__(self, mode: str = JD_SKILL_MODE):
         self.model = JD_SKILL_MODEL
+        self.mode = mode
+        self.matcher = get_skill_matcher()
+
+    def extract_skills(self, jd, cancel_token=None):
+        """
+        Taxonomy pass first, LLM only for whatever the taxonomy couldn't explain.
+        - "local": never calls the LLM
+        - "hybrid": skips the LLM when coverage >= JD_SKILL_COVERAGE_THRESHOLD
+        - "llm": old behaviour, full JD to the LLM
+        """
+        if self.mode == "llm":
+            return dedupe_skills(self._extract_with_llm(skill_extractor_prompt(jd), cancel_token))
+
+        matches = self.matcher.find(jd)
+        known = list(dict.fromkeys(canonical for _, _, canonical in matches))
+        if self.mode == "local":
+            return known
+
+        residual = self.matcher.residual_text(jd, matches)
+        unknown = unknown_terms(residual)
+        coverage = len(known) / (len(known) + len(unknown)) if known or unknown else 1.0
+        if known and coverage >= JD_SKILL_COVERAGE_THRESHOLD:
+            print(f"✓ Taxonomy covered {coverage:.0%} of JD terms, skipping LLM ({len(known)} skills)")
+            return known
+
+        extra = self._extract_with_llm(residual_skill_prompt(residual, known), cancel_token)
+        return dedupe_skills(known + extra)
 
-    def extract_skills(self, jd):
-        prompt= skill_extractor_prompt(jd)
-        response = self.client.chat.completions.create(
+    def _extract_with_llm(self, prompt, cancel_token=None):
+        response = chat_completion(
             model=self.model,
             max_tokens=200,
             messages=[
@@ -29,7 +60,8 @@ class JDSkillExtractor:
                     "content": prompt
                 }
             ],
-            temperature=0
+            temperature=0,
+            cancel_token=cancel_token
         )
 
         response_text = response.choices[0].message.content.strip()
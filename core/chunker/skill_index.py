@@ -0,0 +1,76 @@
+'''
+skill_index.py: Canonical skill IDs shared by the extractor, chunker and scorer
+- every stage spells skills differently ("Node.js", "NodeJS", "node js", "Python 3.11")
+- skill_id() folds all of them into one hashable key, so joins are a dict lookup
+'''
+import re
+from functools import lru_cache
+
+from core.chunker.taxonomy import SKILL_TAXONOMY
+
+# trailing versions after whitespace: "python 3.11", "angular v14", "vue 3.x". Digits glued to
+# the name are part of it ("s3", "ec2", "ipv6"), those spellings need a taxonomy alias ("html5")
+_VERSION_SUFFIX = re.compile(r"(?<=[a-z+#])\s+v?\d+(?:\.(?:\d+|x))*\s*$")
+# never strip down to less than this, "R 4.2" stays "r42" rather than colliding as "r"
+_MIN_STRIPPED_LEN = 2
+# keep + and # so C, C++ and C# stay distinct
+_NON_KEY_CHARS = re.compile(r"[^a-z0-9+#]")
+
+
+def normalize_skill(name: str, strip_version: bool = False) -> str:
+    """Lowercase, drop punctuation/whitespace, optionally drop a trailing version."""
+    key = (name or "").strip().lower()
+    if strip_version:
+        stripped = _VERSION_SUFFIX.sub("", key)
+        if len(_NON_KEY_CHARS.sub("", stripped)) >= _MIN_STRIPPED_LEN:
+            key = stripped
+    return _NON_KEY_CHARS.sub("", key)
+
+
+class SkillIndex:
+    """
+    Hashed alias -> canonical ID lookup built from the taxonomy.
+    Unknown skills still get a stable ID (their normalized form), so two
+    stages that both say "ClickHouse" still join even though we don't know it.
+    """
+
+    def __init__(self, taxonomy=None):
+        self._alias_to_id = {}
+        self._display = {}
+        for canonical, aliases in (taxonomy or SKILL_TAXONOMY).items():
+            cid = normalize_skill(canonical)
+            self._display[cid] = canonical
+            for alias in [canonical, *aliases]:
+                self._alias_to_id.setdefault(normalize_skill(alias), cid)
+
+    def canonical_id(self, name: str) -> str:
+        key = normalize_skill(name)
+        if key in self._alias_to_id:
+            return self._alias_to_id[key]
+        # only strip versions after the exact lookup, "es6"/"k8s" are aliases in their own right
+        stripped = normalize_skill(name, strip_version=True)
+        return self._alias_to_id.get(stripped, stripped or key)
+
+    def display_name(self, name: str) -> str:
+        """Canonical spelling for a skill, or the input itself if we don't know it."""
+        return self._display.get(self.canonical_id(name), name)
+
+
+SKILL_INDEX = SkillIndex()
+
+
+@lru_cache(maxsize=4096)
+def skill_id(name: str) -> str:
+    return SKILL_INDEX.canonical_id(name)
+
+
+def dedupe_skills(skills):
+    """Drop spelling variants of the same skill, keeping the first one seen."""
+    seen = set()
+    unique = []
+    for skill in skills:
+        sid = skill_id(skill)
+        if sid and sid not in seen:
+            seen.add(sid)
+            unique.append(skill)
+    return unique
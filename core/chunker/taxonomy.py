@@ -0,0 +1,249 @@
+'''
+taxonomy.py: Local skill taxonomy + Aho-Corasick matcher for fast JD skill extraction
+- SKILL_TAXONOMY maps a canonical skill name to the aliases we expect to see in a JD
+- SkillMatcher scans the JD once and returns every known skill it finds
+- anything the matcher can't account for is left for the LLM (see skill_extractor.py)
+'''
+import re
+from collections import deque
+
+# canonical name -> aliases (matched case-insensitively, on word boundaries)
+# keep aliases unambiguous: "go", "r", "c" and "spring" are plain english words in a JD, and an
+# alias must mean that one product ("containers" isn't Docker, "transformers" isn't Hugging Face)
+SKILL_TAXONOMY = {
+    # languages
+    "Python": ["python", "python3", "python 3"],
+    "Java": ["java", "core java"],
+    "JavaScript": ["javascript", "java script", "ecmascript", "es6"],
+    "TypeScript": ["typescript"],
+    "C++": ["c++", "cpp", "c/c++"],
+    "C#": ["c#", "csharp", "c sharp"],
+    "Go": ["golang", "go lang"],
+    "Rust": ["rust", "rustlang"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swift", "swiftui"],
+    "Scala": ["scala"],
+    "Ruby": ["ruby"],
+    "PHP": ["php"],
+    "Perl": ["perl"],
+    "Bash": ["bash", "shell scripting", "shell script"],
+    "SQL": ["sql", "t-sql", "pl/sql"],
+    "Solidity": ["solidity"],
+    "MATLAB": ["matlab"],
+    "Dart": ["dart"],
+    "Elixir": ["elixir"],
+    "Haskell": ["haskell"],
+
+    # web / backend frameworks
+    "React": ["react", "reactjs", "react.js", "react js"],
+    "React Native": ["react native", "react-native"],
+    "Angular": ["angular", "angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs", "vue.js"],
+    "Next.js": ["next.js", "nextjs"],
+    "Node.js": ["node.js", "nodejs", "node js"],
+    "Express.js": ["express.js", "expressjs"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi", "fast api"],
+    "Spring Boot": ["spring boot", "springboot", "spring framework"],
+    "Ruby on Rails": ["ruby on rails", "rails"],
+    ".NET": [".net", "dotnet", "asp.net", ".net core"],
+    "GraphQL": ["graphql"],
+    "REST APIs": ["restful", "rest api", "rest apis", "restful apis", "restful api"],
+    "gRPC": ["grpc"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3", "tailwind", "tailwindcss"],
+    "Redux": ["redux"],
+
+    # data / ml
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision"],
+    "LLMs": ["llm", "llms", "large language models", "large language model"],
+    "RAG": ["rag", "retrieval augmented generation", "retrieval-augmented generation"],
+    "TensorFlow": ["tensorflow", "tensorflow-keras", "tf.keras"],
+    "Keras": ["keras"],
+    "PyTorch": ["pytorch", "torch"],
+    "Scikit-learn": ["scikit-learn", "scikit learn", "sklearn"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "Spark": ["spark", "apache spark", "pyspark"],
+    "Hadoop": ["hadoop"],
+    "Kafka": ["kafka", "apache kafka"],
+    "Airflow": ["airflow", "apache airflow"],
+    "dbt": ["dbt"],
+    "Hugging Face": ["hugging face", "huggingface"],
+    "LangChain": ["langchain"],
+
+    # databases
+    "PostgreSQL": ["postgresql", "postgres"],
+    "MySQL": ["mysql"],
+    "SQLite": ["sqlite"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Cassandra": ["cassandra"],
+    "Elasticsearch": ["elasticsearch", "elastic search", "opensearch"],
+    "DynamoDB": ["dynamodb"],
+    "Firebase": ["firebase", "firestore"],
+    "Oracle": ["oracle db", "oracle database"],
+    "Snowflake": ["snowflake"],
+    "BigQuery": ["bigquery"],
+    "NoSQL": ["nosql"],
+
+    # cloud / infra
+    "AWS": ["aws", "amazon web services", "aws lambda"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Azure": ["azure", "microsoft azure"],
+    "Docker": ["docker"],
+    "Kubernetes": ["kubernetes", "k8s"],
+    "Terraform": ["terraform"],
+    "Ansible": ["ansible"],
+    "Helm": ["helm charts", "helm chart"],
+    "Linux": ["linux"],
+    "CI/CD": ["ci/cd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "Jenkins": ["jenkins"],
+    "GitHub Actions": ["github actions"],
+    "Git": ["git", "github", "gitlab", "bitbucket"],
+    "Nginx": ["nginx"],
+    "Serverless": ["serverless", "lambda functions"],
+    "Microservices": ["microservices", "micro-services", "microservice architecture"],
+    "Prometheus": ["prometheus"],
+    "Grafana": ["grafana"],
+
+    # concepts
+    "System Design": ["system design", "systems design"],
+    "Distributed Systems": ["distributed systems", "distributed computing"],
+    "Data Structures": ["data structures", "data structures and algorithms", "dsa"],
+    "Algorithms": ["algorithms"],
+    "Object-Oriented Programming": ["object-oriented programming", "object oriented programming", "oop", "ood"],
+    "Unit Testing": ["unit testing", "unit tests", "pytest", "junit", "jest"],
+    "Agile": ["agile", "scrum", "kanban"],
+    "Application Security": ["application security", "appsec", "owasp"],
+    "Blockchain": ["blockchain", "web3", "web3.js", "ethereum", "hyperledger", "hyperledger fabric"],
+    "Android": ["android"],
+    "iOS": ["ios"],
+    "Message Queues": ["rabbitmq", "message queues", "message queue", "sqs", "pub/sub"],
+}
+
+# tokens that look like tech (ALL CAPS etc.) but are just JD boilerplate
+_NON_SKILL_TERMS = {
+    "us", "usa", "uk", "eu", "eeo", "hr", "jd", "cv", "or", "and", "to", "we", "a", "i",
+    "it", "ai", "ui", "ux", "api", "apis", "b2b", "b2c", "saas", "ctc", "lpa", "etc", "faq",
+    "pto", "remote", "onsite", "hybrid", "ok",
+}
+
+_TERM_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+#./\-]*[A-Za-z0-9+#]|[A-Za-z]")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every alias in the taxonomy.
+    One pass over the JD text, independent of taxonomy size.
+    """
+
+    def __init__(self, taxonomy=None):
+        self.taxonomy = taxonomy or SKILL_TAXONOMY
+        self._goto = [{}]       # node -> {char: node}
+        self._fail = [0]        # node -> fallback node
+        self._out = [[]]        # node -> [(alias_len, canonical)]
+        for canonical, aliases in self.taxonomy.items():
+            for alias in set(aliases):
+                self._add(alias.lower(), canonical)
+        self._build_failure_links()
+
+    def _add(self, alias: str, canonical: str):
+        node = 0
+        for ch in alias:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(alias), canonical))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str):
+        """
+        Return non-overlapping (start, end, canonical) matches, longest match wins.
+        Matches must sit on word boundaries, so "java" never fires inside "javascript".
+        """
+        lowered = text.lower()
+        candidates = []
+        node = 0
+        for i, ch in enumerate(lowered):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, canonical in self._out[node]:
+                start, end = i - length + 1, i + 1
+                if start > 0 and _is_word_char(lowered[start - 1]) and _is_word_char(lowered[start]):
+                    continue
+                if end < len(lowered) and _is_word_char(lowered[end]) and _is_word_char(lowered[end - 1]):
+                    continue
+                candidates.append((start, end, canonical))
+
+        # leftmost-longest, no overlaps
+        candidates.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        matches = []
+        last_end = -1
+        for start, end, canonical in candidates:
+            if start >= last_end:
+                matches.append((start, end, canonical))
+                last_end = end
+        return matches
+
+    def extract(self, text: str):
+        """Known skills in order of first appearance."""
+        return list(dict.fromkeys(canonical for _, _, canonical in self.find(text)))
+
+    @staticmethod
+    def residual_text(text: str, matches) -> str:
+        """JD text with every matched span blanked out."""
+        parts = []
+        cursor = 0
+        for start, end, _ in matches:
+            parts.append(text[cursor:start])
+            cursor = end
+        parts.append(text[cursor:])
+        return " ".join(p.strip() for p in parts if p.strip())
+
+
+def unknown_terms(residual: str):
+    """
+    Tech-looking tokens the taxonomy didn't cover (camelCase, digits, +/#, ACRONYMS).
+    Cheap proxy for "is there anything left worth asking the LLM about?".
+    """
+    terms = []
+    for token in _TERM_PATTERN.findall(residual):
+        token = token.strip(".-/")
+        if not token or token.lower() in _NON_SKILL_TERMS:
+            continue
+        looks_technical = (
+            any(ch.isdigit() for ch in token)
+            or any(ch in "+#" for ch in token)
+            or re.search(r"[a-z][A-Z]", token) is not None
+            or (token.isupper() and 2 <= len(token) <= 6)
+            or ("." in token and not token.endswith("."))
+        )
+        if looks_technical:
+            terms.append(token)
+    return list(dict.fromkeys(terms))
@@ -0,0 +1,282 @@
+'''
+export.py: Columnar (Parquet) export of finished dockets for cross-candidate analytics
+- one docket becomes rows in six tables with fixed schemas: dockets, chunks, claims,
+  questions, bucket_scores, skill_scores (see TABLES)
+- rows are buffered and appended as new part files (data/exports/<table>/part-*.parquet),
+  EXPORT_BATCH_DOCKETS dockets per part, existing parts are never rewritten
+- load_table() reads every part of a table back as one pyarrow Table, compact() merges the parts
+- needs the optional `pyarrow` package, nothing here is imported by the app unless
+  EXPORT_ENABLED is set
+
+    python -m core.export            # backfill every run in the artifact store not exported yet
+    python -m core.export --compact  # merge the part files of every table
+'''
+import argparse
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from config import settings
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Docket export needs `pip install pyarrow`") from e
+    return pyarrow
+
+
+# table -> [(column, pyarrow type name)], kept as plain data so the module imports without pyarrow
+TABLES = {
+    "dockets": [
+        ("run_id", "string"), ("resume_id", "string"), ("exported_at", "timestamp"),
+        ("final_score", "float64"), ("core_alignment", "float64"),
+        ("n_chunks", "int32"), ("n_claims", "int32"), ("n_questions", "int32"),
+    ],
+    "chunks": [
+        ("run_id", "string"), ("chunk_id", "string"), ("skill_id", "string"),
+        ("focus_skill", "string"), ("chunk_summary", "string"), ("n_claims", "int32"),
+    ],
+    "claims": [
+        ("run_id", "string"), ("claim_id", "string"), ("chunk_id", "string"), ("focus_skill", "string"),
+        ("claim_text", "string"), ("source_section", "string"), ("relevance", "int32"),
+    ],
+    "questions": [
+        ("run_id", "string"), ("claim_id", "string"), ("focus_skill", "string"),
+        ("claim_type", "string"), ("level", "string"), ("question", "string"),
+    ],
+    "bucket_scores": [
+        ("run_id", "string"), ("bucket", "string"), ("priority", "string"),
+        ("score", "float64"), ("expected", "float64"), ("gap", "float64"),
+    ],
+    "skill_scores": [
+        ("run_id", "string"), ("skill", "string"), ("score", "float64"),
+    ],
+}
+
+
+def arrow_schema(table: str):
+    pa = _pyarrow()
+    types = {
+        "string": pa.string(), "float64": pa.float64(), "int32": pa.int32(),
+        "timestamp": pa.timestamp("ms", tz="UTC"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in TABLES[table]])
+
+
+def docket_rows(run_id: str, chunks: list, questions: list, audit_data: dict = None, resume_id: str = "") -> dict:
+    """
+    table -> list of row dicts for one docket.
+    chunks: the selected chunks generation ran on (checkpoint stage "chunks"), so claim IDs
+    match the generator's "<chunk_id>:<index>".
+    questions: [{"focus_skill", "results": [generator result, ...]}], as stored by the pipeline.
+    audit_data: run_audit_pipeline's result, or None if the audit failed.
+    """
+    rows = {table: [] for table in TABLES}
+    for chunk in chunks or []:
+        chunk_id = chunk.get("chunk_id", "")
+        claims = chunk.get("claims", [])
+        rows["chunks"].append({
+            "run_id": run_id, "chunk_id": chunk_id, "skill_id": chunk.get("skill_id", ""),
+            "focus_skill": chunk.get("focus_skill", ""), "chunk_summary": chunk.get("chunk_summary", ""),
+            "n_claims": len(claims),
+        })
+        for idx, claim in enumerate(claims):
+            rows["claims"].append({
+                "run_id": run_id, "claim_id": f"{chunk_id}:{idx}", "chunk_id": chunk_id,
+                "focus_skill": chunk.get("focus_skill", ""), "claim_text": claim.get("claim_text", ""),
+                "source_section": claim.get("source_section", ""),
+                "relevance": (claim.get("relevance_analysis") or {}).get("score"),
+            })
+
+    for group in questions or []:
+        for result in group.get("results", []):
+            for q in result.get("questions", []):
+                rows["questions"].append({
+                    "run_id": run_id, "claim_id": result.get("claim_id", ""),
+                    "focus_skill": group.get("focus_skill", ""), "claim_type": result.get("claim_type", ""),
+                    "level": q.get("level", ""), "question": q.get("question", ""),
+                })
+
+    scores = (audit_data or {}).get("scores") or {}
+    priorities = {}
+    for bucket in scores.get("bucket_schema", []):
+        bucket = bucket.model_dump() if hasattr(bucket, "model_dump") else bucket
+        priorities[bucket["name"]] = bucket.get("priority", "")
+    expectations = scores.get("jd_expectations", {})
+    for bucket, score in scores.get("radar_data", {}).items():
+        expected = expectations.get(bucket)
+        rows["bucket_scores"].append({
+            "run_id": run_id, "bucket": bucket, "priority": priorities.get(bucket, ""),
+            "score": score, "expected": expected,
+            "gap": expected - score if expected is not None else None,
+        })
+    for skill, score in scores.get("detailed_scores", {}).items():
+        rows["skill_scores"].append({"run_id": run_id, "skill": skill, "score": score})
+
+    rows["dockets"].append({
+        "run_id": run_id, "resume_id": resume_id, "exported_at": datetime.now(timezone.utc),
+        "final_score": scores.get("final_score"), "core_alignment": scores.get("core_alignment"),
+        "n_chunks": len(rows["chunks"]), "n_claims": len(rows["claims"]), "n_questions": len(rows["questions"]),
+    })
+    return rows
+
+
+class DocketExporter:
+    def __init__(self, root: str = settings.EXPORT_DIR, batch_dockets: int = settings.EXPORT_BATCH_DOCKETS):
+        _pyarrow()  # fail at construction, not halfway through a batch
+        self.root = Path(root)
+        self.batch_dockets = max(1, batch_dockets)
+        self._buffer = {table: [] for table in TABLES}
+        self._buffered = 0
+        self._exported = None  # run IDs already in the dockets table, loaded on first export
+        self._lock = threading.Lock()
+
+    def add(self, rows: dict):
+        """Buffer one docket's rows (docket_rows()), writing a part file per table every batch_dockets dockets."""
+        with self._lock:
+            self._exported_ids().update(r["run_id"] for r in rows.get("dockets", []))
+            for table, table_rows in rows.items():
+                self._buffer[table].extend(table_rows)
+            self._buffered += 1
+            if self._buffered >= self.batch_dockets:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffered:
+            return
+        pa = _pyarrow()
+        # same part name across tables, so one batch's files can be matched up
+        part = f"part-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        for table, table_rows in self._buffer.items():
+            if not table_rows:
+                continue
+            schema = arrow_schema(table)
+            directory = self.root / table
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp = directory / f".{part}.tmp"
+            pa.parquet.write_table(pa.Table.from_pylist(table_rows, schema=schema), tmp)
+            tmp.replace(directory / part)  # readers never see a half-written part
+        self._buffer = {table: [] for table in TABLES}
+        self._buffered = 0
+
+    def _exported_ids(self) -> set:
+        if self._exported is None:
+            self._exported = set(load_table("dockets", self.root, ["run_id"]).column("run_id").to_pylist())
+        return self._exported
+
+    def export_run(self, run_id: str, resume_id: str = "") -> bool:
+        """
+        Export a finished run from its checkpoint (selected chunks) and the artifact store
+        (questions, audit, resume). Returns False if the run was already exported or has no
+        questions or audit yet. A run is only marked exported once its audit exists, so a run
+        whose audit failed is picked up by a later backfill if it gets one, instead of being
+        stuck without bucket / skill scores.
+        resume_id: defaults to the resume stored under the run.
+        """
+        from core.artifacts import get_artifact_store
+        from core.checkpoint import RunCheckpoint
+
+        with self._lock:
+            if run_id in self._exported_ids():
+                return False
+        artifacts = get_artifact_store().for_run(run_id)
+        if "questions" not in artifacts or not artifacts.get("audit"):
+            return False
+        resume_id = resume_id or (artifacts.get("resume") or {}).get("resume_id", "")
+        chunks = RunCheckpoint(run_id).stage("chunks") or artifacts.get("chunks") or []
+        self.add(docket_rows(run_id, chunks, artifacts["questions"], artifacts["audit"], resume_id))
+        return True
+
+
+def load_table(table: str, root: str = settings.EXPORT_DIR, columns: list = None):
+    """
+    Every part of a table as one pyarrow Table (empty, with the right schema, if nothing was
+    exported). columns: read only these, Parquet skips the rest on disk.
+    """
+    _pyarrow()
+    import pyarrow.dataset as ds
+
+    schema = arrow_schema(table)
+    directory = Path(root) / table
+    if not directory.exists() or not any(directory.glob("*.parquet")):
+        empty = schema.empty_table()
+        return empty.select(columns) if columns else empty
+    return ds.dataset(directory, schema=schema, format="parquet").to_table(columns=columns)
+
+
+def compact(table: str, root: str = settings.EXPORT_DIR) -> int:
+    """Merge a table's part files into one. Returns the number of parts merged."""
+    pa = _pyarrow()
+    directory = Path(root) / table
+    parts = sorted(directory.glob("*.parquet")) if directory.exists() else []
+    if len(parts) < 2:
+        return 0
+    merged = pa.concat_tables([pa.parquet.read_table(p, schema=arrow_schema(table)) for p in parts])
+    name = f"part-{time.strftime('%Y%m%d%H%M%S')}-compacted-{uuid.uuid4().hex[:8]}.parquet"
+    tmp = directory / f".{name}.tmp"
+    pa.parquet.write_table(merged, tmp)
+    tmp.replace(directory / name)
+    for p in parts:
+        p.unlink()
+    return len(parts)
+
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> DocketExporter:
+    """Process-wide exporter for EXPORT_ENABLED runs, its buffer is flushed at interpreter exit."""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is None:
+            import atexit
+
+            _exporter = DocketExporter()
+            atexit.register(_exporter.flush)
+        return _exporter
+
+
+def export_finished_run(run_id: str, resume_id: str = ""):
+    """Hook for the UI / job worker: export a run if EXPORT_ENABLED, never fail the docket over it."""
+    if not settings.EXPORT_ENABLED:
+        return
+    try:
+        get_exporter().export_run(run_id, resume_id)
+    except Exception as e:
+        print(f"Docket export failed for run {run_id}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default=settings.EXPORT_DIR)
+    parser.add_argument("--compact", action="store_true", help="merge part files instead of exporting")
+    args = parser.parse_args()
+
+    if args.compact:
+        for table in TABLES:
+            print(f"{table}: merged {compact(table, args.root)} parts")
+        return
+
+    from core.artifacts import get_artifact_store
+
+    exporter = DocketExporter(args.root)
+    count = 0
+    for artifact in get_artifact_store().iter("questions"):
+        if artifact["run_id"] and exporter.export_run(artifact["run_id"]):
+            count += 1
+    exporter.flush()
+    print(f"exported {count} new docket(s) to {args.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+'''
+client.py: Thin HTTP client for the background job service, used by the Streamlit layer
+'''
+import base64
+import requests
+
+from config.settings import JOB_SERVICE_URL
+
+
+def service_available() -> bool:
+    if not JOB_SERVICE_URL:
+        return False
+    try:
+        return requests.get(f"{JOB_SERVICE_URL}/health", timeout=2).ok
+    except requests.RequestException:
+        return False
+
+
+def submit_job(kind: str, payload: dict) -> str:
+    response = requests.post(f"{JOB_SERVICE_URL}/jobs", json={"kind": kind, "payload": payload}, timeout=30)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def submit_docket_job(resume_file, jd_text: str, fresh: bool = False) -> str:
+    """Parse + generate + audit as one job, the upload travels base64-encoded. fresh: ignore the run's checkpoint."""
+    return submit_job("docket", {
+        "filename": getattr(resume_file, "name", "resume.pdf"),
+        "content_b64": base64.b64encode(resume_file.getvalue()).decode("ascii"),
+        "jd_text": jd_text,
+        "fresh": fresh,
+    })
+
+
+def cancel_job(job_id: str) -> bool:
+    try:
+        response = requests.post(f"{JOB_SERVICE_URL}/jobs/{job_id}/cancel", timeout=10)
+        return response.ok and response.json().get("cancelled", False)
+    except requests.RequestException:
+        return False
+
+
+def get_job(job_id: str):
+    response = requests.get(f"{JOB_SERVICE_URL}/jobs/{job_id}", timeout=30)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
+
+
+def poll_events(job_id: str, after: int = 0, wait: float = 10) -> dict:
+    """{"status": ..., "error": ..., "events": [...]}, blocks up to `wait` seconds server-side."""
+    response = requests.get(
+        f"{JOB_SERVICE_URL}/jobs/{job_id}/events",
+        params={"after": after, "wait": wait},
+        timeout=wait + 30,
+    )
+    response.raise_for_status()
+    return response.json()
@@ -0,0 +1,104 @@
+'''
+server.py: Local HTTP API for the background job service
+Run with: python -m core.jobs.server
+
+POST /jobs                          {"kind": "parse|generate|audit|docket", "payload": {...}} -> {"id": ...}
+POST /jobs/<id>/cancel              cancel a queued or running job
+GET  /jobs/<id>                     status, result and error (payload omitted)
+GET  /jobs/<id>/events?after=N&wait=S
+                                    events past seq N, long-polls up to S seconds
+GET  /health
+'''
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from config.settings import JOB_DB_PATH, JOB_SERVICE_HOST, JOB_SERVICE_PORT, JOB_WORKERS
+from core.jobs.store import JobStore
+from core.jobs.worker import HANDLERS, JobWorkerPool
+
+MAX_WAIT = 30  # seconds a single long-poll may block
+
+
+def make_handler(store: JobStore, pool: JobWorkerPool = None):
+    class JobRequestHandler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _parts(self):
+            url = urlparse(self.path)
+            return [p for p in url.path.split("/") if p], parse_qs(url.query)
+
+        def do_POST(self):
+            parts, _ = self._parts()
+            if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "cancel":
+                cancelled = pool.cancel(parts[1]) if pool else store.cancel(parts[1])
+                return self._send(200, {"id": parts[1], "cancelled": cancelled})
+            if parts != ["jobs"]:
+                return self._send(404, {"error": "not found"})
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except (ValueError, json.JSONDecodeError):
+                return self._send(400, {"error": "invalid JSON body"})
+            kind = body.get("kind")
+            if kind not in HANDLERS:
+                return self._send(400, {"error": f"unknown job kind: {kind}"})
+            job_id = store.submit(kind, body.get("payload") or {})
+            self._send(201, {"id": job_id})
+
+        def do_GET(self):
+            parts, query = self._parts()
+            if parts == ["health"]:
+                return self._send(200, {"status": "ok"})
+            if len(parts) < 2 or parts[0] != "jobs":
+                return self._send(404, {"error": "not found"})
+
+            job = store.get(parts[1])
+            if job is None:
+                return self._send(404, {"error": "job not found"})
+
+            if len(parts) == 2:
+                job.pop("payload", None)
+                return self._send(200, job)
+
+            if parts[2] == "events":
+                try:
+                    after = int(query.get("after", ["0"])[0])
+                    wait = max(0.0, min(float(query.get("wait", ["0"])[0]), MAX_WAIT))  # max() also drops nan
+                except ValueError:
+                    return self._send(400, {"error": "after must be an integer and wait a number"})
+                events = store.wait_for_events(parts[1], after, timeout=wait)
+                job = store.get(parts[1])
+                return self._send(200, {"status": job["status"], "error": job["error"], "events": events})
+
+            self._send(404, {"error": "not found"})
+
+        def log_message(self, format, *args):
+            pass  # long-polls would flood the console
+
+    return JobRequestHandler
+
+
+def main():
+    store = JobStore(JOB_DB_PATH)
+    pool = JobWorkerPool(store, workers=JOB_WORKERS)
+    pool.start()
+    server = ThreadingHTTPServer((JOB_SERVICE_HOST, JOB_SERVICE_PORT), make_handler(store, pool))
+    print(f"Job service listening on http://{JOB_SERVICE_HOST}:{JOB_SERVICE_PORT} ({JOB_WORKERS} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        pool.stop()
+
+
+if __name__ == "__main__":
+    main()
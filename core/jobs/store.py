@@ -0,0 +1,183 @@
+'''
+store.py: Persistent job queue + event log for the background job service (SQLite)
+- jobs survive UI reruns and service restarts (running jobs are re-queued on start)
+- every job has an append-only event log, clients read it with an `after` cursor
+'''
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+TERMINAL_STATES = ("done", "failed", "cancelled")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at);
+CREATE TABLE IF NOT EXISTS job_events (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+class JobStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # new events wake up long-polling readers
+        self.changed = threading.Condition()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # one short-lived connection per operation, workers and HTTP threads never share one
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _notify(self):
+        with self.changed:
+            self.changed.notify_all()
+
+    def submit(self, kind: str, payload: dict) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), now, now),
+            )
+        self._notify()
+        return job_id
+
+    def claim_next(self):
+        """Atomically move the oldest queued job to running. Returns (id, kind, payload) or None."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, kind, payload FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ?",
+                (time.time(), row["id"]),
+            )
+            conn.execute("COMMIT")
+        return row["id"], row["kind"], json.loads(row["payload"])
+
+    def requeue_running(self) -> int:
+        """
+        Jobs that were running when the service died go back to the queue. Their half-written
+        event log is dropped and replaced by one "requeued" event, numbered after the old ones,
+        so a client already following the job resets instead of seeing every event twice.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            job_ids = [r["id"] for r in conn.execute("SELECT id FROM jobs WHERE status = 'running'")]
+            for job_id in job_ids:
+                seq = conn.execute(
+                    "SELECT COALESCE(MAX(seq), 0) + 1 FROM job_events WHERE job_id = ?", (job_id,)
+                ).fetchone()[0]
+                conn.execute("DELETE FROM job_events WHERE job_id = ?", (job_id,))
+                conn.execute(
+                    "INSERT INTO job_events (job_id, seq, kind, data, created_at) VALUES (?, ?, 'requeued', 'null', ?)",
+                    (job_id, seq, now),
+                )
+                conn.execute("UPDATE jobs SET status = 'queued', updated_at = ? WHERE id = ?", (now, job_id))
+            conn.execute("COMMIT")
+        if job_ids:
+            self._notify()
+        return len(job_ids)
+
+    def add_event(self, job_id: str, kind: str, data=None):
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            seq = conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 FROM job_events WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "INSERT INTO job_events (job_id, seq, kind, data, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, seq, kind, json.dumps(data), time.time()),
+            )
+            conn.execute("COMMIT")
+        self._notify()
+        return seq
+
+    def events(self, job_id: str, after: int = 0, limit: int = 500) -> list:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT seq, kind, data FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after, limit),
+            ).fetchall()
+        return [{"seq": r["seq"], "kind": r["kind"], "data": json.loads(r["data"])} for r in rows]
+
+    def wait_for_events(self, job_id: str, after: int = 0, timeout: float = 0) -> list:
+        """Long-poll: block up to `timeout` seconds for events past `after` or a terminal state."""
+        deadline = time.monotonic() + timeout
+        while True:
+            events = self.events(job_id, after)
+            job = self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if events or job is None or job["status"] in TERMINAL_STATES or remaining <= 0:
+                return events
+            with self.changed:
+                self.changed.wait(min(remaining, 1.0))
+
+    def _set_status(self, job_id: str, status: str, result=None, error: str = None):
+        # a cancelled job stays cancelled, even if its worker finishes the step it was on
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ? AND status != 'cancelled'",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id),
+            )
+        self._notify()
+
+    def cancel(self, job_id: str) -> bool:
+        """Mark a queued/running job cancelled. Returns False if it had already finished."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id),
+            )
+        self._notify()
+        return cur.rowcount > 0
+
+    def finish(self, job_id: str, result):
+        self._set_status(job_id, "done", result=result)
+
+    def fail(self, job_id: str, error: str):
+        self._set_status(job_id, "failed", error=error)
+
+    def get(self, job_id: str):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
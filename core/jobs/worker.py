@@ -0,0 +1,180 @@
+'''
+worker.py: Worker pool that drains the job queue and runs the pipeline stages
+- job kinds: parse, generate, audit, and docket (parse -> generate -> audit in one job)
+- progress is written to the job's event log as it happens, results are stored on completion
+- each running job has a CancelToken, cancelling the job aborts its LLM work
+'''
+import base64
+import importlib
+import io
+import threading
+import traceback
+
+from core.cancellation import CancelToken, Cancelled, check
+from core.export import export_finished_run
+
+
+def _pipeline():
+    """
+    core.pipeline_client, imported on first use so the service binds its port (and answers
+    /health) without waiting for groq/pdfplumber/pydantic. start() preloads it in the background.
+    """
+    return importlib.import_module("core.pipeline_client")
+
+
+class _Upload(io.BytesIO):
+    """Quacks like Streamlit's UploadedFile (getvalue() + name)."""
+
+    def __init__(self, content: bytes, name: str):
+        super().__init__(content)
+        self.name = name
+
+
+def _decode_upload(payload: dict) -> _Upload:
+    return _Upload(base64.b64decode(payload["content_b64"]), payload.get("filename", "resume.pdf"))
+
+
+def _jsonable_scores(audit_data):
+    """bucket_schema holds pydantic models, flatten them before they hit the job store."""
+    if not audit_data:
+        return audit_data
+    scores = dict(audit_data.get("scores", {}))
+    scores["bucket_schema"] = [
+        b.model_dump() if hasattr(b, "model_dump") else b for b in scores.get("bucket_schema", [])
+    ]
+    return {**audit_data, "scores": scores}
+
+
+def run_parse(store, job_id, payload, cancel_token=None):
+    store.add_event(job_id, "stage", {"label": "Parsing Resume..."})
+    resume_json = _pipeline().parse_resume_api(_decode_upload(payload))
+    if resume_json is None:
+        raise RuntimeError("Resume parsing failed")
+    store.add_event(job_id, "resume", resume_json)
+    return {"resume_json": resume_json}
+
+
+def run_generate(store, job_id, payload, cancel_token=None):
+    store.add_event(job_id, "stage", {"label": "Generating Questions..."})
+    questions_generator = _pipeline().generate_questions_local(
+        payload["resume_json"], payload["jd_text"], cancel_token=cancel_token, fresh=payload.get("fresh", False)
+    )
+    check(cancel_token)
+    if questions_generator is None:
+        raise RuntimeError("Question generation failed")
+
+    results_map = {}
+    for chunk_id, skill, result, current, total in questions_generator:
+        store.add_event(job_id, "question", {
+            "chunk_id": chunk_id, "skill": skill, "result": result, "current": current, "total": total,
+        })
+        if result.get("done", True):
+            results_map.setdefault(chunk_id, {"focus_skill": skill, "results": []})["results"].append(result)
+    check(cancel_token)
+    return {"questions": list(results_map.values())}
+
+
+def run_audit(store, job_id, payload, cancel_token=None):
+    store.add_event(job_id, "stage", {"label": "Running Grounded Audit..."})
+    audit_data = _jsonable_scores(_pipeline().run_audit_pipeline(
+        payload["chunks"], payload["jd_text"], cancel_token=cancel_token, run_id=payload.get("run_id", "")
+    ))
+    check(cancel_token)
+    store.add_event(job_id, "audit", audit_data)
+    return {"audit_data": audit_data}
+
+
+def run_docket(store, job_id, payload, cancel_token=None):
+    resume_json = run_parse(store, job_id, payload, cancel_token)["resume_json"]
+    check(cancel_token)
+    questions = run_generate(
+        store, job_id,
+        {"resume_json": resume_json, "jd_text": payload["jd_text"], "fresh": payload.get("fresh", False)},
+        cancel_token,
+    )["questions"]
+    chunks = [
+        {"focus_skill": q["focus_skill"], "claims": [{"claim_text": r["claim"]} for r in q["results"]]}
+        for q in questions
+    ]
+    run_id = _pipeline().run_id_for(resume_json, payload["jd_text"])
+    audit_data = run_audit(
+        store, job_id, {"chunks": chunks, "jd_text": payload["jd_text"], "run_id": run_id}, cancel_token
+    )["audit_data"]
+    export_finished_run(run_id, resume_json.get("resume_id", ""))
+    return {"resume_json": resume_json, "questions": questions, "audit_data": audit_data}
+
+
+HANDLERS = {
+    "parse": run_parse,
+    "generate": run_generate,
+    "audit": run_audit,
+    "docket": run_docket,
+}
+
+
+class JobWorkerPool:
+    def __init__(self, store, workers: int = 2, poll_interval: float = 1.0):
+        self.store = store
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads = []
+        self._tokens = {}  # job_id -> CancelToken for jobs currently running
+        self._tokens_lock = threading.Lock()
+
+    def start(self):
+        requeued = self.store.requeue_running()
+        if requeued:
+            print(f"Re-queued {requeued} interrupted job(s)")
+        threading.Thread(target=_pipeline, name="job-preload", daemon=True).start()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._loop, name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self):
+        self._stop.set()
+        with self.store.changed:
+            self.store.changed.notify_all()
+        for t in self._threads:
+            t.join(timeout=5)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job. Running jobs have their LLM work aborted."""
+        cancelled = self.store.cancel(job_id)
+        with self._tokens_lock:
+            token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel(f"job {job_id} cancelled")
+        return cancelled
+
+    def _loop(self):
+        while not self._stop.is_set():
+            job = self.store.claim_next()
+            if job is None:
+                with self.store.changed:
+                    self.store.changed.wait(self.poll_interval)
+                continue
+            self.run_job(*job)
+
+    def run_job(self, job_id, kind, payload):
+        handler = HANDLERS.get(kind)
+        if handler is None:
+            self.store.fail(job_id, f"Unknown job kind: {kind}")
+            return
+        print(f"Running {kind} job {job_id}")
+        token = CancelToken()
+        with self._tokens_lock:
+            self._tokens[job_id] = token
+        try:
+            result = handler(self.store, job_id, payload, token)
+            self.store.finish(job_id, result)
+        except Cancelled:
+            self.store.add_event(job_id, "cancelled", {"reason": token.reason})
+        except Exception as e:
+            traceback.print_exc()
+            self.store.add_event(job_id, "error", {"message": str(e)})
+            self.store.fail(job_id, str(e))
+        finally:
+            with self._tokens_lock:
+                self._tokens.pop(job_id, None)
@@ -0,0 +1,241 @@
+'''
+llm_client.py: Process-wide Groq client with per-model rate limiting
+- one keep-alive HTTP pool for every stage (chunker, extractor, scorer, auditor)
+- token buckets per model for requests/min and tokens/min, so bursts queue instead of 429-ing
+- 429s honour retry-after and pause every caller of that model, 5xx get jittered backoff
+- identical concurrent requests are coalesced into one (see core/singleflight.py)
+- LLM_BACKEND="ollama" sends the same calls to the local Ollama hosts instead, with the
+  response_format schema as Ollama's `format` (no WAN, no Groq key needed)
+'''
+import concurrent.futures
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+
+from core.singleflight import LLM_FLIGHTS, request_key
+from core.cancellation import Cancelled, check, count_cancelled
+from config.settings import (
+    API_KEY,
+    LLM_BACKEND,
+    LOCAL_LLM_MODEL,
+    GROQ_RATE_LIMITS,
+    GROQ_DEFAULT_RATE_LIMIT,
+    GROQ_MAX_RETRIES,
+    GROQ_MAX_CONNECTIONS,
+    GROQ_TIMEOUT,
+)
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `per_minute / 60` per second."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if it already is)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)  # oversized requests just wait for a full bucket
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        """Correct an estimate after the fact, may go into debt."""
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class ModelLimiter:
+    """Requests/min + tokens/min buckets for one model, plus a shared pause after a 429."""
+
+    def __init__(self, rpm: float, tpm: float):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = max(
+                    self.blocked_until - now,
+                    self.requests.wait_time(1, now),
+                    self.tokens.wait_time(estimated_tokens, now),
+                )
+                if wait <= 0:
+                    self.requests.take(1)
+                    self.tokens.take(estimated_tokens)
+                    return
+            time.sleep(min(wait, 5.0))
+
+    def pause(self, seconds: float):
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        with self.lock:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+
+
+_client = None
+_limiters = {}
+_lock = threading.Lock()
+
+
+def get_groq_client():
+    """Shared Groq client. Retries are handled here, not by the SDK, so they respect the buckets."""
+    global _client
+    with _lock:
+        if _client is None:
+            # groq + httpx are imported with the first call, not when the module loads
+            import httpx
+            from groq import Groq
+
+            http_client = httpx.Client(
+                timeout=GROQ_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=GROQ_MAX_CONNECTIONS,
+                    max_keepalive_connections=GROQ_MAX_CONNECTIONS,
+                ),
+            )
+            _client = Groq(api_key=API_KEY, http_client=http_client, max_retries=0)
+        return _client
+
+
+def get_limiter(model: str) -> ModelLimiter:
+    with _lock:
+        if model not in _limiters:
+            limits = GROQ_RATE_LIMITS.get(model, GROQ_DEFAULT_RATE_LIMIT)
+            _limiters[model] = ModelLimiter(limits["rpm"], limits["tpm"])
+        return _limiters[model]
+
+
+def estimate_tokens(messages: list, max_tokens: int = None) -> int:
+    """Rough count (~4 chars/token) of prompt tokens plus the output budget."""
+    prompt_tokens = sum(len(m.get("content") or "") for m in messages) // 4
+    return prompt_tokens + (max_tokens or 1024)
+
+
+def _retry_after(error):
+    """Seconds from the retry-after header, if Groq sent one."""
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt: int) -> float:
+    return min(30.0, (2 ** attempt)) * (0.5 + random.random() / 2)
+
+
+# runs calls that carry a cancel token, so the caller can walk away from them
+_abandonable = concurrent.futures.ThreadPoolExecutor(max_workers=GROQ_MAX_CONNECTIONS, thread_name_prefix="groq")
+
+
+def chat_completion(model: str, messages: list, cancel_token=None, **kwargs):
+    """
+    Drop-in for client.chat.completions.create(model=..., messages=..., ...)
+    that waits for rate-limit budget and retries 429 / 5xx.
+    Concurrent calls with identical arguments share a single request.
+    With a cancel_token, the caller stops waiting as soon as its run is cancelled
+    (the shared request may still finish for other callers, its result is dropped here).
+    With LLM_BACKEND="ollama" the call goes to the local Ollama hosts, same return shape.
+    """
+    if LLM_BACKEND == "ollama":
+        key = request_key("ollama-chat", LOCAL_LLM_MODEL, messages, kwargs)
+        call = lambda: LLM_FLIGHTS.do(key, lambda: _ollama_chat_completion(messages, **kwargs))
+    else:
+        key = request_key("groq", model, messages, kwargs)
+        call = lambda: LLM_FLIGHTS.do(key, lambda: _chat_completion(model, messages, **kwargs))
+    if cancel_token is None:
+        return call()
+
+    check(cancel_token)
+    future = _abandonable.submit(call)
+    while True:
+        try:
+            return future.result(timeout=0.25)
+        except concurrent.futures.TimeoutError:
+            if cancel_token.cancelled:
+                count_cancelled("groq_abandoned")
+                raise Cancelled(cancel_token.reason)
+
+
+def _chat_completion(model: str, messages: list, **kwargs):
+    from groq import RateLimitError, APIStatusError, APIConnectionError
+
+    limiter = get_limiter(model)
+    estimated = estimate_tokens(messages, kwargs.get("max_tokens"))
+
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        limiter.acquire(estimated)
+        try:
+            response = get_groq_client().chat.completions.create(model=model, messages=messages, **kwargs)
+        except RateLimitError as e:
+            if attempt == GROQ_MAX_RETRIES:
+                raise
+            wait = _retry_after(e) or _backoff(attempt)
+            print(f"⏳ Groq rate limit on {model}, retrying in {wait:.1f}s")
+            limiter.pause(wait)
+            continue
+        except (APIConnectionError, APIStatusError) as e:
+            status = getattr(e, "status_code", None)
+            if attempt == GROQ_MAX_RETRIES or (status is not None and status < 500):
+                raise
+            wait = _backoff(attempt)
+            print(f"⚠️ Groq error on {model} ({status or 'connection'}), retrying in {wait:.1f}s")
+            time.sleep(wait)
+            continue
+
+        usage = getattr(response, "usage", None)
+        if usage is not None and getattr(usage, "total_tokens", None):
+            limiter.reconcile(estimated, usage.total_tokens)
+        return response
+
+
+def _ollama_format(response_format):
+    """Groq/OpenAI response_format -> Ollama `format` (a JSON schema, "json" or None)."""
+    if not response_format:
+        return None
+    if response_format.get("type") == "json_schema":
+        return response_format["json_schema"]["schema"]
+    if response_format.get("type") == "json_object":
+        return "json"
+    return None
+
+
+def _ollama_chat_completion(messages: list, **kwargs):
+    """Local stand-in for _chat_completion, returns the fields callers read off a Groq response."""
+    from core.question_engine.llm_utils import chat_llm
+
+    options = {}
+    if kwargs.get("temperature") is not None:
+        options["temperature"] = kwargs["temperature"]
+    if kwargs.get("max_tokens"):
+        options["num_predict"] = kwargs["max_tokens"]
+    reply = chat_llm(messages, format=_ollama_format(kwargs.get("response_format")), options=options, model=LOCAL_LLM_MODEL)
+
+    prompt_tokens = reply.get("prompt_eval_count", 0)
+    completion_tokens = reply.get("eval_count", 0)
+    return SimpleNamespace(
+        model=reply.get("model", LOCAL_LLM_MODEL),
+        choices=[SimpleNamespace(message=SimpleNamespace(content=reply.get("message", {}).get("content", "")))],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        ),
+    )
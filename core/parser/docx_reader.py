@@ -0,0 +1,57 @@
+'''
+docx_reader.py: Stream text lines out of a .docx without converting it to PDF
+- reads word/document.xml straight from the zip (path or file-like, no temp files)
+- iterparse + clearing each finished paragraph keeps memory flat on long documents
+- list items (paragraphs with numbering) come out as "• ..." so the section parsers see
+  the same bullets they get from pdfplumber
+- output matches extract_text_from_pdf: stripped, non-empty lines
+'''
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PARAGRAPH = f"{_W}p"
+_TEXT = f"{_W}t"
+_TAB = f"{_W}tab"
+_BREAKS = (f"{_W}br", f"{_W}cr")
+_NUMBERING = f"{_W}numPr"
+
+
+def _paragraph_text(paragraph) -> str:
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == _TEXT and node.text:
+            parts.append(node.text)
+        elif node.tag == _TAB:
+            parts.append(" ")
+        elif node.tag in _BREAKS:
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _is_list_item(paragraph) -> bool:
+    return any(node.tag == _NUMBERING for node in paragraph.iter())
+
+
+def iter_docx_lines(source):
+    """
+    Yield the document's lines in reading order (body paragraphs, table cells, text boxes).
+    :param source: path or binary file-like object of a .docx
+    """
+    with zipfile.ZipFile(source) as package:
+        with package.open("word/document.xml") as xml:
+            for _, element in iterparse(xml, events=("end",)):
+                if element.tag != _PARAGRAPH:
+                    continue
+                bullet = "• " if _is_list_item(element) else ""
+                for line in _paragraph_text(element).splitlines():
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if bullet and not line.startswith(("•", "-", "–")):
+                        line = bullet + line
+                    bullet = ""  # only the first line of a list item starts a bullet
+                    yield line
+                # nested paragraphs (text boxes) are cleared before their parent ends,
+                # so nothing is yielded twice
+                element.clear()
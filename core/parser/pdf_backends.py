@@ -0,0 +1,72 @@
+'''
+pdf_backends.py: Interchangeable PDF text-extraction backends
+- "pdfplumber" (default): per-character layout analysis, slowest, the reference output
+- "pdfium": PDFium's text layer via pypdfium2 (already installed with pdfplumber), no layout pass
+- "pypdf": pure-Python, only if the optional `pypdf` package is installed
+Every backend returns the page texts; extract_pdf_lines() turns them into the stripped,
+non-empty lines the section parsers expect. The backend name ends up in
+Metadata.parser_version, see resume_parser.parse_resume_to_dict.
+'''
+PDF_BACKENDS = {}
+
+
+def register_backend(name: str):
+    """Decorator: register fn(source) -> list of page texts. source is a path or binary file-like."""
+    def decorator(fn):
+        PDF_BACKENDS[name] = fn
+        return fn
+    return decorator
+
+
+@register_backend("pdfplumber")
+def _pdfplumber_pages(source) -> list:
+    import pdfplumber  # heavy (pdfminer), only pay for it when a PDF is actually parsed
+
+    with pdfplumber.open(source) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+@register_backend("pdfium")
+def _pdfium_pages(source) -> list:
+    import pypdfium2 as pdfium
+
+    if hasattr(source, "read"):
+        source = source.read()  # pdfium keeps a reference to the buffer, hand it plain bytes
+    elif not isinstance(source, bytes):
+        source = str(source)
+    pdf = pdfium.PdfDocument(source)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_bounded())
+            textpage.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+@register_backend("pypdf")
+def _pypdf_pages(source) -> list:
+    try:
+        from pypdf import PdfReader
+    except ImportError as e:
+        raise ImportError("The 'pypdf' PDF backend needs `pip install pypdf`") from e
+
+    return [page.extract_text() or "" for page in PdfReader(source).pages]
+
+
+def available_backends() -> list:
+    """Registered backends whose dependencies are importable."""
+    import importlib.util
+
+    modules = {"pdfplumber": "pdfplumber", "pdfium": "pypdfium2", "pypdf": "pypdf"}
+    return [name for name in PDF_BACKENDS if importlib.util.find_spec(modules.get(name, name)) is not None]
+
+
+def extract_pdf_lines(source, backend: str = "pdfplumber") -> list[str]:
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{backend}', expected one of {sorted(PDF_BACKENDS)}")
+    text = "\n".join(PDF_BACKENDS[backend](source))
+    return [l.strip() for l in text.splitlines() if l.strip()]
@@ -4,13 +4,17 @@ resume_parser.py: store the resume parsing logic in this file.
 - Output: structured JSON, sotred under data/resume/parsed
 '''
 
+import io
 import json
 import re
 from pathlib import Path
 from datetime import datetime
-import pdfplumber
 
 from core.parser.schema import Resume, Skills, Experience, Project, Metadata
+from core.parser.docx_reader import iter_docx_lines
+from core.parser.pdf_backends import extract_pdf_lines
+from config.settings import PDF_BACKEND
+from core.artifacts import get_artifact_store
 
 DATE_PATTERN = r"""
 (
@@ -71,14 +75,20 @@ PARSED_DIR = Path("data/resumes/parsed")
 PARSER_VERSION = "latex-template-v1" # u can change this to keep track of different runs on the same resume 
 
 
-def extract_text_from_pdf(pdf_path: Path) -> list[str]:
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            t = page.extract_text()
-            if t:
-                text += t + "\n"
-    return [l.strip() for l in text.splitlines() if l.strip()]
+def extract_text_from_pdf(pdf_path, backend: str = None) -> list[str]:
+    """pdf_path: path or binary file-like object. backend: see core/parser/pdf_backends.py."""
+    return extract_pdf_lines(pdf_path, backend or PDF_BACKEND)
+
+
+def extract_lines(source, suffix: str, pdf_backend: str = None) -> tuple:
+    """
+    Text lines of a resume, by file type. source: path or binary file-like object.
+    Returns (lines, reader), reader is "docx" or the PDF backend that was used.
+    """
+    if suffix == ".docx":
+        return list(iter_docx_lines(source)), "docx"
+    backend = pdf_backend or PDF_BACKEND
+    return extract_text_from_pdf(source, backend), backend
 
 
 # ---------------- SECTION SPLITTING ----------------
@@ -496,11 +506,13 @@ def parse_projects_ai_soln(lines):
 
 # ---------------- MAIN ----------------
 
-def parse_resume(resume_id: str):
+def parse_resume(resume_id: str, pdf_backend: str = None):
     pdf_path = RAW_DIR / f"{resume_id}.pdf"
+    if not pdf_path.exists() and (RAW_DIR / f"{resume_id}.docx").exists():
+        pdf_path = RAW_DIR / f"{resume_id}.docx"
     out_path = PARSED_DIR / f"{resume_id}.json"
 
-    lines = extract_text_from_pdf(pdf_path)
+    lines, reader = extract_lines(pdf_path, pdf_path.suffix.lower(), pdf_backend)
     sections = split_by_sections(lines)
     print("SECTIONS FOUND:", sections.keys())
 
@@ -508,7 +520,7 @@ def parse_resume(resume_id: str):
         resume_id=resume_id,
         metadata=Metadata(
             parsed_at=datetime.utcnow().isoformat(),
-            parser_version=PARSER_VERSION
+            parser_version=f"{PARSER_VERSION}+{reader}"
         ),
         education=[],                     # explicitly ignored
         skills=parse_skills(sections.get("skills", [])),
@@ -519,23 +531,29 @@ def parse_resume(resume_id: str):
     PARSED_DIR.mkdir(parents=True, exist_ok=True)
     with open(out_path, "w") as f:
         json.dump(resume.model_dump(), f, indent=2) #apparently dict() is outdated
+    get_artifact_store().put("resume", resume.model_dump())  # latest resume for config.utils.load_parsed_resume
 
     return out_path
 
 
-def parse_resume_to_dict(pdf_path: Path) -> dict:
+def parse_resume_to_dict(source, pdf_backend: str = None) -> dict:
     """
-    Parse a resume from a file path and return the dictionary directly.
-    Does NOT write to disk.
+    Parse a resume and return the dictionary directly.
+    source: a .pdf/.docx path, or an upload (file-like with .name, e.g. Streamlit's UploadedFile),
+    which is read in memory. Does NOT write to disk.
+    pdf_backend: overrides PDF_BACKEND for this call, recorded in metadata.parser_version.
     """
-    lines = extract_text_from_pdf(pdf_path)
+    name = Path(str(getattr(source, "name", source)))
+    if hasattr(source, "getvalue"):
+        source = io.BytesIO(source.getvalue())
+    lines, reader = extract_lines(source, name.suffix.lower(), pdf_backend)
     sections = split_by_sections(lines)
 
     resume = Resume(
-        resume_id=pdf_path.stem,
+        resume_id=name.stem,
         metadata=Metadata(
             parsed_at=datetime.utcnow().isoformat(),
-            parser_version=PARSER_VERSION
+            parser_version=f"{PARSER_VERSION}+{reader}"
         ),
         education=[],  # explicitly ignored
         skills=parse_skills(sections.get("skills", [])),
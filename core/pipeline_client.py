@@ -1,95 +1,321 @@
 import requests
-import tempfile
 import os
 import sys
-from pathlib import Path
+import hashlib
+import threading
+import concurrent.futures
+from collections import OrderedDict
 from core.chunker.chunker import AgenticChunker
 from core.question_engine.generator import generate_questions_from_chunks
 from core.parser.resume_parser import parse_resume_to_dict
-from core.audit.scorer import Scorer
+from core.audit.scorer import Scorer, bucket_jd_skills
 from core.audit.auditor import Auditor
 from core.chunker.skill_extractor import JDSkillExtractor
+from core.retrieval.retriever import select_claims, bucket_priorities
+from core.cancellation import Cancelled, CancelToken, check
+from core.checkpoint import RunCheckpoint
+from core.audit.schema import BucketItem
+from core.singleflight import SingleFlight
+from core.artifacts import get_artifact_store
+from core.retrieval.question_bank import index_result
 
 if sys.platform=="win32":
     os.environ["PYTHONIOENCODING"] = "utf-8"
 
+# JD skills + buckets per JD, computed before generation and reused by the audit
+_JD_ANALYSIS = OrderedDict()
+_JD_ANALYSIS_MAX = 32
+_jd_analysis_lock = threading.Lock()  # precompute threads, job workers and Streamlit threads share it
+# Generate joins a precompute (core/precompute.py) of the same JD / run instead of repeating it
+_JD_FLIGHTS = SingleFlight()
+_PREPARE_FLIGHTS = SingleFlight()
+# a shared flight runs here under its own token, callers only wait on it (see _shared_flight)
+_flight_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="prepare")
+_flight_tokens = {}  # flight key -> {"token": CancelToken the shared work runs under, "waiting": callers}
+_flight_lock = threading.Lock()
+
+
+def _jd_key(jd_text: str) -> str:
+    return hashlib.sha256(jd_text.strip().encode("utf-8")).hexdigest()
+
+
+def _shared_flight(flights, key, fn, cancel_token=None):
+    """
+    flights.do(key, fn) for work that takes a cancel token: fn(token) runs under a token owned
+    by the flight, never a caller's. Each caller stops waiting as soon as its own token is
+    cancelled (like llm_client.chat_completion), so cancelling one run can't fail another run
+    that joined the same flight. The shared work is only cancelled once every caller waiting
+    on it has been.
+    """
+    check(cancel_token)
+    with _flight_lock:
+        entry = _flight_tokens.get(key)
+        if entry is None:
+            entry = _flight_tokens[key] = {"token": CancelToken(counted=False), "waiting": 0}
+        entry["waiting"] += 1
+    try:
+        while True:
+            future = _flight_pool.submit(flights.do, key, lambda: fn(entry["token"]))
+            try:
+                return _wait(future, cancel_token)
+            except Cancelled:
+                if cancel_token is not None and cancel_token.cancelled:
+                    raise
+                # joined a flight every earlier caller had given up on, run it again for this one
+    finally:
+        with _flight_lock:
+            entry["waiting"] -= 1
+            if entry["waiting"] == 0:
+                if _flight_tokens.get(key) is entry:
+                    del _flight_tokens[key]
+                if cancel_token is not None and cancel_token.cancelled:
+                    entry["token"].cancel("every run waiting on it was cancelled")
+
+
+def _wait(future, cancel_token):
+    if cancel_token is None:
+        return future.result()
+    while True:
+        try:
+            return future.result(timeout=0.25)
+        except concurrent.futures.TimeoutError:
+            check(cancel_token)
+
+
+def _remember_jd_analysis(jd_text, jd_skills, bucket_schema) -> dict:
+    analysis = {"jd_skills": jd_skills, "bucket_schema": bucket_schema}
+    key = _jd_key(jd_text)
+    with _jd_analysis_lock:
+        _JD_ANALYSIS[key] = analysis
+        _JD_ANALYSIS.move_to_end(key)
+        while len(_JD_ANALYSIS) > _JD_ANALYSIS_MAX:
+            _JD_ANALYSIS.popitem(last=False)
+    return analysis
+
+
+def _cached_jd_analysis(jd_text):
+    with _jd_analysis_lock:
+        return _cached_jd_analysis(jd_text)
+
+def analyze_jd(jd_text, cancel_token=None) -> dict:
+    """
+    JD skills + CORE/PREFERRED buckets, cached per JD.
+    Returns {"jd_skills": [...], "bucket_schema": [...]}.
+    """
+    cached = _cached_jd_analysis(jd_text)
+    if cached:
+        return cached
+
+    def run(token):
+        jd_skills = JDSkillExtractor().extract_skills(jd_text, cancel_token=token)
+        bucket_schema = bucket_jd_skills(jd_text, jd_skills, token)
+        return _remember_jd_analysis(jd_text, jd_skills, bucket_schema)
+
+    return _shared_flight(_JD_FLIGHTS, _jd_key(jd_text), run, cancel_token)
+
+
 def parse_resume_api(resume_file):
     """
-    Try to parse resume locally since backend is likely missing.
+    Parse the resume in-process. The job service (core/jobs) calls this from its workers too.
+    PDF or DOCX, picked by the upload's file name, parsed from memory.
     """
     try:
-        # Save uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(resume_file.getvalue())
-            tmp_path = Path(tmp.name)
-        
-        # Parse locally
-        resume_data = parse_resume_to_dict(tmp_path)
-        
-        # Cleanup
-        os.remove(tmp_path)
-        
-        return resume_data
+        resume_json = parse_resume_to_dict(resume_file)
+        get_artifact_store().put("resume", resume_json)
+        return resume_json
 
     except Exception as e:
         print(f"Local parsing failed: {e}")
         return None
 
 
-def generate_questions_local(resume_json, jd_text):
+def _checkpointed(questions_generator, checkpoint, cancel_token=None):
+    """
+    Pass results through, appending every finished claim to the run's checkpoint and
+    indexing its questions in the question bank (core/retrieval/question_bank.py, a failure
+    there is logged, not raised).
+    Only a run that got a result for every claim, and wasn't cancelled, marks the generation
+    stage done and stores its questions under the run ID. A partial set would replace the
+    run's complete one in the artifact store (latest wins).
+    """
+    questions = {}
+    finished, total = 0, None
+    try:
+        for chunk_id, skill, result, current, total in questions_generator:
+            if result.get("done", True):
+                finished += 1
+                questions.setdefault(chunk_id, {"focus_skill": skill, "results": []})["results"].append(result)
+                if result.get("claim_id"):
+                    checkpoint.save_claim(result["claim_id"], chunk_id, skill, result)
+                index_result(result, skill, run_id=checkpoint.run_id)
+            yield chunk_id, skill, result, current, total
+    finally:
+        questions_generator.close()  # propagate an early stop so the generator cancels its workers
+    if (cancel_token is not None and cancel_token.cancelled) or finished != total:
+        print(f"Generation incomplete ({finished}/{total} claims), questions not stored")
+        return
+    checkpoint.save_stage("generation", {"claims": len(checkpoint.claims)})
+    get_artifact_store().put("questions", list(questions.values()), run_id=checkpoint.run_id)
+
+
+def prepare_run(resume_json, jd_text, cancel_token=None):
+    """
+    Everything before question generation, checkpointed:
+    1. Chunk resume based on JD skills (AgenticChunker), bucket JD skills in parallel
+    2. Prune to the top claims per skill (select_claims)
+    Returns (checkpoint, chunks, bucket_schema), chunks is [] if the chunker found nothing.
+    Concurrent calls for the same run share one computation, cancelling one caller's token
+    doesn't cancel it for the others (_shared_flight).
+    The resume is also stored under the run ID, so the run's artifacts say whose docket it is.
+    """
+    run_id = RunCheckpoint.run_id_for(resume_json, jd_text)
+    get_artifact_store().put("resume", resume_json, run_id=run_id)
+    return _shared_flight(
+        _PREPARE_FLIGHTS, run_id, lambda token: _prepare(RunCheckpoint(run_id), resume_json, jd_text, token),
+        cancel_token,
+    )
+
+
+def _prepare(checkpoint, resume_json, jd_text, cancel_token):
+    print(f"Run ID: {checkpoint.run_id}")
+
+    if checkpoint.stage("chunks") is not None:
+        print("1. Restoring chunks from checkpoint...")
+        jd_skills = checkpoint.stage("jd_skills")
+        buckets = checkpoint.stage("buckets")
+        bucket_schema = [BucketItem.model_validate(b) for b in buckets] if buckets else None
+        if bucket_schema:
+            _remember_jd_analysis(jd_text, jd_skills, bucket_schema)
+        return checkpoint, checkpoint.stage("chunks"), bucket_schema
+
+    print("1. Chunking resume based on JD...")
+    chunker = AgenticChunker(resume_json)
+    cached = _cached_jd_analysis(jd_text)
+    if cached:
+        # JD already analysed (precompute or an earlier run), only chunking is left
+        jd_skills, bucket_schema = cached["jd_skills"], cached["bucket_schema"]
+        chunks = chunker.chunk_by_skills(
+            jd_text=jd_text, cancel_token=cancel_token, target_skills=jd_skills, run_id=checkpoint.run_id
+        )
+    else:
+        jd_skills = JDSkillExtractor().extract_skills(jd_text, cancel_token=cancel_token)
+
+        # Chunking + bucketing are independent Groq calls, run them side by side
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            chunks_future = pool.submit(
+                chunker.chunk_by_skills, jd_text=jd_text, cancel_token=cancel_token, target_skills=jd_skills,
+                run_id=checkpoint.run_id,
+            )
+            buckets_future = pool.submit(bucket_jd_skills, jd_text, jd_skills, cancel_token)
+            chunks = chunks_future.result()
+            try:
+                bucket_schema = buckets_future.result()
+                _remember_jd_analysis(jd_text, jd_skills, bucket_schema)
+            except Cancelled:
+                raise
+            except Exception as e:
+                # priority is an optimisation, generation still works in chunk order
+                print(f"Bucketing failed, generating without priorities: {e}")
+                bucket_schema = None
+
+    if not chunks:
+        print("No chunks generated")
+        return checkpoint, [], bucket_schema
+
+    print(f"Generated {len(chunks)} chunks. Selecting claims...")
+
+    # 2. Claim selection, bounds generation time on long resumes
+    chunks = select_claims(chunks)
+
+    checkpoint.save_stage("jd_skills", jd_skills)
+    if bucket_schema:
+        checkpoint.save_stage("buckets", [b.model_dump() for b in bucket_schema])
+    checkpoint.save_stage("chunks", chunks)
+    return checkpoint, chunks, bucket_schema
+
+
+def generate_questions_local(resume_json, jd_text, cancel_token=None, fresh: bool = False):
     """
     Local implementation of question generation pipeline.
-    1. Chunk resume based on JD skills (AgenticChunker)
-    2. Generate questions for each chunk (QuestionGenerator)
+    1-2. prepare_run(): chunking, bucketing, claim selection (usually already done by the precompute)
+    3. Generate questions for each chunk (QuestionGenerator), CORE buckets first
+
+    Every stage and finished claim is checkpointed (core/checkpoint.py). Re-running with
+    the same resume + JD skips the Groq stages and every claim that already finished,
+    unless fresh=True, which discards the run's checkpoint first.
     """
     
     try:
         print("Starting local question generation...")
-        # 1. Chunking
-        print("1. Chunking resume based on JD...")
-        chunker = AgenticChunker(resume_json)
-        chunks = chunker.chunk_by_skills(jd_text=jd_text)
-        
+        if fresh:
+            RunCheckpoint(run_id_for(resume_json, jd_text)).discard()
+        checkpoint, chunks, bucket_schema = prepare_run(resume_json, jd_text, cancel_token=cancel_token)
         if not chunks:
-            print("No chunks generated")
             return []
-        
-        print(f"Generated {len(chunks)} chunks. Starting question generation...")
 
-        # 2. Question Generation
+        # 3. Question Generation
         # chunks is a list of dicts
         # Return the generator directly
-        return generate_questions_from_chunks(chunks)
+        return _checkpointed(
+            generate_questions_from_chunks(
+                chunks,
+                cancel_token=cancel_token,
+                skill_priority=bucket_priorities(bucket_schema),
+                completed_results=checkpoint.completed_results(),
+            ),
+            checkpoint,
+            cancel_token,
+        )
 
+    except Cancelled:
+        print("Question generation cancelled before generation started")
+        return None
     except Exception as e:
         print(f"Error in local question generation: {e}")
         return None
 
 
-def run_audit_pipeline(chunks, jd_text):
+def run_id_for(resume_json, jd_text) -> str:
+    """Run ID of generate_questions_local(resume_json, jd_text), for keying artifacts of the same run."""
+    return RunCheckpoint.run_id_for(resume_json, jd_text)
+
+
+def run_audit_pipeline(chunks, jd_text, cancel_token=None, run_id: str = ""):
     """
     Runs the Grounded Auditor pipeline.
+    The result is stored in the artifact store, under run_id when given.
     """
     try:
         print("Starting Auditor Pipeline...")
-        # Extract skills for Taxonomy mapping
-        extractor = JDSkillExtractor()
-        jd_skills = extractor.extract_skills(jd_text)
+        # Reuse the skills/buckets computed before generation when we have them
+        cached = _cached_jd_analysis(jd_text)
+        if cached:
+            jd_skills, bucket_schema = cached["jd_skills"], cached["bucket_schema"]
+        else:
+            # Extract skills for Taxonomy mapping
+            extractor = JDSkillExtractor()
+            jd_skills = extractor.extract_skills(jd_text, cancel_token=cancel_token)
+            bucket_schema = None
         
         # Scoring
-        scorer = Scorer(chunks, jd_skills, jd_text)
+        scorer = Scorer(chunks, jd_skills, jd_text, cancel_token=cancel_token, bucket_schema=bucket_schema)
         scores = scorer.compute_scores()
         
         # LLM Audit
         auditor = Auditor(scores)
-        closure_report = auditor.generate_closure()
+        closure_report = auditor.generate_closure(cancel_token=cancel_token)
         
         # Return structured data
-        return {
+        audit_data = {
             "scores": scores,
             "report": closure_report
         }
+        get_artifact_store().put("audit", audit_data, run_id=run_id)
+        return audit_data
         
+    except Cancelled:
+        print("Audit pipeline cancelled")
+        return None
     except Exception as e:
         print(f"Audit pipeline failed: {e}")
         return None
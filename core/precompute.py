@@ -0,0 +1,164 @@
+'''
+precompute.py: Speculative work started while the interviewer is still filling in the sidebar
+- resume parsing starts as soon as a file is uploaded
+- JD skills + buckets start once the JD text has been unchanged for JD_DEBOUNCE_SECONDS
+- once both are there, chunking + claim selection run too (pipeline_client.prepare_run)
+- everything is keyed by content hash, so Generate picks up finished (or in-flight) work and
+  mostly only starts the Ollama stage
+- the Ollama model is warmed (and the question prompt prefix prefilled) once per process
+'''
+import hashlib
+import importlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from config.settings import JD_DEBOUNCE_SECONDS
+from core.question_engine.llm_utils import warm_model
+from core.question_engine.templates import QUESTION_SYSTEM_PROMPT
+
+
+def _pipeline():
+    """core.pipeline_client is heavy (groq, pdfplumber, pydantic schemas), load it off the UI thread."""
+    return importlib.import_module("core.pipeline_client")
+
+
+def _hash(data) -> str:
+    if isinstance(data, str):
+        data = data.strip().encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class Precomputer:
+    def __init__(self, max_entries: int = 32, debounce: float = JD_DEBOUNCE_SECONDS):
+        # docket tasks wait on parse/JD tasks, so they get their own executor (no pool starvation)
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="precompute")
+        self._docket_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="precompute-docket")
+        self._lock = threading.Lock()
+        self._tasks = OrderedDict()  # content key -> Future
+        self._owners = OrderedDict() # session key -> {"jd": hash, "stable": bool, "timer": Timer, "resume": file}
+        self.max_entries = max_entries
+        self.debounce = debounce
+        self.stats = {"started": 0, "reused": 0}
+        self._warm = None  # warm() future, kept outside _tasks so eviction can't make it run twice
+
+    def _submit(self, key: str, fn, executor=None) -> Future:
+        with self._lock:
+            future = self._tasks.get(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._tasks.move_to_end(key)
+                self.stats["reused"] += 1
+                return future
+            future = (executor or self._executor).submit(fn)
+            self._tasks[key] = future
+            self.stats["started"] += 1
+            for old_key in list(self._tasks):
+                if len(self._tasks) <= self.max_entries:
+                    break
+                if self._tasks[old_key].done():
+                    del self._tasks[old_key]
+            return future
+
+    def warm(self) -> Future:
+        """
+        Load the Ollama model, prefill the question prompt's fixed prefix and import the
+        pipeline in the background, once per process. Cheap to call on every rerun.
+        """
+        with self._lock:
+            if self._warm is None:
+                self._executor.submit(_pipeline)
+                self._warm = self._executor.submit(warm_model, system=QUESTION_SYSTEM_PROMPT)
+            return self._warm
+
+    def resume(self, resume_file) -> Future:
+        """Future of parse_resume_api(resume_file), shared by every upload of the same bytes."""
+        return self._submit(f"resume:{_hash(resume_file.getvalue())}", lambda: _pipeline().parse_resume_api(resume_file))
+
+    def jd(self, jd_text: str) -> Future:
+        """Future of analyze_jd(jd_text)."""
+        return self._submit(f"jd:{_hash(jd_text)}", lambda: _pipeline().analyze_jd(jd_text))
+
+    def docket(self, resume_file, jd_text: str) -> Future:
+        """Future of prepare_run() for this resume + JD, i.e. every Groq stage of the docket."""
+        resume_future = self.resume(resume_file)
+        jd_future = self.jd(jd_text)
+
+        def run():
+            resume_json = resume_future.result()
+            if resume_json is None:
+                return None
+            try:
+                jd_future.result()
+            except Exception as e:
+                print(f"Precompute: JD analysis failed ({e}), chunking without it")
+            return _pipeline().prepare_run(resume_json, jd_text)
+
+        key = f"docket:{_hash(resume_file.getvalue())}:{_hash(jd_text)}"
+        return self._submit(key, run, executor=self._docket_executor)
+
+    def observe(self, owner: str, resume_file, jd_text: str):
+        """
+        Called on every UI rerun with the current sidebar inputs.
+        Parsing starts right away; JD work waits until the JD stops changing.
+        """
+        if resume_file is not None:
+            self.resume(resume_file)
+        if not jd_text or not jd_text.strip():
+            return
+
+        jd_hash = _hash(jd_text)
+        with self._lock:
+            state = self._owners.get(owner)
+            if state is not None and state["jd"] == jd_hash:
+                stable = state["stable"]
+            else:
+                if state is not None:
+                    state["timer"].cancel()
+                timer = threading.Timer(self.debounce, self._jd_settled, args=(owner, jd_hash, jd_text))
+                timer.daemon = True
+                self._owners.pop(owner, None)
+                self._owners[owner] = state = {"jd": jd_hash, "stable": False, "timer": timer, "resume": resume_file}
+                # sessions that went away never call forget(), keep only the most recent ones
+                while len(self._owners) > self.max_entries:
+                    _, oldest = self._owners.popitem(last=False)
+                    oldest["timer"].cancel()
+                timer.start()
+                return
+            state["resume"] = resume_file
+        if stable and resume_file is not None:
+            self.docket(resume_file, jd_text)
+
+    def forget(self, owner: str):
+        """Drop a session's inputs (and its uploaded file) once its docket has been submitted."""
+        with self._lock:
+            state = self._owners.pop(owner, None)
+        if state is not None:
+            state["timer"].cancel()
+
+    def _jd_settled(self, owner: str, jd_hash: str, jd_text: str):
+        with self._lock:
+            state = self._owners.get(owner)
+            if state is None or state["jd"] != jd_hash:
+                return  # edited again in the meantime
+            state["stable"] = True
+            resume_file = state["resume"]
+        if resume_file is not None:
+            self.docket(resume_file, jd_text)
+        else:
+            self.jd(jd_text)
+
+
+_precomputer = None
+_precomputer_lock = threading.Lock()
+
+
+def get_precomputer() -> Precomputer:
+    """
+    Process-wide Precomputer, shared by every Streamlit session. Getting it starts no work,
+    call warm() to load the model and the pipeline (repeat calls reuse the first one).
+    """
+    global _precomputer
+    with _precomputer_lock:
+        if _precomputer is None:
+            _precomputer = Precomputer()
+        return _precomputer
@@ -1,69 +1,123 @@
-from core.question_engine.llm_utils import call_llm
+from core.question_engine.llm_utils import call_llm, stream_llm
 from core.question_engine.classifier import classify_claim
+from core.question_engine.logic import select_slots
 from core.question_engine.dedup import deduplicate_by_level
+from core.question_engine.json_repair import extract_json, as_question_list, StreamingObjectParser
+from core.question_engine.schema import question_list_schema
+from core.question_engine.templates import QUESTION_SYSTEM_PROMPT, question_user_prompt
 import json
+import threading
 
-def generate_questions(claim: str):
-    claim_type = classify_claim(claim)
-
-    prompt = f"""
-You are a technical interviewer.
-
-CLAIM:
-{claim}
-
-CLAIM TYPE:
-{claim_type}
-
-Generate interview questions with STRICTLY DIFFERENT INTENTS.
-
-You MUST generate exactly ONE question for each slot below.
-DO NOT repeat meaning across questions.
-
-Slots and constraints:
-
-1. clarification
-- Ask to clarify scope, responsibility, or vague wording
-- DO NOT ask about design or decisions
-
-2. base_overview
-- Ask what was built and how it works at a high level
-
-3. base_dataflow
-- Ask about data flow or system components
+# how each generation's JSON was recovered: parsed cleanly, repaired locally, needed a retry, or lost
+GENERATION_STATS = {"parsed": 0, "repaired": 0, "retried": 0, "failed": 0}
+_stats_lock = threading.Lock()
 
-4. depth_tradeoff
-- Ask WHY design choices were made and trade-offs
 
-5. depth_failure
-- Ask about failure cases or limitations
+def _count(outcome: str):
+    with _stats_lock:
+        GENERATION_STATS[outcome] += 1
 
-6. follow_up_example
-- Ask for a concrete real-world example
 
-7. challenge_hypothetical
-- Introduce a NEW scenario not mentioned in the claim
+def get_generation_stats() -> dict:
+    with _stats_lock:
+        return dict(GENERATION_STATS)
 
-Return output STRICTLY as JSON:
-[
-  {{ "level": "...", "question": "..." }}
-]
-"""
-    raw_text = call_llm(prompt)
 
+def parse_questions(raw_text: str) -> tuple:
+    """
+    Parse the slot list out of raw LLM text.
+    Returns (questions, outcome) where outcome is "parsed" or "repaired".
+    Raises ValueError if even the tolerant parser gives up.
+    """
     try:
-        raw_questions = json.loads(raw_text)
-    except json.JSONDecodeError:
-        # Fallback or simple error handling
-        # For now, let's just return empty list or re-raise
-        # Ideally we might retry or log
-        raise ValueError("LLM did not return valid JSON")
-
-    questions = deduplicate_by_level(raw_questions)
-
-
+        questions = as_question_list(json.loads(raw_text))
+        if questions:
+            return questions, "parsed"
+    except (json.JSONDecodeError, ValueError):
+        pass
+    questions = as_question_list(extract_json(raw_text))
+    if not questions:
+        raise ValueError("LLM JSON contained no usable questions")
+    return questions, "repaired"
+
+def build_question_prompt(claim: str, claim_type: str, slots: list = None) -> tuple:
+    """
+    (system, prompt) for one claim. The system part is the same for every claim, so the
+    local server prefills it once and only evaluates the short per-claim prompt.
+    slots: the slots to ask for (logic.select_slots), all seven if None.
+    """
+    return QUESTION_SYSTEM_PROMPT, question_user_prompt(claim, claim_type, slots)
+
+
+def _result(claim: str, claim_type: str, raw_questions: list, done: bool = True) -> dict:
     return {
         "claim": claim,
         "claim_type": claim_type,
-        "questions": questions
+        "questions": deduplicate_by_level(raw_questions),
+        "done": done,
     }
+
+
+def generate_questions(claim: str, cancel_token=None):
+    claim_type = classify_claim(claim)
+    slots = select_slots(claim, claim_type)
+    system, prompt = build_question_prompt(claim, claim_type, slots)
+    schema = question_list_schema(len(slots), slots)
+    raw_text = call_llm(prompt, system=system, format=schema, cancel_token=cancel_token)
+
+    # local repair first, a retry costs a whole extra generation
+    try:
+        raw_questions, outcome = parse_questions(raw_text)
+    except ValueError:
+        try:
+            raw_questions, _ = parse_questions(call_llm(prompt, system=system, format=schema, cancel_token=cancel_token))
+            outcome = "retried"
+        except ValueError:
+            _count("failed")
+            raise ValueError("LLM did not return valid JSON")
+    _count(outcome)
+
+    return _result(claim, claim_type, raw_questions)
+
+
+def stream_questions(claim: str, cancel_token=None, avoid_hosts=(), on_host=None, slots: list = None):
+    """
+    Streaming variant of generate_questions.
+    Yields a partial result every time a {level, question} object closes in the
+    token stream, then a final result with done=True.
+    avoid_hosts / on_host are passed to stream_llm (used by hedged requests).
+    slots: already chosen by the caller (a hedged claim picks them once for both attempts,
+    so the slot policy stats count it once), logic.select_slots if None.
+    """
+    claim_type = classify_claim(claim)
+    if slots is None:
+        slots = select_slots(claim, claim_type)
+    system, prompt = build_question_prompt(claim, claim_type, slots)
+    schema = question_list_schema(len(slots), slots)
+
+    parser = StreamingObjectParser()
+    streamed = []
+    for fragment in stream_llm(prompt, system=system, format=schema, cancel_token=cancel_token, avoid_hosts=avoid_hosts, on_host=on_host):
+        new_questions = as_question_list(parser.feed(fragment))
+        if new_questions:
+            streamed.extend(new_questions)
+            yield _result(claim, claim_type, streamed, done=False)
+
+    # the stream is the happy path; fall back to the full-text parse + repair + retry chain
+    try:
+        raw_questions, outcome = parse_questions(parser.text)
+        if len(raw_questions) < len(streamed):
+            raw_questions = streamed
+    except ValueError:
+        if streamed:
+            raw_questions, outcome = streamed, "repaired"
+        else:
+            try:
+                raw_questions, _ = parse_questions(call_llm(prompt, system=system, format=schema, cancel_token=cancel_token))
+                outcome = "retried"
+            except ValueError:
+                _count("failed")
+                raise ValueError("LLM did not return valid JSON")
+    _count(outcome)
+
+    yield _result(claim, claim_type, raw_questions)
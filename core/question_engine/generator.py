@@ -2,54 +2,136 @@
 generator.py: Generate the final questions, send this to the frontend for display.
 '''
 
-from core.question_engine.engine import generate_questions
+import queue
+from core.question_engine.engine import get_generation_stats
+from core.question_engine.hedging import generate_hedged, get_hedge_stats
+from core.question_engine.logic import get_slot_stats
+from core.cancellation import CancelToken, Cancelled, count_cancelled, get_cancel_stats
+from core.retrieval.retriever import claim_priority
+from core.question_engine.llm_utils import get_ollama_pool
 
-def generate_questions_from_chunks(chunks: list):
+def generate_questions_from_chunks(
+    chunks: list,
+    cancel_token: CancelToken = None,
+    skill_priority: dict = None,
+    completed_results: dict = None,
+):
     """
     Takes a list of chunk dicts (from AgenticChunker),
     extracts claims, generates questions using the engine,
-    and returns a structured result.
-    """
-    output = []
+    and yields results as they stream in.
+
+    Yields (chunk_id, skill, result, completed, total). The same claim is yielded
+    several times while its questions are decoded, result["claim_id"] identifies it
+    and result["done"] marks the final version.
+
+    If cancel_token is cancelled (or the consumer stops iterating), queued claims are
+    dropped and running Ollama streams are aborted.
+
+    Claims that run past the recent p90 latency are hedged with a duplicate request on
+    another host, see hedging.py.
 
+    skill_priority (skill_id -> "CORE"/"PREFERRED", see retriever.bucket_priorities) decides
+    the order claims are started in: CORE + high relevance first, PREFERRED / weak claims last.
+
+    completed_results (claim_id -> final result, from a RunCheckpoint) are yielded straight
+    away and never sent to the LLM again.
+    """
     import concurrent.futures
 
+    cancel_token = cancel_token or CancelToken()
+
     # Flatten all claims first to make parallelization easier
     all_claims = []
     for chunk in chunks:
         skill = chunk.get("focus_skill", "Unknown")
         claims = chunk.get("claims", [])
-        for c in claims:
+        for idx, c in enumerate(claims):
             claim_text = c.get("claim_text")
             if claim_text:
                 all_claims.append({
                     "chunk_id": chunk.get("chunk_id"),
+                    "claim_id": f"{chunk.get('chunk_id')}:{idx}",
                     "skill": skill,
-                    "claim_text": claim_text
+                    "claim_text": claim_text,
+                    "priority": claim_priority(skill, c, skill_priority or {}),
                 })
 
     total_claims = len(all_claims)
-    print(f"Parallelizing generation for {total_claims} claims...")
-    
-    # Store results by chunk_id for re-assembly
-    results_by_chunk = {}
+    completed_results = completed_results or {}
+    restored = [item for item in all_claims if item["claim_id"] in completed_results]
+    all_claims = [item for item in all_claims if item["claim_id"] not in completed_results]
+    print(f"Parallelizing generation for {len(all_claims)} claims ({len(restored)} restored from checkpoint)...")
+
+    completed = 0
+    for item in restored:
+        completed += 1
+        yield (item["chunk_id"], item["skill"], completed_results[item["claim_id"]], completed, total_claims)
+
+    # workers push partial/final results here, the caller's thread drains it
+    events = queue.Queue()
 
     def process_claim(item):
+        if cancel_token.cancelled:
+            count_cancelled("claims_dropped")
+            events.put(("cancelled", item, None))
+            return
         print(f"Processing claim for {item['skill']}...")
-        result = generate_questions(item['claim_text'])
-        return item['chunk_id'], item['skill'], result
+        def on_partial(result):
+            result["claim_id"] = item["claim_id"]
+            events.put(("partial", item, result))
+
+        try:
+            result = generate_hedged(item['claim_text'], cancel_token, on_partial=on_partial)
+            result["claim_id"] = item["claim_id"]
+            events.put(("done", item, result))
+        except Cancelled:
+            events.put(("cancelled", item, None))
+        except Exception as e:
+            events.put(("error", item, e))
+
+    # workers pull from a priority queue instead of taking claims in chunk order
+    pending = queue.PriorityQueue()
+    for seq, item in enumerate(all_claims):
+        pending.put((item["priority"], seq, item))
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        futures = [executor.submit(process_claim, item) for item in all_claims]
-        
-        for i, future in enumerate(concurrent.futures.as_completed(futures)):
+    def worker():
+        while True:
             try:
-                chunk_id, skill, result = future.result()
-                print(f"Completed {i+1}/{total_claims} claims")
-                # Yield result PLUS progress info
-                yield (chunk_id, skill, result, i + 1, total_claims)
-            except Exception as e:
-                print(f"Error processing claim: {e}")
-
-    # No longer returning the full list at the end, as we are yielding
-    return
\ No newline at end of file
+                _, _, item = pending.get_nowait()
+            except queue.Empty:
+                return
+            process_claim(item)
+
+    # one worker per free slot across all healthy Ollama hosts, the pool balances them
+    max_workers = max(1, min(get_ollama_pool().capacity(), len(all_claims)))
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    for _ in range(max_workers):
+        executor.submit(worker)
+    try:
+        while completed < total_claims and not cancel_token.cancelled:
+            try:
+                kind, item, payload = events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if kind in ("error", "cancelled"):
+                completed += 1
+                if kind == "error":
+                    print(f"Error processing claim: {payload}")
+                continue
+            if kind == "done":
+                completed += 1
+                print(f"Completed {completed}/{total_claims} claims")
+            # Yield result PLUS progress info
+            yield (item["chunk_id"], item["skill"], payload, completed, total_claims)
+    finally:
+        # consumer went away (rerun, closed tab) or the run was superseded,
+        # workers drain what's left of the queue as dropped claims
+        if completed < total_claims:
+            cancel_token.cancel("generation abandoned")
+        executor.shutdown(wait=False)
+
+    print(f"JSON outcomes so far: {get_generation_stats()}")
+    print(f"Cancelled work so far: {get_cancel_stats()}")
+    print(f"Hedged requests so far: {get_hedge_stats()}")
+    print(f"Slot policy so far: {get_slot_stats()}")
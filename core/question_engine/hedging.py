@@ -0,0 +1,167 @@
+'''
+hedging.py: Hedged requests for question generation
+- every claim gets a deadline (CLAIM_DEADLINE)
+- a claim that runs longer than the recent p90 (HEDGE_PERCENTILE) gets a duplicate request
+  on another healthy Ollama host; with no other host there is no hedge, a duplicate on the
+  same saturated box would only compete with the primary for its slots and CPU
+- the first attempt to finish wins, the other one's stream is closed through its CancelToken
+- get_hedge_stats() reports the hedge rate and p50/p99, benchmarks/hedging.py compares p99 with
+  hedging on and off
+'''
+import queue
+import threading
+import time
+from collections import deque
+
+from config.settings import (
+    HEDGE_ENABLED,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_WINDOW,
+    CLAIM_DEADLINE,
+)
+from core.cancellation import CancelToken, Cancelled
+from core.question_engine.classifier import classify_claim
+from core.question_engine.engine import stream_questions
+from core.question_engine.logic import select_slots
+from core.question_engine.llm_utils import get_ollama_pool
+
+
+def percentile(samples, p: float):
+    """Nearest-rank percentile, None for no samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(p * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+class LatencyTracker:
+    """
+    Recent per-claim latencies (what the caller waited, hedged or not) and hedge counters.
+    Hedged claims finish after the hedge delay, so they sit in the tail and the percentile
+    the delay is derived from stays put instead of drifting down as hedging works.
+    """
+
+    def __init__(self, window: int = HEDGE_WINDOW):
+        self._lock = threading.Lock()
+        self.latencies = deque(maxlen=window)
+        self.claims = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.hedges_skipped = 0  # hedge was due but no other healthy host to send it to
+
+    def skipped(self):
+        with self._lock:
+            self.hedges_skipped += 1
+
+    def record(self, latency: float, hedged: bool, hedge_won: bool):
+        with self._lock:
+            self.claims += 1
+            self.hedged += hedged
+            self.hedge_wins += hedge_won
+            self.latencies.append(latency)
+
+    def hedge_delay(self):
+        """Seconds to wait before hedging, None until enough claims have been seen."""
+        with self._lock:
+            if len(self.latencies) < HEDGE_MIN_SAMPLES:
+                return None
+            return percentile(self.latencies, HEDGE_PERCENTILE)
+
+    def stats(self) -> dict:
+        with self._lock:
+            p50 = percentile(self.latencies, 0.5)
+            p99 = percentile(self.latencies, 0.99)
+            return {
+                "claims": self.claims,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedges_skipped": self.hedges_skipped,
+                "hedge_rate": round(self.hedged / self.claims, 3) if self.claims else 0.0,
+                "p50": round(p50, 2) if p50 is not None else None,
+                "p99": round(p99, 2) if p99 is not None else None,
+            }
+
+
+HEDGE_TRACKER = LatencyTracker()
+
+
+def get_hedge_stats() -> dict:
+    return HEDGE_TRACKER.stats()
+
+
+def generate_hedged(
+    claim: str,
+    cancel_token: CancelToken,
+    on_partial=None,
+    tracker: LatencyTracker = HEDGE_TRACKER,
+    hedge: bool = HEDGE_ENABLED,
+) -> dict:
+    """
+    stream_questions() for one claim with a deadline and (if hedge) a hedge. Returns the final result.
+    on_partial(result) receives the first attempt's partial results (the hedge is not
+    streamed, if it wins its final result simply replaces the partial one).
+    Raises Cancelled if cancel_token is cancelled, TimeoutError past CLAIM_DEADLINE.
+    """
+    finished = queue.Queue()
+    slots = select_slots(claim, classify_claim(claim))  # once per claim, not per attempt
+    primary_hosts = []
+    tokens = {}
+
+    def attempt(name, token, **kwargs):
+        try:
+            final = None
+            for result in stream_questions(claim, cancel_token=token, slots=slots, **kwargs):
+                if result["done"]:
+                    final = result
+                elif name == "primary" and on_partial is not None:
+                    on_partial(result)
+            if final is None:
+                raise ValueError("question stream ended without a result")
+            finished.put((name, final, None))
+        except BaseException as e:
+            finished.put((name, None, e))
+
+    def launch(name, **kwargs):
+        tokens[name] = cancel_token.child()
+        threading.Thread(target=attempt, args=(name, tokens[name]), kwargs=kwargs, daemon=True).start()
+
+    start = time.monotonic()
+    deadline = start + CLAIM_DEADLINE
+    hedge_delay = tracker.hedge_delay() if hedge else None
+    launch("primary", on_host=primary_hosts.append)
+    running = 1
+    error = None
+    try:
+        while True:
+            hedge_due = hedge_delay is not None and "hedge" not in tokens
+            wake = min(deadline, start + hedge_delay) if hedge_due else deadline
+            try:
+                name, final, exc = finished.get(timeout=max(0.0, wake - time.monotonic()))
+            except queue.Empty:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Claim not answered within {CLAIM_DEADLINE}s")
+                if not get_ollama_pool().has_alternative(avoid=tuple(primary_hosts)):
+                    tracker.skipped()
+                    hedge_delay = None  # only the primary's host is up, wait for it
+                    continue
+                print(f"Hedging slow claim after {hedge_delay:.1f}s...")
+                launch("hedge", avoid_hosts=tuple(primary_hosts))
+                running += 1
+                continue
+
+            running -= 1
+            if exc is None:
+                elapsed = time.monotonic() - start
+                tracker.record(elapsed, hedged="hedge" in tokens, hedge_won=name == "hedge")
+                return final
+            # keep the most useful error: a real failure beats a Cancelled from the loser
+            if error is None or isinstance(error, Cancelled):
+                error = exc
+            if running == 0:
+                raise error
+    finally:
+        for token in tokens.values():
+            token.cancel("hedge settled")  # no-op for the finished attempt, closes the other stream
+            token.detach()
@@ -0,0 +1,130 @@
+'''
+json_repair.py: Tolerant JSON extraction for local LLM output
+- strips code fences and prose around the payload
+- fixes the usual small-model slips (smart quotes, trailing commas, truncated output)
+- cheaper than re-running a whole generation just because of a stray sentence
+'''
+import json
+import re
+
+_FENCE = re.compile(r"```(?:json)?", re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",\s*([\]}])")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+
+def _balanced_slice(text: str, start: int) -> str:
+    """
+    Walk from the first bracket to its match, string-aware.
+    If the output was cut off, close the open string and brackets instead.
+    """
+    closers = {"[": "]", "{": "}"}
+    stack = []
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in closers:
+            stack.append(closers[ch])
+        elif ch in "]}":
+            if stack and stack[-1] == ch:
+                stack.pop()
+            if not stack:
+                return text[start:i + 1]
+
+    tail = text[start:]
+    if in_string:
+        tail += '"'
+    # a dangling key or comma can't be closed meaningfully, cut back to the last complete value
+    tail = re.sub(r',\s*("[^"]*"\s*:?\s*)?$', "", tail.rstrip())
+    return tail + "".join(reversed(stack))
+
+
+def extract_json(raw_text: str):
+    """
+    Best-effort parse of the JSON payload inside raw LLM text.
+    Raises ValueError if nothing usable can be recovered.
+    """
+    text = _FENCE.sub("", raw_text or "").translate(_SMART_QUOTES)
+    starts = [i for i in (text.find("["), text.find("{")) if i != -1]
+    if not starts:
+        raise ValueError("No JSON payload found in LLM output")
+
+    candidate = _TRAILING_COMMA.sub(r"\1", _balanced_slice(text, min(starts)))
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Could not repair LLM JSON: {e}") from e
+
+
+def as_question_list(payload) -> list:
+    """Coerce whatever shape the model produced into [{level, question}, ...]."""
+    if isinstance(payload, dict):
+        # {"questions": [...]} or a single question object
+        payload = payload.get("questions", [payload])
+    if not isinstance(payload, list):
+        raise ValueError("LLM JSON is not a list of questions")
+    return [
+        {"level": str(q["level"]), "question": str(q["question"])}
+        for q in payload
+        if isinstance(q, dict) and q.get("level") and q.get("question")
+    ]
+
+
+class StreamingObjectParser:
+    """
+    Incremental parser for a streamed JSON array of objects.
+    feed() token text as it arrives; every object that closes directly inside
+    an array is returned right away, long before the array itself is complete.
+    """
+
+    def __init__(self):
+        self._buffer = []
+        self._stack = []
+        self._in_string = False
+        self._escaped = False
+        self._object_start = None
+
+    def feed(self, text: str) -> list:
+        completed = []
+        for ch in text:
+            self._buffer.append(ch)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                if ch == "{" and self._stack and self._stack[-1] == "[":
+                    self._object_start = len(self._buffer) - 1
+                self._stack.append(ch)
+            elif ch in "]}":
+                if self._stack:
+                    self._stack.pop()
+                if ch == "}" and self._object_start is not None and self._stack and self._stack[-1] == "[":
+                    raw = "".join(self._buffer[self._object_start:])
+                    self._object_start = None
+                    try:
+                        completed.append(json.loads(_TRAILING_COMMA.sub(r"\1", raw.translate(_SMART_QUOTES))))
+                    except json.JSONDecodeError:
+                        pass  # malformed item, the full-text repair pass gets another go at it
+        return completed
+
+    @property
+    def text(self) -> str:
+        return "".join(self._buffer)
@@ -1,26 +1,202 @@
-import subprocess
+import os
 import re
+import json
+import threading
+import requests
+from core.singleflight import LLM_FLIGHTS, request_key
+from core.cancellation import Cancelled, check, count_cancelled
+from core.question_engine.ollama_pool import OllamaHostPool, is_host_down
 
 USE_OLLAMA = True
 MODEL_NAME = "qwen2.5:latest"
-
-
-def call_llm(prompt: str) -> str:
+OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+# comma-separated list of inference boxes, e.g. "http://10.0.0.5:11434,http://10.0.0.6:11434"
+OLLAMA_HOSTS = [h.strip() for h in os.getenv("OLLAMA_HOSTS", OLLAMA_HOST).split(",") if h.strip()]
+OLLAMA_PER_HOST_CONCURRENCY = int(os.getenv("OLLAMA_PER_HOST_CONCURRENCY", "3"))
+OLLAMA_TIMEOUT = 300  # seconds, CPU boxes can be slow on long prompts
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # how long a host keeps the model loaded after a request
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_ollama_pool() -> OllamaHostPool:
+    """Process-wide OllamaHostPool, one set of per-host slots for every caller."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            pool = OllamaHostPool(OLLAMA_HOSTS, per_host_concurrency=OLLAMA_PER_HOST_CONCURRENCY)
+            if len(OLLAMA_HOSTS) > 1:
+                pool.check_all()
+            _pool = pool
+        return _pool
+
+
+def warm_model(system: str = None):
+    """
+    Load MODEL_NAME on every healthy host (an empty prompt only loads the model), so the
+    first claim doesn't pay the model load. Returns the URLs that are warm.
+    :param system: also prefill this system prompt (one decoded token), so its KV cache is
+        there before the first claim that starts with it
     """
-    Unified LLM call interface (currently uses Ollama).
+    pool = get_ollama_pool()
+    warm = []
+    for host in pool.hosts:
+        if not host.healthy:
+            continue
+        try:
+            requests.post(
+                f"{host.url}/api/generate",
+                json={"model": MODEL_NAME, "keep_alive": OLLAMA_KEEP_ALIVE},
+                timeout=OLLAMA_TIMEOUT,
+            ).raise_for_status()
+            if system:
+                payload = _payload(".", None, False, system)
+                payload["options"] = {"num_predict": 1}
+                requests.post(f"{host.url}/api/generate", json=payload, timeout=OLLAMA_TIMEOUT).raise_for_status()
+            warm.append(host.url)
+        except requests.RequestException as e:
+            print(f"Could not warm {MODEL_NAME} on {host.url}: {e}")
+    return warm
+
+
+def call_llm(prompt: str, format=None, cancel_token=None, system: str = None) -> str:
+    """
+    Unified LLM call interface (currently uses Ollama's HTTP API).
+    Concurrent calls with the same model/system/prompt/format share one request.
+    :param format: optional JSON schema (or "json") to constrain decoding
+    :param system: system prompt, rendered ahead of the prompt. Keep it identical across
+        calls so the server reuses its KV cache for it and only evaluates the prompt
     """
     if not USE_OLLAMA:
         return ""
 
-    cmd = ["ollama", "run", MODEL_NAME]
-    result = subprocess.run(
-        cmd,
-        input=prompt,
-        capture_output=True,
-        text=True
-    )
+    check(cancel_token)
+    key = request_key("ollama", MODEL_NAME, system, prompt, format)
+    return LLM_FLIGHTS.do(key, lambda: _generate(prompt, format, system))
+
 
-    return result.stdout.strip()
+def chat_llm(messages: list, format=None, options: dict = None, model: str = None) -> dict:
+    """
+    Non-streaming /api/chat call on the host pool, with failover.
+    core.llm_client routes the Groq-backed stages here when LLM_BACKEND="ollama".
+    Returns Ollama's reply (message.content, prompt_eval_count, eval_count, ...).
+    """
+    payload = {
+        "model": model or MODEL_NAME,
+        "messages": messages,
+        "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+    }
+    if format is not None:
+        payload["format"] = format
+    if options:
+        payload["options"] = options
+
+    pool = get_ollama_pool()
+    tried = set()
+    while True:
+        try:
+            with pool.lease(exclude=tried) as host:
+                tried.add(host.url)
+                response = requests.post(f"{host.url}/api/chat", json=payload, timeout=OLLAMA_TIMEOUT)
+                response.raise_for_status()
+                return response.json()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if not is_host_down(e):
+                raise  # busy host, not a dead one: another host would time out the same way
+            print(f"Ollama host failed ({e}), failing over...")
+
+
+def _payload(prompt: str, format, stream: bool, system: str = None) -> dict:
+    payload = {
+        "model": MODEL_NAME,
+        "prompt": prompt,
+        "stream": stream,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+    }
+    if system is not None:
+        payload["system"] = system
+    if format is not None:
+        payload["format"] = format
+    return payload
+
+
+def _generate(prompt: str, format=None, system: str = None) -> str:
+    pool = get_ollama_pool()
+    tried = set()
+    while True:
+        try:
+            with pool.lease(exclude=tried) as host:
+                tried.add(host.url)
+                response = requests.post(
+                    f"{host.url}/api/generate", json=_payload(prompt, format, False, system), timeout=OLLAMA_TIMEOUT
+                )
+                response.raise_for_status()
+                return response.json().get("response", "").strip()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if not is_host_down(e):
+                raise  # busy host, not a dead one: another host would time out the same way
+            print(f"Ollama host failed ({e}), failing over...")  # lease() already marked it down
+
+
+def stream_llm(prompt: str, format=None, cancel_token=None, avoid_hosts=(), on_host=None, system: str = None):
+    """
+    Same as call_llm, but yields text fragments as the model decodes them.
+    Not coalesced, every caller gets its own token stream.
+    Cancelling the token closes the connection, which makes Ollama stop decoding.
+    Fails over to another host if the connection drops before the first token.
+    :param avoid_hosts: host URLs to stay off if another healthy host is free (hedged requests)
+    :param on_host: called with the URL of every host the request is sent to
+    """
+    if not USE_OLLAMA:
+        return
+
+    check(cancel_token)
+    pool = get_ollama_pool()
+    tried = set()
+    while True:
+        started = False
+        finished = False
+        try:
+            with pool.lease(exclude=tried, avoid=avoid_hosts, cancel_token=cancel_token) as host:
+                tried.add(host.url)
+                if on_host is not None:
+                    on_host(host.url)
+                with requests.post(
+                    f"{host.url}/api/generate", json=_payload(prompt, format, True, system), stream=True, timeout=OLLAMA_TIMEOUT
+                ) as response:
+                    response.raise_for_status()
+                    unregister = cancel_token.on_cancel(response.close) if cancel_token is not None else (lambda: None)
+                    try:
+                        for line in response.iter_lines():
+                            if cancel_token is not None and cancel_token.cancelled:
+                                break
+                            if not line:
+                                continue
+                            chunk = json.loads(line)
+                            if chunk.get("response"):
+                                started = True
+                                yield chunk["response"]
+                            if chunk.get("done"):
+                                finished = True
+                                break
+                    except Exception:
+                        # closing the response mid-read surfaces as a connection/decode error
+                        if cancel_token is None or not cancel_token.cancelled:
+                            raise
+                    finally:
+                        unregister()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if started or not is_host_down(e):
+                raise  # tokens already went out (a replay would duplicate them), or the host is only busy
+            print(f"Ollama host failed ({e}), failing over...")
+            continue
+        break
+
+    if not finished and cancel_token is not None and cancel_token.cancelled:
+        count_cancelled("ollama_aborted")
+        raise Cancelled(cancel_token.reason)
 
 
 def rephrase_question(question: str, claim: str, intent: str) -> str:
@@ -1,6 +1,103 @@
 '''
-logic.py: Write the logic to decide what kind of questions to ask
-- vague claim? ask a clarification/basic question to just understand what they know
-- strong claim? ask a probing question
-- decide what to ask based on the chunks retrieved
-'''
\ No newline at end of file
+logic.py: Decide what kind of questions to ask for a claim (the slot policy)
+- vague claim? only clarification / basic questions, to find out what they actually know
+- otherwise the claim type picks the slots: SLOT_POLICY in config/settings.py, e.g. a USAGE
+  claim ("used Terraform") gets no depth_tradeoff, there was no design decision to probe
+- fewer slots = fewer output tokens per claim, the prompt and the JSON schema only ask
+  for the selected slots
+- SLOT_STATS counts what the policy chose, get_slot_stats() reports slots skipped per claim
+'''
+import copy
+import re
+import threading
+from functools import lru_cache
+from typing import get_args
+
+from config import settings
+from core.chunker.skill_extractor import get_skill_matcher
+from core.chunker.taxonomy import SkillMatcher, unknown_terms
+from core.question_engine.schema import SlotLevel
+
+ALL_SLOTS = list(get_args(SlotLevel))
+
+SLOT_STATS = {"claims": 0, "vague": 0, "slots_requested": 0, "slots_skipped": 0, "by_claim_type": {}}
+_stats_lock = threading.Lock()
+
+_WORD = re.compile(r"[\w+#.]+")
+# lowercase even in a Title-Case resume bullet ("Responsible for Backend Development")
+_SMALL_WORDS = {"a", "an", "and", "as", "at", "by", "for", "from", "in", "into", "of", "on", "or", "the", "to", "via", "with"}
+
+
+@lru_cache(maxsize=8)
+def _phrase_pattern(phrases: tuple):
+    # whole words only, and a hyphen counts as part of the word: "computer-assisted" is not "assisted"
+    alternatives = "|".join(re.escape(p) for p in phrases)
+    return re.compile(rf"(?<![\w-])(?:{alternatives})(?![\w-])")
+
+
+def _names_tool(claim: str) -> bool:
+    # a taxonomy skill (Kafka, REST APIs) other than a broad area (machine learning, ML),
+    # or a tech-looking token the taxonomy doesn't know (C++, OpenTelemetry, v2.1)
+    matches = get_skill_matcher().find(claim)
+    if any(canonical not in settings.VAGUE_CLAIM_AREAS for _, _, canonical in matches):
+        return True
+    residual = SkillMatcher.residual_text(claim, matches)
+    if unknown_terms(residual):
+        return True
+    # a capitalised word inside a normal sentence is a name ("the open-source Celery scheduler"),
+    # in a Title-Case bullet every word is capitalised and it says nothing
+    rest = [w for w in _WORD.findall(residual)[1:] if w.lower() not in _SMALL_WORDS]
+    capitalised = [w for w in rest if w[0].isupper()]
+    return 0 < len(capitalised) < len(rest)
+
+
+def looks_vague(claim: str) -> bool:
+    """
+    Local stand-in for llm_utils.is_vague_claim (no LLM call per claim).
+    A claim with a number or a named tool / technology (_names_tool) is concrete. Otherwise it
+    is vague if it uses a filler phrase ("worked on", "responsible for") or is very short.
+    """
+    if any(ch.isdigit() for ch in claim):
+        return False
+    words = _WORD.findall(claim)
+    if _names_tool(claim):
+        return False
+    if settings.VAGUE_CLAIM_PHRASES and _phrase_pattern(tuple(settings.VAGUE_CLAIM_PHRASES)).search(claim.lower()):
+        return True
+    return len(words) <= settings.VAGUE_CLAIM_MAX_WORDS
+
+
+def select_slots(claim: str, claim_type: str) -> list:
+    """
+    Slots to generate for this claim, in schema order. All seven when SLOT_POLICY_ENABLED
+    is off or the claim type has no policy entry.
+    """
+    if not settings.SLOT_POLICY_ENABLED:
+        slots, vague = ALL_SLOTS, False
+    else:
+        vague = looks_vague(claim)
+        chosen = set(settings.VAGUE_CLAIM_SLOTS if vague else settings.SLOT_POLICY.get(claim_type, ALL_SLOTS))
+        slots = [slot for slot in ALL_SLOTS if slot in chosen] or ALL_SLOTS
+    _record(claim_type, len(slots), vague)
+    return slots
+
+
+def _record(claim_type: str, slot_count: int, vague: bool):
+    with _stats_lock:
+        SLOT_STATS["claims"] += 1
+        SLOT_STATS["vague"] += vague
+        SLOT_STATS["slots_requested"] += slot_count
+        SLOT_STATS["slots_skipped"] += len(ALL_SLOTS) - slot_count
+        per_type = SLOT_STATS["by_claim_type"].setdefault(claim_type, {"claims": 0, "slots": 0})
+        per_type["claims"] += 1
+        per_type["slots"] += slot_count
+
+
+def get_slot_stats() -> dict:
+    """SLOT_STATS plus avg_slots and skipped_share (share of slot generations saved vs all seven)."""
+    with _stats_lock:
+        stats = copy.deepcopy(SLOT_STATS)
+    claims = stats["claims"]
+    stats["avg_slots"] = round(stats["slots_requested"] / claims, 2) if claims else None
+    stats["skipped_share"] = round(stats["slots_skipped"] / (claims * len(ALL_SLOTS)), 3) if claims else None
+    return stats
@@ -0,0 +1,151 @@
+'''
+ollama_pool.py: Load-balanced pool of Ollama endpoints for question generation
+- least-outstanding-requests balancing with a per-host concurrency limit
+- health checks (GET /api/tags), unhealthy hosts are skipped and re-probed periodically
+- callers fail over to another host when a connection drops; a read timeout (a long
+  generation on a busy host) is not a dead host and leaves its health alone
+'''
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+from core.cancellation import check
+
+
+class NoHealthyHost(ConnectionError):
+    """Every configured Ollama endpoint is down."""
+
+
+def is_host_down(exc: Exception) -> bool:
+    """
+    True for errors that mean the host is unreachable (refused, reset, connect timeout).
+    A read timeout only means it is busy. requests raises it as ReadTimeout before the
+    response starts and as a ConnectionError wrapping ReadTimeoutError mid-stream.
+    """
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.ConnectionError):
+        return not any(isinstance(arg, ReadTimeoutError) for arg in exc.args)
+    return False
+
+
+class OllamaHost:
+    def __init__(self, url: str, max_concurrency: int):
+        self.url = url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.outstanding = 0
+        self.served = 0
+        self.healthy = True
+        self.checked_at = 0.0
+
+    def __repr__(self):
+        return f"OllamaHost({self.url}, {self.outstanding}/{self.max_concurrency}, healthy={self.healthy})"
+
+
+class OllamaHostPool:
+    def __init__(self, urls, per_host_concurrency: int = 3, health_interval: float = 30.0):
+        if not urls:
+            raise ValueError("OllamaHostPool needs at least one host")
+        self.hosts = [OllamaHost(url, per_host_concurrency) for url in urls]
+        self.health_interval = health_interval
+        self._cond = threading.Condition()
+
+    def check_health(self, host: OllamaHost) -> bool:
+        try:
+            ok = requests.get(f"{host.url}/api/tags", timeout=2).ok
+        except requests.RequestException:
+            ok = False
+        with self._cond:
+            host.healthy = ok
+            host.checked_at = time.monotonic()
+            self._cond.notify_all()
+        return ok
+
+    def check_all(self):
+        """Probe every host in parallel, e.g. once at startup."""
+        threads = [threading.Thread(target=self.check_health, args=(h,), daemon=True) for h in self.hosts]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _reprobe_stale(self):
+        """Give hosts marked down another chance once health_interval has passed."""
+        now = time.monotonic()
+        for host in self.hosts:
+            if not host.healthy and now - host.checked_at >= self.health_interval:
+                host.checked_at = now  # claim the probe so only one thread does it
+                threading.Thread(target=self.check_health, args=(host,), daemon=True).start()
+
+    def has_alternative(self, avoid=()) -> bool:
+        """Is there a healthy host outside `avoid`? (acquire's avoid is only a preference)"""
+        with self._cond:
+            return any(h.healthy and h.url not in avoid for h in self.hosts)
+
+    def capacity(self) -> int:
+        """Concurrent requests the healthy hosts can take, used to size the worker pool."""
+        return sum(h.max_concurrency for h in self.hosts if h.healthy) or self.hosts[0].max_concurrency
+
+    def acquire(self, exclude=(), timeout: float = None, avoid=(), cancel_token=None) -> OllamaHost:
+        """
+        Block until a healthy host has a free slot, preferring the least loaded one.
+        :param exclude: hosts that must not be used (already failed for this request)
+        :param avoid: hosts to skip if any other healthy host exists (e.g. the one a hedged request is stuck on)
+        :param cancel_token: stop waiting for a slot once the token is cancelled
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                check(cancel_token)
+                self._reprobe_stale()
+                candidates = [h for h in self.hosts if h.healthy and h.url not in exclude]
+                if not candidates:
+                    raise NoHealthyHost(f"No healthy Ollama host (excluded: {list(exclude)})")
+                preferred = [h for h in candidates if h.url not in avoid]
+                candidates = preferred or candidates
+                free = [h for h in candidates if h.outstanding < h.max_concurrency]
+                if free:
+                    host = min(free, key=lambda h: (h.outstanding / h.max_concurrency, h.served))
+                    host.outstanding += 1
+                    host.served += 1
+                    return host
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a free Ollama slot")
+                self._cond.wait(min(remaining, 1.0) if remaining is not None else 1.0)
+
+    def release(self, host: OllamaHost, healthy: bool = True):
+        with self._cond:
+            host.outstanding -= 1
+            if not healthy:
+                host.healthy = False
+                host.checked_at = time.monotonic()
+                print(f"⚠️ Ollama host {host.url} marked unhealthy")
+            self._cond.notify_all()
+
+    @contextmanager
+    def lease(self, exclude=(), avoid=(), cancel_token=None):
+        """
+        with pool.lease() as host: ...
+        Connection failures mark the host unhealthy so the caller can fail over, read
+        timeouts propagate without touching its health (is_host_down).
+        """
+        host = self.acquire(exclude, avoid=avoid, cancel_token=cancel_token)
+        healthy = True
+        try:
+            yield host
+        except (requests.ConnectionError, requests.Timeout) as e:
+            healthy = not is_host_down(e)
+            raise
+        finally:
+            self.release(host, healthy)
+
+    def stats(self) -> list:
+        with self._cond:
+            return [
+                {"url": h.url, "healthy": h.healthy, "outstanding": h.outstanding, "served": h.served}
+                for h in self.hosts
+            ]
@@ -0,0 +1,37 @@
+'''
+schema.py: Pydantic models for the question engine's structured LLM output
+- only include JSON schema / dataclasses
+'''
+from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
+
+SlotLevel = Literal[
+    "clarification",
+    "base_overview",
+    "base_dataflow",
+    "depth_tradeoff",
+    "depth_failure",
+    "follow_up_example",
+    "challenge_hypothetical",
+]
+
+class GeneratedQuestion(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    level: SlotLevel = Field(..., description="Slot this question fills")
+    question: str = Field(..., description="The interview question")
+
+
+def question_list_schema(slot_count: int = 7, levels: list = None) -> dict:
+    """
+    JSON schema for the slot list, handed to Ollama's `format` to constrain decoding.
+    levels: restrict "level" to these slots (the ones the slot policy picked).
+    """
+    items = GeneratedQuestion.model_json_schema()
+    if levels:
+        items["properties"]["level"]["enum"] = list(levels)
+    return {
+        "type": "array",
+        "items": items,
+        "minItems": slot_count,
+        "maxItems": slot_count,
+    }
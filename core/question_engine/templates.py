@@ -1,16 +1,57 @@
 '''
-templates.py: Create simple question templates. 
+templates.py: Prompt text for question generation
 - Call this file to generate questions, don't write templates anywhere else
-- example template (this is to be refined further):
-QUESTION_TEMPLATES = {
-    "clarification": {
-        "intent": "validate claim",
-        "structure": "You mentioned {claim}. Can you explain how it works?"
-    },
-    "deep_probe": {
-        "intent": "test depth",
-        "structure": "What design decisions did you make while implementing {claim}?"
-    }
+- the prompt is split so the local server can reuse its KV cache across claims:
+  QUESTION_SYSTEM_PROMPT is fixed (every instruction, every slot) and goes first as the
+  system message, question_user_prompt() is the small per-claim suffix
+- Ollama keeps the cache of the longest matching prompt prefix, so anything that changes per
+  claim (claim text, claim type, the slots logic.select_slots picked) must stay out of
+  QUESTION_SYSTEM_PROMPT, which defines every slot; the suffix names the ones to fill
+'''
+
+# slot level -> what the question in that slot must do, in the order they are asked
+SLOT_INSTRUCTIONS = {
+    "clarification": [
+        "Ask to clarify scope, responsibility, or vague wording",
+        "DO NOT ask about design or decisions",
+    ],
+    "base_overview": ["Ask what was built and how it works at a high level"],
+    "base_dataflow": ["Ask about data flow or system components"],
+    "depth_tradeoff": ["Ask WHY design choices were made and trade-offs"],
+    "depth_failure": ["Ask about failure cases or limitations"],
+    "follow_up_example": ["Ask for a concrete real-world example"],
+    "challenge_hypothetical": ["Introduce a NEW scenario not mentioned in the claim"],
 }
 
-'''
\ No newline at end of file
+
+def _slot_block() -> str:
+    return "\n\n".join(
+        f"{i}. {level}\n" + "\n".join(f"- {line}" for line in lines)
+        for i, (level, lines) in enumerate(SLOT_INSTRUCTIONS.items(), start=1)
+    )
+
+
+QUESTION_SYSTEM_PROMPT = f"""You are a technical interviewer.
+
+You will be given one resume CLAIM, its CLAIM TYPE and the SLOTS to fill.
+Generate interview questions about it with STRICTLY DIFFERENT INTENTS.
+
+You MUST generate exactly ONE question for each slot listed under SLOTS, in that order,
+and NO question for any other slot.
+DO NOT repeat meaning across questions.
+
+Slot definitions and constraints:
+
+{_slot_block()}
+
+Return output STRICTLY as JSON:
+[
+  {{ "level": "...", "question": "..." }}
+]
+"""
+
+
+def question_user_prompt(claim: str, claim_type: str, slots: list = None) -> str:
+    """Per-claim suffix, everything after the cached QUESTION_SYSTEM_PROMPT. slots: all of them if None."""
+    slots = slots or list(SLOT_INSTRUCTIONS)
+    return f"CLAIM:\n{claim}\n\nCLAIM TYPE:\n{claim_type}\n\nSLOTS:\n{', '.join(slots)}\n"
@@ -0,0 +1,238 @@
+'''
+question_bank.py: Searchable bank of every question generated so far (SQLite FTS5, BM25)
+- every finished claim result is indexed as it comes out of the pipeline
+  (pipeline_client._checkpointed), past runs can be backfilled from the artifact store
+- full-text search over the question, its claim and skill, ranked with BM25
+- skill, claim type (classify_claim), slot level and date are plain indexed columns on the
+  questions table, filters without a search text never touch the FTS index
+- the same question (same slot, same wording) is stored once, however many runs produced it
+- searching never calls Ollama, interviewers reuse questions in milliseconds
+
+    python -m core.retrieval.question_bank --reindex          # backfill from data/artifacts.sqlite3
+    python -m core.retrieval.question_bank "kafka consumer lag" --skill Kafka
+'''
+import argparse
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+
+from config import settings
+from core.chunker.skill_index import skill_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    question TEXT NOT NULL,
+    level TEXT NOT NULL,
+    claim TEXT NOT NULL,
+    claim_type TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    skill_id TEXT NOT NULL,
+    run_id TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_skill ON questions(skill_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_questions_claim_type ON questions(claim_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_questions_level ON questions(level, created_at);
+CREATE INDEX IF NOT EXISTS idx_questions_created ON questions(created_at);
+-- external-content FTS index over the questions table, kept in sync by the triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+    question, claim, skill, content='questions', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS questions_ai AFTER INSERT ON questions BEGIN
+    INSERT INTO questions_fts(rowid, question, claim, skill) VALUES (new.id, new.question, new.claim, new.skill);
+END;
+CREATE TRIGGER IF NOT EXISTS questions_ad AFTER DELETE ON questions BEGIN
+    INSERT INTO questions_fts(questions_fts, rowid, question, claim, skill)
+    VALUES ('delete', old.id, old.question, old.claim, old.skill);
+END;
+"""
+
+# bm25() column weights: question text counts most, then the claim it was asked about
+BM25_WEIGHTS = (3.0, 1.0, 1.0)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def fingerprint(level: str, question: str) -> str:
+    normalized = " ".join(_TOKEN.findall(question.lower()))
+    return hashlib.sha256(f"{level}|{normalized}".encode("utf-8")).hexdigest()
+
+
+def match_expression(query: str) -> str:
+    """
+    Free text -> FTS5 MATCH expression: every word quoted (no FTS syntax errors from user
+    input), OR-ed so BM25 ranks partial matches, the last word as a prefix for search-as-you-type.
+    """
+    tokens = _TOKEN.findall(query.lower())
+    if not tokens:
+        return ""
+    terms = [f'"{t}"' for t in tokens[:-1]] + [f'"{tokens[-1]}"*']
+    return " OR ".join(terms)
+
+
+def _timestamp(since) -> float:
+    if isinstance(since, datetime):
+        return since.timestamp()
+    if isinstance(since, date):
+        return datetime(since.year, since.month, since.day).timestamp()
+    return float(since)
+
+
+class QuestionBank:
+    def __init__(self, db_path: str = settings.QUESTION_BANK_PATH):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # one short-lived connection per operation, same as core/jobs/store.py
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def add_result(self, result: dict, skill: str, run_id: str = "") -> int:
+        """Index one finished claim result from the generator. Returns the number of new questions."""
+        now = time.time()
+        rows = [
+            (
+                fingerprint(q.get("level", ""), q["question"]), q["question"], q.get("level", ""),
+                result.get("claim", ""), result.get("claim_type", ""), skill, skill_id(skill), run_id or "", now,
+            )
+            for q in result.get("questions", []) if q.get("question")
+        ]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cur = conn.executemany(
+                "INSERT OR IGNORE INTO questions "
+                "(fingerprint, question, level, claim, claim_type, skill, skill_id, run_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        return cur.rowcount
+
+    def add_questions(self, groups: list, run_id: str = "") -> int:
+        """Index a whole run: [{"focus_skill", "results": [...]}], as stored in the artifact store."""
+        return sum(
+            self.add_result(result, group.get("focus_skill", ""), run_id)
+            for group in groups or [] for result in group.get("results", [])
+        )
+
+    def search(self, query: str = "", skill: str = None, claim_type: str = None, level: str = None,
+               since=None, limit: int = 20) -> list:
+        """
+        Best-matching questions first (BM25), or newest first for an empty query.
+        skill matches any spelling of the skill (skill_id), since is a date, datetime or timestamp.
+        Returns dicts with question, level, claim, claim_type, skill, run_id, created_at and score.
+        """
+        filters, params = [], []
+        if skill:
+            filters.append("q.skill_id = ?")
+            params.append(skill_id(skill))
+        if claim_type:
+            filters.append("q.claim_type = ?")
+            params.append(claim_type)
+        if level:
+            filters.append("q.level = ?")
+            params.append(level)
+        if since is not None:
+            filters.append("q.created_at >= ?")
+            params.append(_timestamp(since))
+
+        expression = match_expression(query or "")
+        columns = "q.question, q.level, q.claim, q.claim_type, q.skill, q.run_id, q.created_at"
+        if expression:
+            sql = (
+                f"SELECT {columns}, bm25(questions_fts, {', '.join(map(str, BM25_WEIGHTS))}) AS score "
+                "FROM questions_fts JOIN questions q ON q.id = questions_fts.rowid "
+                f"WHERE questions_fts MATCH ? {''.join(' AND ' + f for f in filters)} "
+                "ORDER BY score LIMIT ?"
+            )
+            params = [expression] + params
+        else:
+            sql = (
+                f"SELECT {columns}, 0.0 AS score FROM questions q "
+                f"{'WHERE ' + ' AND '.join(filters) if filters else ''} "
+                "ORDER BY q.created_at DESC LIMIT ?"
+            )
+        with self._connect() as conn:
+            rows = conn.execute(sql, params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def facets(self) -> dict:
+        """Values to offer as filters: {"skills", "claim_types", "levels"}."""
+        with self._connect() as conn:
+            # GROUP BY the indexed columns, one index walk each instead of a table scan
+            skills = [r[0] for r in conn.execute("SELECT MIN(skill) FROM questions GROUP BY skill_id")]
+            claim_types = [r[0] for r in conn.execute("SELECT claim_type FROM questions GROUP BY claim_type")]
+            levels = [r[0] for r in conn.execute("SELECT level FROM questions GROUP BY level")]
+        return {"skills": sorted(skills, key=str.lower), "claim_types": claim_types, "levels": levels}
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> QuestionBank:
+    """Process-wide QuestionBank (the schema is created once, connections are per call)."""
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            _bank = QuestionBank()
+        return _bank
+
+
+def index_result(result: dict, skill: str, run_id: str = ""):
+    """Hook for the pipeline: index one finished claim, never fail the docket over the side index."""
+    try:
+        get_question_bank().add_result(result, skill, run_id)
+    except Exception as e:
+        print(f"Question bank indexing failed for run {run_id}: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", nargs="?", default="")
+    parser.add_argument("--skill")
+    parser.add_argument("--claim-type")
+    parser.add_argument("--level")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--reindex", action="store_true", help="index every run in the artifact store")
+    args = parser.parse_args()
+
+    bank = get_question_bank()
+    if args.reindex:
+        from core.artifacts import get_artifact_store
+
+        added = sum(bank.add_questions(a["data"], a["run_id"]) for a in get_artifact_store().iter("questions"))
+        print(f"indexed {added} new question(s), {bank.count()} in the bank")
+        return
+
+    started = time.perf_counter()
+    results = bank.search(args.query, skill=args.skill, claim_type=args.claim_type, level=args.level, limit=args.limit)
+    print(f"{len(results)} result(s) in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for r in results:
+        print(f"[{r['skill']} / {r['claim_type']} / {r['level']}] {r['question']}")
+
+
+if __name__ == "__main__":
+    main()
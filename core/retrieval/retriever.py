@@ -1,6 +1,13 @@
 '''
 retriever.py: Strips chunk metadata and prepares data for question_engine
+- select_claims prunes chunks down to the claims worth generating questions for
+- bucket_priorities / claim_priority order claims so CORE skills get generated first
 '''
+from config.settings import CLAIMS_MIN_RELEVANCE, CLAIMS_TOP_K_PER_SKILL, CLAIMS_MAX_TOTAL
+from core.chunker.skill_index import skill_id
+
+# lower runs first, skills the bucketing didn't place sit between CORE and PREFERRED
+PRIORITY_RANK = {"CORE": 0, None: 1, "PREFERRED": 2}
 
 
 def strip_chunks(chunks: list) -> None:
@@ -20,4 +27,81 @@ def strip_chunks(chunks: list) -> None:
                 for c in chunk.get("claims", [])
             ]
         })
-    return stripped
\ No newline at end of file
+    return stripped
+
+
+def section_rank(source_section: str) -> int:
+    """Same pedigree order as Scorer.calculate_atomic_score: experience > project > skills."""
+    section = (source_section or "").lower()
+    if "experience" in section or "intern" in section:
+        return 2
+    if "project" in section:
+        return 1
+    return 0
+
+
+def relevance_score(claim: dict):
+    """Chunker relevance (1-10), or None for chunks that never went through the chunker."""
+    return (claim.get("relevance_analysis") or {}).get("score")
+
+
+def claim_rank(claim: dict) -> tuple:
+    return (relevance_score(claim) or 0, section_rank(claim.get("source_section", "")))
+
+
+def select_claims(
+    chunks: list,
+    top_k: int = CLAIMS_TOP_K_PER_SKILL,
+    max_claims: int = CLAIMS_MAX_TOTAL,
+    min_relevance: int = CLAIMS_MIN_RELEVANCE,
+) -> list:
+    """
+    Keep the top_k claims per skill (by relevance, then section), capped at max_claims overall.
+    The global cap is filled round by round, so every skill gets its best claim
+    before any skill gets its second one.
+    Returns chunk dicts in the same shape, minus the pruned claims (empty chunks are dropped).
+    """
+    ranked = []
+    total_in = 0
+    for chunk in chunks:
+        claims = chunk.get("claims", [])
+        total_in += len(claims)
+        kept = [
+            c for c in claims
+            if c.get("claim_text")
+            and (relevance_score(c) is None or not min_relevance or relevance_score(c) >= min_relevance)
+        ]
+        kept.sort(key=claim_rank, reverse=True)
+        ranked.append(kept[:top_k] if top_k else kept)
+
+    selected = [[] for _ in ranked]
+    budget = max_claims or sum(len(r) for r in ranked)
+    depth = 0
+    while budget > 0 and any(depth < len(r) for r in ranked):
+        round_claims = [(claim_rank(r[depth]), i) for i, r in enumerate(ranked) if depth < len(r)]
+        round_claims.sort(key=lambda x: x[0], reverse=True)
+        for _, i in round_claims[:budget]:
+            selected[i].append(ranked[i][depth])
+        budget -= min(budget, len(round_claims))
+        depth += 1
+
+    output = [dict(chunk, claims=kept) for chunk, kept in zip(chunks, selected) if kept]
+    print(f"Selected {sum(len(c['claims']) for c in output)}/{total_in} claims across {len(output)} skills")
+    return output
+
+
+def bucket_priorities(bucket_schema) -> dict:
+    """skill_id -> "CORE"/"PREFERRED", a skill in both kinds of bucket counts as CORE."""
+    priorities = {}
+    for bucket in bucket_schema or []:
+        for skill in bucket.skills:
+            sid = skill_id(skill)
+            if priorities.get(sid) != "CORE":
+                priorities[sid] = bucket.priority
+    return priorities
+
+
+def claim_priority(skill: str, claim: dict, priorities: dict) -> tuple:
+    """Sort key (ascending): CORE first, then higher relevance, then stronger source section."""
+    relevance, section = claim_rank(claim)
+    return (PRIORITY_RANK[priorities.get(skill_id(skill))], -relevance, -section)
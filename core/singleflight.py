@@ -0,0 +1,61 @@
+'''
+singleflight.py: Coalesce identical in-flight LLM requests
+- concurrent callers with the same (model, prompt, params) key share one call
+- the first caller runs it, the rest block and receive the same result (or exception)
+- nothing is cached once the call returns, this only removes duplicate concurrent load
+'''
+import hashlib
+import json
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: str, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.stats["calls"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+def request_key(*parts) -> str:
+    """Stable hash of everything that determines an LLM response."""
+    blob = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# one group per process, shared by the Groq and Ollama call sites
+LLM_FLIGHTS = SingleFlight()
@@ -1,7 +1,7 @@
+import html
+
 import streamlit as st
-from datetime import datetime
-from pathlib import Path
-import plotly.graph_objects as go
+from core.artifacts import get_artifact_store
 
 def header():
     st.markdown("""
@@ -68,6 +68,13 @@ def upload_jd():
     )'''
 
 
+def fresh_toggle():
+    return st.checkbox(
+        "Regenerate from scratch",
+        help="Ignore saved progress for this resume + JD and run every stage again.",
+    )
+
+
 def generate_button():
     return st.button("🚀 GENERATE INTERVIEW DOCKET")
 
@@ -76,22 +83,12 @@ def show_resume_json(resume_json):
     with st.expander("🔍 Debug: View Parsed Resume Data"):
         st.json(resume_json)
 
-def save_jd_to_dir(jd_text: str) -> str:
+def save_jd(jd_text: str) -> str:
     """
-    Save JD to data/jd/ with timestamp in filename.
-    Returns the file path.
+    Save the JD to the artifact store (core/artifacts.py).
+    Saving the same JD again only marks it as the latest. Returns its content hash.
     """
-    jd_dir = Path("data/jd")
-    jd_dir.mkdir(parents=True, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"jd_{timestamp}.txt"
-    filepath = jd_dir / filename
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(jd_text)
-    
-    return str(filepath)
+    return get_artifact_store().put("jd", jd_text)
 
 def show_questions(chunks_output):
     """
@@ -137,6 +134,45 @@ def show_questions(chunks_output):
                 st.markdown("---")
 
 
+def show_question_bank():
+    """
+    Search box over every question generated for earlier candidates (BM25, no LLM call).
+    """
+    # sqlite FTS + the skill taxonomy, only loaded once the page is up
+    from core.retrieval.question_bank import get_question_bank
+
+    bank = get_question_bank()
+    with st.expander("📚 Question Bank: reuse questions from earlier dockets"):
+        query = st.text_input("Search questions", placeholder="e.g. kafka consumer lag", key="bank_query")
+        facets = bank.facets()
+        col1, col2, col3, col4 = st.columns(4)
+        skill = col1.selectbox("Skill", ["Any"] + facets["skills"], key="bank_skill")
+        claim_type = col2.selectbox("Claim type", ["Any"] + facets["claim_types"], key="bank_claim_type")
+        level = col3.selectbox("Slot", ["Any"] + facets["levels"], key="bank_level",
+                               format_func=lambda l: l.replace("_", " ").title())
+        since = col4.date_input("Since", value=None, key="bank_since")
+
+        results = bank.search(
+            query,
+            skill=None if skill == "Any" else skill,
+            claim_type=None if claim_type == "Any" else claim_type,
+            level=None if level == "Any" else level,
+            since=since,
+        )
+        if not results:
+            st.caption("No matching questions yet." if bank.count() else "The bank fills up as dockets are generated.")
+        for r in results:
+            # claims come from other candidates' resumes, never hand them to the browser as markup
+            e = {k: html.escape(str(v)) for k, v in r.items()}
+            st.markdown(f"""
+            <div class="question-card">
+                <small style="color: #666; font-weight: bold; text-transform: uppercase;">{e["level"].replace("_", " ")} · {e["skill"]} · {e["claim_type"]}</small><br>
+                {e["question"]}<br>
+                <small style="color: #888;"><em>Asked about: "{e["claim"]}"</em></small>
+            </div>
+            """, unsafe_allow_html=True)
+
+
 def ethics_banner():
     st.markdown("---")
     st.caption(
@@ -156,6 +192,8 @@ def render_radar_chart(candidate_scores, jd_expectations):
         st.info("No data for Radar Chart.")
         return
 
+    import plotly.graph_objects as go  # imported on first chart, keeps it off the first page render
+
     categories = list(candidate_scores.keys())
     candidate_values = [candidate_scores[cat] for cat in categories]
     expectation_values = [jd_expectations[cat] for cat in categories]
@@ -1,6 +1,10 @@
+import requests
 import streamlit as st
 from ui import components as c
-from core.pipeline_client import parse_resume_api, generate_questions_local, run_audit_pipeline
+from core.jobs.client import service_available, submit_docket_job, poll_events, cancel_job
+from core.cancellation import CancelToken
+from core.precompute import get_precomputer
+from config.settings import PRECOMPUTE_ENABLED
 
 
 def render_app():
@@ -16,15 +20,25 @@ def render_app():
         # interview_stage = c.stage_selector()
         
         st.divider()
+        fresh = c.fresh_toggle()
         generate_btn = c.generate_button()
         
         st.markdown("---")
         st.info("Input a Resume and JD to generate a custom interview script.")
 
+    # Start parsing / JD analysis / chunking in the background while the inputs settle
+    if PRECOMPUTE_ENABLED:
+        precompute = get_precomputer()
+        precompute.warm()  # once per process, later calls reuse the first warm-up
+        precompute.observe(st.session_state.precompute_key, resume_file, jd_text)
+
     # Main Area
     if generate_btn:
         #start_generation(resume_file, jd_text, interview_stage)
-        start_generation(resume_file, jd_text)
+        start_generation(resume_file, jd_text, fresh)
+    elif st.query_params.get("job"):
+        # a job service run is still in flight (rerun or browser refresh), pick it back up
+        follow_job(st.query_params["job"])
 
     # Persistent Display Logic
     # We use Tabs for better organization
@@ -66,12 +80,35 @@ def render_app():
         **RAG Interview Docket** helps you prepare for technical interviews by analyzing resumes against job descriptions.
         
         **To get started:**
-        1. Upload a Candidate's Resume (PDF) in the sidebar.
+        1. Upload a Candidate's Resume (PDF or DOCX) in the sidebar.
         2. Paste the Job Description.
         3. Click **Generate**.
         """)
 
-def start_generation(resume_file, jd_text):
+    c.show_question_bank()
+
+def _merge_result(results_map, claim_slots, chunk_id, skill, result):
+    """Add a (possibly partial) claim result, replacing any earlier version of the same claim."""
+    if chunk_id not in results_map:
+        results_map[chunk_id] = {
+            "focus_skill": skill,
+            "results": []
+        }
+    chunk_results = results_map[chunk_id]["results"]
+    claim_id = result.get("claim_id")
+    if claim_id in claim_slots:
+        chunk_results[claim_slots[claim_id]] = result
+    else:
+        claim_slots[claim_id] = len(chunk_results)
+        chunk_results.append(result)
+
+
+def start_generation(resume_file, jd_text, fresh=False):
+    # the pipeline pulls in groq/pdfplumber/pydantic schemas, import it on first use
+    # (the precompute has usually loaded it in the background by now)
+    from core.pipeline_client import parse_resume_api, generate_questions_local, run_audit_pipeline, run_id_for
+    from core.export import export_finished_run
+
     if not resume_file:
         st.sidebar.error("Please upload a resume file.")
         return
@@ -80,13 +117,36 @@ def start_generation(resume_file, jd_text):
         st.sidebar.error("Please paste the Job Description (JD).")
         return
 
+    if PRECOMPUTE_ENABLED:
+        # the docket is submitted, the session's sidebar inputs don't need to be held any more
+        get_precomputer().forget(st.session_state.precompute_key)
+
+    # A new Generate click supersedes whatever this session still has running
+    if st.session_state.get("run_token") is not None:
+        st.session_state.run_token.cancel("superseded by a new run")
+    run_token = CancelToken()
+    st.session_state.run_token = run_token
+    if st.query_params.get("job"):
+        cancel_job(st.query_params["job"])
+
+    # Hand the whole docket to the job service if one is running, so reruns don't kill it
+    if service_available():
+        c.save_jd(jd_text)
+        job_id = submit_docket_job(resume_file, jd_text, fresh)
+        st.query_params["job"] = job_id
+        follow_job(job_id)
+        return
+
     # Phase 1: Preparation
     with st.status("Phase 1: Analyzing Documents...", expanded=True) as status:
         st.write("📂 Saving Job Description...")
-        c.save_jd_to_dir(jd_text)
+        c.save_jd(jd_text)
         
         st.write("📄 Parsing Resume...")
-        resume_json = parse_resume_api(resume_file)
+        if PRECOMPUTE_ENABLED:
+            resume_json = get_precomputer().resume(resume_file).result()  # usually parsed on upload
+        else:
+            resume_json = parse_resume_api(resume_file)
         
         if resume_json is None:
             status.update(label="Resume Parsing Failed", state="error")
@@ -101,32 +161,33 @@ def start_generation(resume_file, jd_text):
     progress_exec = st.progress(0, text="Initializing AI...")
     questions_placeholder = st.empty()
     results_map = {}
+    claim_slots = {}  # claim_id -> index in its chunk's results, partial results get replaced in place
     
-    questions_generator = generate_questions_local(resume_json, jd_text)
+    questions_generator = generate_questions_local(resume_json, jd_text, cancel_token=run_token, fresh=fresh)
     
     if questions_generator:
         with questions_placeholder.container():
              st.info("Starting Generation Engine...")
 
-        for chunk_id, skill, result, current, total in questions_generator:
-            # Update Progress
-            percent = int((current / total) * 100)
-            progress_exec.progress(percent, text=f"Generating: {skill} ({current}/{total})")
-            
-            # Aggregate Results
-            if chunk_id not in results_map:
-                results_map[chunk_id] = {
-                    "focus_skill": skill,
-                    "results": []
-                }
-            results_map[chunk_id]["results"].append(result)
-            
-            # Update Session & Render
-            st.session_state.questions = list(results_map.values())
-            
-            # Render Preview
-            with questions_placeholder.container():
-                 c.show_questions(st.session_state.questions)
+        try:
+            for chunk_id, skill, result, current, total in questions_generator:
+                # Update Progress
+                percent = int((current / total) * 100)
+                progress_exec.progress(percent, text=f"Generating: {skill} ({current}/{total})")
+                
+                # Aggregate Results
+                _merge_result(results_map, claim_slots, chunk_id, skill, result)
+                
+                # Update Session & Render
+                st.session_state.questions = list(results_map.values())
+                
+                # Render Preview
+                with questions_placeholder.container():
+                     c.show_questions(st.session_state.questions)
+        except BaseException:
+            # Streamlit stops the script on rerun / closed tab, don't leave Ollama work behind
+            run_token.cancel("generation interrupted")
+            raise
 
         # Phase 3: Grounded Audit (After generation loop)
         with st.status("Phase 3: Running Grounded Audit...", expanded=True) as status:
@@ -145,7 +206,9 @@ def start_generation(resume_file, jd_text):
                     'claims': chunk_claims
                 })
 
-            audit_data = run_audit_pipeline(chunks_list, jd_text)
+            run_id = run_id_for(resume_json, jd_text)
+            audit_data = run_audit_pipeline(chunks_list, jd_text, cancel_token=run_token, run_id=run_id)
+            export_finished_run(run_id, resume_json.get("resume_id", ""))
             
             if audit_data:
                  st.session_state.audit_data = audit_data
@@ -159,3 +222,63 @@ def start_generation(resume_file, jd_text):
         st.rerun() # Force rerun to show final tabs
     else:
         st.error("Question generation failed.")
+
+
+def follow_job(job_id):
+    """
+    Thin-client view of a job service run: replay the job's event log from the start,
+    then long-poll for new events until the job finishes.
+    """
+    progress_exec = st.progress(0, text="Waiting for job service...")
+    questions_placeholder = st.empty()
+    results_map = {}
+    claim_slots = {}
+    after = 0
+
+    while True:
+        try:
+            batch = poll_events(job_id, after)
+        except requests.RequestException as e:
+            # stale ?job= (service restarted with a fresh DB -> 404) or the service is down:
+            # drop the param so the next rerun shows the normal page again
+            st.error(f"Lost track of job {job_id}: {e}")
+            del st.query_params["job"]
+            return
+        for event in batch["events"]:
+            after = event["seq"]
+            kind, data = event["kind"], event["data"]
+            if kind == "requeued":
+                # the service restarted mid-job and runs it again from scratch
+                results_map.clear()
+                claim_slots.clear()
+                st.session_state.questions = []
+                questions_placeholder.empty()
+                progress_exec.progress(0, text="Job service restarted, running the job again...")
+            elif kind == "stage":
+                progress_exec.progress(0, text=data["label"])
+            elif kind == "resume":
+                st.session_state.resume_json = data
+            elif kind == "question":
+                percent = int((data["current"] / data["total"]) * 100) if data["total"] else 0
+                progress_exec.progress(percent, text=f"Generating: {data['skill']} ({data['current']}/{data['total']})")
+                _merge_result(results_map, claim_slots, data["chunk_id"], data["skill"], data["result"])
+                st.session_state.questions = list(results_map.values())
+                with questions_placeholder.container():
+                    c.show_questions(st.session_state.questions)
+            elif kind == "audit" and data:
+                st.session_state.audit_data = data
+            elif kind == "error":
+                st.error(f"Job failed: {data.get('message')}")
+
+        if batch["status"] in ("done", "failed", "cancelled") and not batch["events"]:
+            break
+
+    del st.query_params["job"]
+    if batch["status"] != "done":
+        progress_exec.progress(100, text=f"Job {batch['status']}")
+        return
+
+    progress_exec.progress(100, text="Generation Complete!")
+    questions_placeholder.empty()
+    st.balloons()
+    st.rerun()
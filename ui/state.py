@@ -1,3 +1,4 @@
+import uuid
 import streamlit as st
 
 def init_state():
@@ -11,5 +12,11 @@ def init_state():
     if "jd_text" not in st.session_state:
         st.session_state.jd_text = ""
 
+    if "run_token" not in st.session_state:
+        st.session_state.run_token = None  # CancelToken of this session's in-flight run
+
+    if "precompute_key" not in st.session_state:
+        st.session_state.precompute_key = uuid.uuid4().hex  # identifies this session's inputs to core/precompute.py
+
     if "interview_stage" not in st.session_state:
         st.session_state.interview_stage = "Screening"